@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""
+Einstieg für beide Apps in einem Streamlit-Server:
+
+    streamlit run Ausbildung.py
+
+Die Seiten sind die bisherigen Skripte (`Ausbildung_Büro.py`,
+`Ausbildung_Metall.py`, weiterhin auch einzeln startbar). Eine Seite und ihre
+Module werden erst beim ersten Besuch importiert; Kataloge, Vorlagen,
+Text-Cache und Entwurfsablage existieren danach einmal je Prozess und werden
+von beiden Seiten und allen Sessions geteilt.
+"""
+import streamlit as st
+
+from ausbildung import autosave
+
+st.set_page_config(page_title="Ausbildung", page_icon="🧰", layout="wide")
+
+seite = st.navigation([
+    st.Page("Ausbildung_Büro.py", title="Büromanagement", icon="🗂️", url_path="buero", default=True),
+    st.Page("Ausbildung_Metall.py", title="Metall-Promptbuilder", icon="🛠️", url_path="metall"),
+])
+autosave.seitenwechsel()
+seite.run()
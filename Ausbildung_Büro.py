@@ -1,10 +1,20 @@
 # -*- coding: utf-8 -*-
+from dataclasses import replace
 from datetime import datetime, date, timedelta
-import textwrap
-import html
-import json
 import streamlit as st
-import streamlit.components.v1 as components
+
+from ausbildung import autosave, instrumentation
+from ausbildung.auswahl import mit_freitext
+from ausbildung.clipboard import copy_button
+from ausbildung.eintraege import kombiniere
+from ausbildung.entwuerfe import ablage, iso_woche
+from ausbildung.engine import (
+    GENERATOREN, MODI, BueroEingabe, berichtswochen, erzeuge,
+)
+from ausbildung.export import FORMATE, Dokument, zip_datei
+from ausbildung.kalender import LAENDER, WOCHENTAGE, Kalender, wochenbeschreibung
+from ausbildung.katalog import katalog
+from ausbildung.versand import ki_antwort
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Seiteneinstellungen
@@ -16,85 +26,11 @@ st.set_page_config(
 )
 st.title("🗂️ Ausbildung · Kaufmann/-frau für Büromanagement")
 st.caption("Hinweis: Keine personenbezogenen oder internen Unternehmensdaten eingeben.")
+instrumentation.beginne("buero")
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Hilfsfunktionen
 # ────────────────────────────────────────────────────────────────────────────────
-def combo_field(label: str, suggestions: list[str], key_text: str, key_multiselect: str):
-    st.markdown(f"**{label}**")
-    chosen = st.multiselect(
-        f"{label} · Vorschläge (Mehrfachauswahl möglich)",
-        options=suggestions,
-        key=key_multiselect
-    )
-    free = st.text_area(
-        f"{label} · Eigene Eingaben (eine pro Zeile)",
-        key=key_text,
-        height=100,
-        placeholder="Eigene Punkte je Zeile hinzufügen …"
-    )
-    own = [x.strip("- ").strip() for x in free.splitlines() if x.strip()]
-    return [*chosen, *own]
-
-def bullet(lines: list[str]) -> str:
-    return "\n".join([f"- {x}" for x in lines if x.strip()])
-
-def section(title: str) -> str:
-    return f"\n## {title}\n"
-
-def daterange_str(d1: date, d2: date) -> str:
-    if d1 == d2:
-        return d1.strftime("%d.%m.%Y")
-    return f"{d1.strftime('%d.%m.%Y')} – {d2.strftime('%d.%m.%Y')}"
-
-def copy_button(text: str, key: str, label: str = "📋 In Zwischenablage"):
-    """
-    Robuster Copy-Button via components.html.
-    Nutzt navigator.clipboard; fällt bei restriktiven Browsern auf Auswahl+Copy zurück.
-    """
-    # Für JS sicher serialisieren
-    js_payload = json.dumps(text)
-    btn_id = f"copybtn_{key}"
-    html_code = f"""
-    <div style="display:flex;gap:.5rem;align-items:center;">
-      <button id="{btn_id}" style="padding:.5rem .75rem;border:1px solid #ddd;border-radius:.5rem;cursor:pointer;">
-        {html.escape(label)}
-      </button>
-      <span id="{btn_id}_status" style="font-size:.9rem;color:#666;"></span>
-    </div>
-    <script>
-      (function(){{
-        const btn = document.getElementById("{btn_id}");
-        const status = document.getElementById("{btn_id}_status");
-        const text = {js_payload};
-        async function copyText() {{
-          try {{
-            if (navigator.clipboard && window.isSecureContext) {{
-              await navigator.clipboard.writeText(text);
-            }} else {{
-              const ta = document.createElement("textarea");
-              ta.value = text;
-              ta.style.position = "fixed";
-              ta.style.left = "-9999px";
-              document.body.appendChild(ta);
-              ta.focus();
-              ta.select();
-              document.execCommand("copy");
-              document.body.removeChild(ta);
-            }}
-            status.textContent = "Kopiert!";
-            setTimeout(()=>{{status.textContent="";}}, 2000);
-          }} catch(e) {{
-            status.textContent = "Kopieren fehlgeschlagen";
-            setTimeout(()=>{{status.textContent="";}}, 3000);
-          }}
-        }}
-        btn.addEventListener("click", copyText);
-      }})();
-    </script>
-    """
-    components.html(html_code, height=40)
-
 def dl_button(label: str, txt: str, filename: str):
     st.download_button(
         label=label,
@@ -103,23 +39,33 @@ def dl_button(label: str, txt: str, filename: str):
         mime="text/plain"
     )
 
+# Widget-Schlüssel, die als Entwurf je Kürzel und Kalenderwoche gespeichert werden
+ENTWURF_FELDER = (
+    "modus", "zeitraum", "land", "schultage",
+    "lf_multi", "lf_text", "bv_multi", "bv_text", "task_multi", "task_text", "tools_multi", "tools_text",
+    "skills_multi", "skills_text", "proof_multi", "proof_text", "school_multi", "school_text",
+)
+
 # ────────────────────────────────────────────────────────────────────────────────
-# Sidebar: Modus & Zeitraum (von–bis)
+# Sidebar: Entwürfe, Modus & Zeitraum (von–bis)
 # ────────────────────────────────────────────────────────────────────────────────
-with st.sidebar:
+with instrumentation.phase("sidebar"), st.sidebar:
     st.header("⚙️ Einstellungen")
+    autosave.seitenleiste("buero", ENTWURF_FELDER)
     modus = st.radio(
         "Modus",
-        options=["Ausbildung (Büromanagement)", "Berufsvorbereitung"],
-        index=0
+        options=MODI,
+        index=0,
+        key="modus",
     )
 
-    # Standard-Zeitraum: Montag dieser Woche bis heute
+    # Standard-Zeitraum: Montag dieser Woche bis heute (oder aus dem Entwurf)
     today = date.today()
     monday = today - timedelta(days=today.weekday())
+    st.session_state.setdefault("zeitraum", (monday, today))
     date_from, date_to = st.date_input(
         "Zeitraum (von – bis)",
-        value=(monday, today),
+        key="zeitraum",
         format="DD.MM.YYYY"
     )
     # Abfangen einzelner Auswahl
@@ -129,217 +75,192 @@ with st.sidebar:
         date_to = today
     if date_from > date_to:
         st.error("Das Startdatum liegt nach dem Enddatum. Bitte korrigieren.")
+
+    # Feiertage & Berufsschultage: Wochenübersicht des Zeitraums (ausbildung.kalender)
+    with st.expander("📅 Kalender (Bundesland & Berufsschule)"):
+        st.session_state.setdefault("land", "NW")
+        land = st.selectbox("Bundesland (Feiertage)", list(LAENDER), format_func=LAENDER.get, key="land")
+        schultage = st.multiselect("Berufsschultage", list(range(5)), format_func=WOCHENTAGE.__getitem__, key="schultage")
+    if date_from <= date_to:
+        kalender = Kalender(date_from, date_to, land, schultage)
+        for w in list(kalender.wochen())[:6]:
+            st.caption(f"KW {w.kw} ({w.von:%d.%m.} – {w.bis:%d.%m.}): {wochenbeschreibung(w, kalender)}")
     st.markdown("---")
     st.markdown("**Export**: Unten Berichtsheft/Arbeitsauftrag/Prüfungsübungen generieren. Kopieren oder als TXT speichern.")
 
 # ────────────────────────────────────────────────────────────────────────────────
-# Vorschlagslisten
-# ────────────────────────────────────────────────────────────────────────────────
-LERNFELDER_BUERO = [
-    "LF 1 Die eigene Rolle im Betrieb mitgestalten",
-    "LF 2 Büroprozesse und Arbeitsorganisation",
-    "LF 3 Informationsmanagement & Kommunikation",
-    "LF 4 Auftragsbearbeitung & Beschaffung",
-    "LF 5 Kundenorientierte Auftragsabwicklung",
-    "LF 6 Personalwirtschaftliche Aufgaben unterstützen",
-    "LF 7 Kaufmännische Steuerung & Kontrolle",
-    "LF 8 Marketing & Veranstaltungsorganisation",
-    "LF 9 Projekt- und Prozessmanagement",
-    "LF 10 Qualitätsmanagement & Dokumentation",
-]
-
-TAETIGKEITEN = [
-    "Posteingang/-ausgang bearbeiten",
-    "Telefonate & Terminmanagement",
-    "E-Mail-Korrespondenz",
-    "Protokolle/Notizen erstellen",
-    "Bestellungen/Angebote vergleichen",
-    "Rechnungsprüfung/Vorkontierung",
-    "Ablage/Dokumentenmanagement",
-    "Datenpflege (CRM/Listen)",
-    "Vorbereitung Besprechungen/Events",
-    "Reisekosten vorbereiten/prüfen",
-]
-
-TOOLS = [
-    "MS Word", "MS Excel", "MS PowerPoint", "MS Outlook", "MS Teams",
-    "SharePoint/OneDrive", "SAP/ERP (allgemein)", "DATEV (allgemein)", "CRM-Tool (allgemein)",
-]
-
-KOMPETENZEN = [
-    "Kommunikation (intern/extern)",
-    "Selbstorganisation & Priorisierung",
-    "Sorgfalt/Genauigkeit",
-    "Kaufmännisches Grundverständnis",
-    "Digitale Zusammenarbeit",
-    "Dokumentation & Nachvollziehbarkeit",
-    "Service- & Kundenorientierung",
-]
-
-NACHWEISE = [
-    "Dokumente/Dateien (Ablage/Versionierung)",
-    "E-Mails/Protokolle",
-    "Checklisten/Formulare",
-    "Belege/Rechnungen",
-    "Auswertungen/Listen",
-    "Screenshots (ohne personenbezogene Daten)",
-]
-
-PRUEFUNGSUEBUNGEN = [
-    "Kaufmännische Fälle (Ein-/Ausgangsrechnungen, Skonto, Rabatt)",
-    "Korrespondenz (Anfrage/Angebot/Reklamation)",
-    "Termin- & Ressourcenplanung (Outlook/Teams)",
-    "Informationsrecherche & -aufbereitung",
-    "Kurzprojekt Organisation (Meeting/Event)",
-]
-
-BERUFSSCHULE = [
-    "Deutsch/Wirtschaftskommunikation",
-    "WiSo (Wirtschaft/Soziales)",
-    "Rechnungswesen/Controlling",
-    "Informationsverarbeitung (Text/Tabellen)",
-    "Projektarbeit",
-]
-
-# ────────────────────────────────────────────────────────────────────────────────
-# Eingaben: linke/rechte Spalte
+# Eingaben: linke/rechte Spalte (Vorschläge aus ausbildung/kataloge/*.txt)
 # ────────────────────────────────────────────────────────────────────────────────
 col1, col2 = st.columns(2)
 
-with col1:
+with instrumentation.phase("eingaben:links"), col1:
     if modus == "Ausbildung (Büromanagement)":
-        lf = combo_field("Lernfelder/Schwerpunkte", LERNFELDER_BUERO, "lf_text", "lf_multi")
+        lf = mit_freitext("Lernfelder/Schwerpunkte", "lernfelder_buero", "lf_multi", "lf_text")
     else:
-        lf = combo_field("Schwerpunkte (Berufsvorbereitung)", [
-            "Grundlagen Bürokommunikation",
-            "Arbeitsorganisation & Zeitmanagement",
-            "Digitale Grundkompetenzen (Office/Cloud)",
-            "Kaufmännische Basisprozesse",
-            "Bewerbung/Profil/ProfilPass",
-        ], "bv_text", "bv_multi")
+        lf = mit_freitext("Schwerpunkte (Berufsvorbereitung)", "schwerpunkte_bv_buero", "bv_multi", "bv_text")
 
-    taetigkeiten = combo_field("Tätigkeiten/Aufgaben", TAETIGKEITEN, "task_text", "task_multi")
-    tools = combo_field("Werkzeuge/Tools", TOOLS, "tools_text", "tools_multi")
+    taetigkeiten = mit_freitext("Tätigkeiten/Aufgaben", "taetigkeiten_buero", "task_multi", "task_text")
+    tools = mit_freitext("Werkzeuge/Tools", "tools_buero", "tools_multi", "tools_text")
 
-with col2:
-    kompetenzen = combo_field("Kompetenzen/Ziele", KOMPETENZEN, "skills_text", "skills_multi")
-    nachweise = combo_field("Nachweise/Dokumente", NACHWEISE, "proof_text", "proof_multi")
-    schule = combo_field("Berufsschule/Verknüpfung", BERUFSSCHULE, "school_text", "school_multi")
+with instrumentation.phase("eingaben:rechts"), col2:
+    kompetenzen = mit_freitext("Kompetenzen/Ziele", "kompetenzen_buero", "skills_multi", "skills_text")
+    nachweise = mit_freitext("Nachweise/Dokumente", "nachweise_buero", "proof_multi", "proof_text")
+    schule = mit_freitext("Berufsschule/Verknüpfung", "berufsschule_buero", "school_multi", "school_text")
 
 st.markdown("---")
 
 # ────────────────────────────────────────────────────────────────────────────────
-# Generatoren
+# Eingabe-Datensatz (Generatoren liegen Streamlit-frei in ausbildung.engine)
 # ────────────────────────────────────────────────────────────────────────────────
-def build_header():
-    hdr = [
-        f"**Modus:** {modus}",
-        f"**Zeitraum:** {daterange_str(date_from, date_to)}",
-    ]
-    return "\n".join(hdr)
-
-def gen_berichtsheft():
-    parts = []
-    parts.append(build_header())
-    parts.append(section("Schwerpunkte"))
-    parts.append(bullet(lf))
-    parts.append(section("Tätigkeiten"))
-    parts.append(bullet(taetigkeiten))
-    parts.append(section("Eingesetzte Werkzeuge/Tools"))
-    parts.append(bullet(tools))
-    parts.append(section("Erworbene Kompetenzen"))
-    parts.append(bullet(kompetenzen))
-    parts.append(section("Nachweise/Belege"))
-    parts.append(bullet(nachweise))
-    if schule:
-        parts.append(section("Verknüpfung zur Berufsschule"))
-        parts.append(bullet(schule))
-    return "\n".join(parts).strip()
-
-def gen_arbeitsauftrag():
-    prompt = f"""Rolle: Ausbilder:in
-Auftrag: Detaillierten Arbeitsauftrag formulieren.
-
-Rahmen:
-- Modus: {modus}
-- Zeitraum: {daterange_str(date_from, date_to)}
-
-Schwerpunkte:
-{bullet(lf)}
-
-Tätigkeiten:
-{bullet(taetigkeiten)}
-
-Werkzeuge:
-{bullet(tools)}
-
-Kompetenzen (Ziele):
-{bullet(kompetenzen)}
-
-Nachweise:
-{bullet(nachweise)}
-
-Bitte gib aus:
-1) Ziel(e) in beobachtbaren Kriterien
-2) Schritt-für-Schritt-Ablauf (mit Zeitindikationen, wo sinnvoll)
-3) Qualitätskriterien & typische Fehler
-4) Übergabe/Abnahme (inkl. Checkliste kurz)
-5) Reflexionsfragen für den Azubi
-Klar, prägnant, handlungsorientiert, max. 500 Wörter.
-"""
-    return textwrap.dedent(prompt).strip()
-
-def gen_pruefung():
-    parts = []
-    parts.append("Rolle: Prüfer:in (Übungsaufgaben)")
-    parts.append(f"Modus: {modus} · Zeitraum: {daterange_str(date_from, date_to)}")
-    parts.append(section("Aufgabenpool (wähle 2–3)"))
-    parts.append(bullet(PRUEFUNGSUEBUNGEN))
-    parts.append(section("Kontext aus der Praxiswoche"))
-    if lf:
-        parts.append("**Schwerpunkte:**\n" + bullet(lf))
-    if tools:
-        parts.append("\n**Werkzeuge:**\n" + bullet(tools))
-    if schule:
-        parts.append("\n**Bezug Berufsschule:**\n" + bullet(schule))
-    parts.append(section("Abgabe & Bewertung (Kurzrubrik)"))
-    parts.append(bullet([
-        "Vollständigkeit & Nachvollziehbarkeit",
-        "Form & Layout (professionell, CI falls vorhanden)",
-        "Korrektheit (fachlich, rechnerisch)",
-        "Begründungen/Entscheidungen kurz erläutert",
-        "Zeitmanagement eingehalten"
-    ]))
-    return "\n".join(parts).strip()
+eingabe = BueroEingabe(
+    modus=modus,
+    date_from=date_from,
+    date_to=date_to,
+    lf=lf,
+    taetigkeiten=taetigkeiten,
+    tools=tools,
+    kompetenzen=kompetenzen,
+    nachweise=nachweise,
+    schule=schule,
+    azubi=st.session_state.get("_entwurf_nutzer", "").strip(),
+)
+with instrumentation.phase("autosave"):
+    autosave.merken("buero", ENTWURF_FELDER, iso_woche(date_from))
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Ausgabe & Downloads + Copy-Buttons
 # ────────────────────────────────────────────────────────────────────────────────
-tab1, tab2, tab3 = st.tabs(["🧾 Berichtsheft", "🛠️ Arbeitsauftrag (Prompt)", "📝 Prüfungsübungen"])
-
-with tab1:
-    txt = gen_berichtsheft()
-    st.markdown(txt)
-    colA, colB = st.columns([1,1])
-    with colA:
-        dl_button("⬇️ Berichtsheft als TXT", txt, f"berichtsheft_bueromanagement_{datetime.now():%Y%m%d}.txt")
-    with colB:
-        copy_button(txt, key="berichtsheft")
+# Pro Ansicht: Titel, Darstellung, Download-Beschriftung, Dateiname
+ANSICHTEN = {
+    "berichtsheft": ("🧾 Berichtsheft", st.markdown, "⬇️ Berichtsheft als TXT", "berichtsheft_bueromanagement"),
+    "arbeitsauftrag": ("🛠️ Arbeitsauftrag (Prompt)", st.code, "⬇️ Arbeitsauftrag-Prompt als TXT", "arbeitsauftrag_prompt"),
+    "pruefung": ("📝 Prüfungsübungen", st.markdown, "⬇️ Prüfungsübungen als TXT", "pruefung_uebungen"),
+}
+
+@st.fragment
+def ausgabe(e: BueroEingabe):
+    """
+    Eigenständig neu laufender Ausgabebereich.
+    Statt Tabs (die immer alle drei Inhalte samt Copy-Button aufbauen) wird nur
+    die gewählte Ansicht erzeugt; ein Ansichtswechsel startet nur dieses Fragment neu.
+    """
+    with instrumentation.fragment_lauf("buero"):
+        ausgabe_ansicht(e)
+
+def ausgabe_ansicht(e: BueroEingabe):
+    art = st.radio(
+        "Ausgabe",
+        options=list(ANSICHTEN),
+        format_func=lambda a: ANSICHTEN[a][0],
+        horizontal=True,
+        key="ansicht",
+        label_visibility="collapsed",
+    )
+    _, darstellen, dl_label, dateiname = ANSICHTEN[art]
+    # Je Text ein Vorlagen-Zustand: nur geänderte Abschnitte werden neu gerendert
+    zustand = st.session_state.setdefault("_vorlagen_zustand", {}).setdefault(art, {})
+    with instrumentation.phase(f"gen:{art}"):
+        txt = erzeuge(art, e, zustand=zustand)
+    with instrumentation.phase(f"render:{art}"):
+        darstellen(txt)
+        colA, colB = st.columns([1,1])
+        with colA:
+            dl_button(dl_label, txt, f"{dateiname}_{datetime.now():%Y%m%d}.txt")
+    with instrumentation.phase("clipboard"), colB:
+        copy_button(txt, key=art)
+    if art == "arbeitsauftrag":
+        ki_antwort(txt, art)  # nur mit AUSBILDUNG_LLM_URL
+
+ausgabe(eingabe)
 
-with tab2:
-    txt = gen_arbeitsauftrag()
-    st.code(txt)
-    colA, colB = st.columns([1,1])
-    with colA:
-        dl_button("⬇️ Arbeitsauftrag-Prompt als TXT", txt, f"arbeitsauftrag_prompt_{datetime.now():%Y%m%d}.txt")
-    with colB:
-        copy_button(txt, key="arbeitsauftrag")
+# ────────────────────────────────────────────────────────────────────────────────
+# Sammelexport: gespeicherte Wochen als ZIP (Markdown/DOCX/PDF)
+# ────────────────────────────────────────────────────────────────────────────────
+# Listenfeld → (Katalog, Widget-Präfix) wie in den Eingabefeldern oben
+ENTWURF_LISTEN = {
+    "taetigkeiten": ("taetigkeiten_buero", "task"),
+    "tools": ("tools_buero", "tools"),
+    "kompetenzen": ("kompetenzen_buero", "skills"),
+    "nachweise": ("nachweise_buero", "proof"),
+    "schule": ("berufsschule_buero", "school"),
+}
+
+def eingabe_aus_entwurf(daten: dict, azubi: str = "") -> BueroEingabe:
+    """Gespeicherte Widget-Werte einer Woche in einen Eingabe-Datensatz übersetzen."""
+    modus = daten.get("modus", MODI[0])
+    listen = {"lf": ("lernfelder_buero", "lf") if modus == MODI[0] else ("schwerpunkte_bv_buero", "bv"), **ENTWURF_LISTEN}
+    d1, d2 = daten["zeitraum"]
+    return BueroEingabe(
+        modus=modus, date_from=d1, date_to=d2, azubi=azubi,
+        **{feld: kombiniere(daten.get(f"{p}_multi", []), daten.get(f"{p}_text", ""), katalog(k))
+           for feld, (k, p) in listen.items()},
+    )
 
-with tab3:
-    txt = gen_pruefung()
-    st.markdown(txt)
-    colA, colB = st.columns([1,1])
-    with colA:
-        dl_button("⬇️ Prüfungsübungen als TXT", txt, f"pruefung_uebungen_{datetime.now():%Y%m%d}.txt")
-    with colB:
-        copy_button(txt, key="pruefung")
+def export_dokumente(nutzer: str, wochen: list[str], arten: list[str], aktuell: BueroEingabe, kal: Kalender | None = None):
+    """
+    Je Woche und Text ein Dokument – Entwürfe werden erst beim Schreiben geladen.
+    Mit `kal` kommen die Wochen samt Zeitraum aus dem Kalender; Wochen ohne
+    Entwurf übernehmen die aktuellen Eingaben.
+    """
+    if kal is not None:
+        plan = ((w.schluessel, e) for w, e in berichtswochen(aktuell, kal))
+    else:
+        plan = ((w, None) for w in sorted(wochen) or [iso_woche(aktuell.date_from)])
+    for woche, geplant in plan:
+        gefunden = ablage().lade(nutzer, "buero", woche) if nutzer else None
+        if gefunden and len(gefunden[1].get("zeitraum", ())) == 2:
+            e = eingabe_aus_entwurf(gefunden[1], nutzer)
+            if geplant is not None:
+                e = replace(e, date_from=geplant.date_from, date_to=geplant.date_to)
+        elif geplant is not None or not nutzer:
+            e = geplant or aktuell
+        else:
+            continue
+        for art in arten:
+            titel = ANSICHTEN[art][0].split(" ", 1)[1]
+            yield Dokument(f"{woche}_{ANSICHTEN[art][3]}", f"{titel} {woche}", erzeuge(art, e))
+
+@st.fragment
+def sammelexport(e: BueroEingabe):
+    with instrumentation.fragment_lauf("buero"), st.expander("📦 Sammelexport (mehrere Wochen als ZIP)"):
+        nutzer = st.session_state.get("_entwurf_nutzer", "").strip()
+        wochen = [w for w, _ in ablage().wochen(nutzer, "buero", limit=520)] if nutzer else []
+        kal = None
+        if st.radio("Quelle", ["Gespeicherte Wochen", "Ausbildungszeitraum (je Kalenderwoche)"],
+                    horizontal=True, key="export_quelle") != "Gespeicherte Wochen":
+            st.session_state.setdefault("ausbildung_zeitraum", (e.date_from, e.date_from + timedelta(days=364)))
+            bereich = st.date_input("Ausbildungszeitraum", key="ausbildung_zeitraum", format="DD.MM.YYYY")
+            if len(bereich) == 2 and bereich[0] <= bereich[1]:
+                kal = Kalender(*bereich, land=st.session_state["land"], schultage=st.session_state.get("schultage", []))
+                tage = kal.zusammenfassung()
+                st.caption(
+                    f"{sum(1 for _ in kal.wochen())} Wochen · {tage['Betrieb']} Betriebstage · "
+                    f"{tage['Berufsschule']} Berufsschultage · {tage['Feiertag']} Feiertage – Wochen ohne Entwurf "
+                    "übernehmen die aktuellen Eingaben."
+                )
+            gewaehlt = []
+        elif not wochen:
+            gewaehlt = []
+            st.caption("Ohne Kürzel (Sidebar) bzw. gespeicherte Wochen wird nur die aktuelle Woche exportiert.")
+        elif st.checkbox(f"Alle gespeicherten Wochen ({len(wochen)})", value=True, key="export_alle"):
+            gewaehlt = wochen
+        else:
+            gewaehlt = st.multiselect("Wochen", wochen, key="export_wochen")
+        col1, col2 = st.columns(2)
+        arten = col1.multiselect("Texte", GENERATOREN, default=["berichtsheft"], key="export_arten",
+                                 format_func=lambda a: ANSICHTEN[a][0])
+        formate = col2.multiselect("Formate", [f for f in FORMATE if f != "txt"], default=["md"], key="export_formate",
+                                   format_func=str.upper)
+        st.download_button(
+            "⬇️ ZIP erstellen & herunterladen",
+            # erst beim Klick erzeugt, Dokument für Dokument
+            data=lambda: zip_datei(export_dokumente(nutzer, gewaehlt if wochen else [], arten, e, kal), formate),
+            file_name=f"berichtsheft_export_{datetime.now():%Y%m%d}.zip",
+            mime="application/zip",
+            on_click="ignore",
+            disabled=not (arten and formate and (kal or gewaehlt or not wochen)),
+        )
+
+with instrumentation.phase("export"):
+    sammelexport(eingabe)
+instrumentation.beende()
@@ -3,16 +3,29 @@
 # Hinweis: Keine personenbezogenen oder internen Unternehmensdaten eingeben.
 
 import json
-from datetime import datetime
-import textwrap
+from datetime import date, datetime
 import streamlit as st
-import streamlit.components.v1 as components
+
+from ausbildung import autosave, instrumentation
+from ausbildung.auswahl import mit_freitext
+from ausbildung.clipboard import copy_button
+from ausbildung.eintraege import kombiniere
+from ausbildung.entwuerfe import iso_woche
+from ausbildung.export import FORMATE, rendere
+from ausbildung.katalog import katalog
+from ausbildung.metall import MetallEingabe, erzeuge_prompt, mit_meta
+from ausbildung.promptlib import bibliothek
+from ausbildung.tokens import BUDGET, erzeuge_kompakt, schaetze
+from ausbildung.toleranzen import aufloesen
+from ausbildung.versand import ki_antwort
 
 st.set_page_config(page_title="Promptbuilder · Metallhandwerk (Azubis/Berufsvorbereitung)", page_icon="🛠️", layout="wide")
 st.title("🛠️ Promptbuilder für Auszubildende im Metallhandwerk")
 st.caption("Hinweis: **Keine personenbezogenen Daten** oder **internen Unternehmensdaten** eingeben. Dieser Builder erzeugt strukturierte Prompts für KI-Hilfen im Ausbildungsalltag und in der Berufsvorbereitung.")
+instrumentation.beginne("metall")
 
 # ---------------------- Presets (erweitert) ----------------------
+# Große Vorschlagslisten (Verfahren, Maschinen, Werkstoffe, Messmittel, Normen, Sicherheit) liegen in ausbildung/kataloge/*.txt
 AUSBILDSBERUFE = [
     "Industriemechaniker:in", "Zerspanungsmechaniker:in", "Konstruktionsmechaniker:in",
     "Werkzeugmechaniker:in", "Metallbauer:in Konstruktionstechnik",
@@ -23,45 +36,6 @@ AUSBILDSBERUFE = [
 
 BILDUNGSGANG = ["Duale Ausbildung", "Berufsvorbereitung (BvB/BF/BBW)"]
 
-VERFAHREN = [
-    # Grundfertigkeiten
-    "Anreißen/Körnen", "Feilen", "Sägen (Hand/maschinell)", "Bohren", "Reiben", "Gewindeschneiden (Hand)",
-    # Umformen/Trennen/Verbinden
-    "Biegen", "Nieten", "Hartlöten", "Plasmaschneiden", "Autogenschneiden",
-    # Zerspanung/CNC
-    "Drehen", "Fräsen", "Schleifen", "CNC (Sinumerik)", "CNC (Heidenhain)", "CAM",
-    # Schweißen/Metallbau
-    "Schweißen MAG", "Schweißen WIG/TIG", "Punktschweißen",
-    # Sonstiges
-    "Montage", "Instandhaltung", "Messen/Prüfen"
-]
-
-MASCHINEN = [
-    "Konventionelle Drehmaschine", "CNC-Drehmaschine", "Konventionelle Fräsmaschine",
-    "CNC-Fräsmaschine", "Säulenbohrmaschine", "Bandsäge",
-    "Schweißgerät MAG", "Schweißgerät WIG/TIG", "Punktschweißgerät",
-    "Rohrbieger", "Plasmaschneider", "Autogenbrenner", "Flachschleifmaschine"
-]
-
-WERKSTOFFE = [
-    "C15", "C45E", "42CrMo4", "S235JR", "S355",
-    "1.4301 (V2A)", "1.4404 (V4A)", "9SMn28 (Automatenstahl)",
-    "Al99,5", "AlCuMg1", "AlMg3", "Cu-ETP (Kupfer)", "CuZn (Messing)", "GG25"
-]
-
-MESSMITTEL = [
-    "Messschieber 0–150 mm", "Tiefenmaß Messschieber", "Mikrometer 0–25 mm",
-    "Höhenreißer + Anreißplatte", "Innenmessgerät", "Winkelmesser",
-    "Rauheitsmessgerät", "Fühlerlehre", "Grenzlehrdorn", "Parallelendmaße"
-]
-
-NORMEN = [
-    "DIN ISO 2768 (Allg. Toleranzen)", "DIN EN ISO 1101 (Form-/Lage)", "DIN EN ISO 1302 (Oberflächen)",
-    "DIN 13 (Metrische Gewinde)", "DIN EN ISO 5817 (Schweißnahtbewertung)",
-    "DIN EN ISO 9606-1 (Schweißerprüfung)", "EN ISO 4063 (Schweißprozess-Nr.)",
-    "DGUV Vorschrift 1 (Sicherheit)", "Betriebs-/Maschinenanweisung"
-]
-
 DIDAKTIK = [
     "4-Stufen-Methode", "Leittextmethode", "Projektarbeit", "Lernaufgabe",
     "Peer-Learning", "Lernfeldorientiert", "Handlungsorientierte Unterweisung"
@@ -84,112 +58,251 @@ AUFGABENTYP = [
 SPRACHE = ["Deutsch", "Englisch"]
 TON = ["klar & knapp", "instruktiv & geduldig", "prüfungsnah & formal", "kollegial & motivierend"]
 
-# ---------------------- Utility ----------------------
+# ---------------------- Entwürfe ----------------------
+# Widget-Schlüssel, die als Entwurf je Kürzel und Kalenderwoche gespeichert werden
+ENTWURF_FELDER = (
+    "bildungsgang", "beruf", "jahr", "lernort", "aufgabentyp", "output", "sprache", "ton",
+    "verfahren_ms", "verfahren_txt", "maschinen_ms", "maschinen_txt", "werkstoffe_ms", "werkstoffe_txt",
+    "normen_ms", "normen_txt", "mess_ms", "mess_txt", "toleranzen", "safety_ms", "safety_txt",
+    "didaktik", "lernziel", "zeit", "materialien", "zeichnung", "kontext", "kompakt", "token_budget",
+    "formular", "vorschau",
+)
 
-def multiselect_with_free_text(label: str, options: list[str], key_prefix: str, height: int = 80):
-    st.markdown(f"**{label}**")
-    sel = st.multiselect(
-        f"{label} · Vorschläge (Mehrfachauswahl möglich)", options=options, key=f"{key_prefix}_ms"
-    )
-    txt = st.text_area(
-        f"{label} · Eigene Eingaben (eine pro Zeile)", key=f"{key_prefix}_txt", height=height
-    )
-    own = [x.strip("- ").strip() for x in txt.splitlines() if x.strip()]
-    return [*sel, *own]
+with instrumentation.phase("sidebar"), st.sidebar:
+    autosave.seitenleiste("metall", ENTWURF_FELDER)
+    # Weniger Reruns: Formular bündelt Eingaben bis „Übernehmen“, die Vorschau läuft als Fragment
+    st.subheader("⌨️ Eingabe")
+    st.toggle("Formular-Modus (erst beim Übernehmen rechnen)", key="formular", on_change=autosave.seitenwechsel)
+    st.toggle("Live-Vorschau (nur die Vorschau neu zeichnen)", key="vorschau", on_change=autosave.seitenwechsel)
 
 # ---------------------- Layout ----------------------
-colL, colR = st.columns([1, 1])
-
-with colL:
-    st.subheader("1) Rahmen & Rolle")
-    bildungsgang = st.selectbox("Bildungsgang", BILDUNGSGANG, key="bildungsgang")
-    beruf = st.selectbox("Ausbildungsberuf / Zielberuf", AUSBILDSBERUFE, key="beruf")
-    ausbildungsjahr = st.selectbox("Ausbildungsjahr (falls zutreffend)", ["1", "2", "3", "4"], key="jahr")
-    lernort = st.selectbox("Lernort", ["Betrieb", "ÜBA", "Berufsschule", "Prüfungsvorbereitung", "Berufsvorbereitung"], key="lernort")
-    aufgabentyp = st.selectbox("Aufgabentyp", AUFGABENTYP, key="aufgabentyp")
-    outputformat = st.multiselect("Gewünschtes Output-Format", OUTPUTFORMATE, key="output")
-    sprache = st.selectbox("Sprache", SPRACHE, key="sprache")
-    ton = st.selectbox("Ton & Stil", TON, key="ton")
-
-    st.subheader("2) Technik-Setup")
-    verfahren = multiselect_with_free_text("Verfahren/Arbeitsgänge", VERFAHREN, "verfahren")
-    maschinen = multiselect_with_free_text("Maschinen/Steuerungen", MASCHINEN, "maschinen")
-    werkstoffe = multiselect_with_free_text("Werkstoffe", WERKSTOFFE, "werkstoffe")
-
-with colR:
-    st.subheader("3) Qualität & Sicherheit")
-    normen = multiselect_with_free_text("Normen/Regeln", NORMEN, "normen")
-    messmittel = multiselect_with_free_text("Messmittel/Prüfkriterien", MESSMITTEL, "mess")
-    toleranzen = st.text_input("Maß-/Form-/Lagetoleranzen (z. B. Ø20 H7, Ra 1,6, Ⓜ⌀0,02)", key="toleranzen")
-    sicherheit = multiselect_with_free_text("Sicherheitsaspekte (PSA, Gefahren, Unterweisung)", [
-        "PSA: Schutzbrille, Handschuhe", "Gefährdungsbeurteilung", "Sperrbereiche", "Brandgefahr",
-        "Späne/Quetschstellen", "Schweißrauchabsaugung"
-    ], "safety")
-
-    st.subheader("4) Didaktik & Zeit")
-    didaktik = st.multiselect("Didaktischer Ansatz", DIDAKTIK, key="didaktik")
-    lernziel = st.text_area("Lernziel(e) (beobachtbar, SMART)", height=80, key="lernziel")
-    zeit = st.number_input("Geplante Zeit (Minuten)", min_value=5, max_value=480, step=5, key="zeit")
-
-st.subheader("5) Materialien & Kontext")
-materialien = st.text_area("Material-/Werkzeugliste (eine Position pro Zeile)", height=80, key="materialien")
-zeichnung = st.text_input("Link/Referenz: Zeichnung/Skizze/Foto (optional)", key="zeichnung")
-kontext = st.text_area("Kontext/Startlage (z. B. Werkstückbeschreibung, Ist-Stand, typische Fehler)", height=100, key="kontext")
+# Freitext-Abschnitte: (Überschrift, Katalog, Auswahl-Key, Text-Key)
+KATALOGFELDER = {
+    "verfahren": ("Verfahren/Arbeitsgänge", "verfahren", "verfahren_ms", "verfahren_txt"),
+    "maschinen": ("Maschinen/Steuerungen", "maschinen", "maschinen_ms", "maschinen_txt"),
+    "werkstoffe": ("Werkstoffe", "werkstoffe", "werkstoffe_ms", "werkstoffe_txt"),
+    "normen": ("Normen/Regeln", "normen", "normen_ms", "normen_txt"),
+    "messmittel": ("Messmittel/Prüfkriterien", "messmittel", "mess_ms", "mess_txt"),
+    "sicherheit": ("Sicherheitsaspekte (PSA, Gefahren, Unterweisung)", "sicherheit", "safety_ms", "safety_txt"),
+}
+
+def toleranzen_pruefen(text: str):
+    """Aufgelöste Grenzmaße unter dem Feld anzeigen, ungültige Angaben markieren."""
+    tol = aufloesen(text.strip())
+    if tol.werte:
+        st.caption("  \n".join(x.zeile() for x in tol.werte))
+    for f in tol.fehler:
+        st.warning(f.zeile(), icon="📏")
+
+def eingabefelder(fragment: bool):
+    """Abschnitte 1–5; `fragment=False` zeichnet die Katalogsuchen direkt (im Formular bzw. Vorschau-Fragment)."""
+    def katalogfeld(feld: str):
+        mit_freitext(*KATALOGFELDER[feld], height=80, fragment=fragment)
+
+    colL, colR = st.columns([1, 1])
+
+    with instrumentation.phase("eingaben:links"), colL:
+        st.subheader("1) Rahmen & Rolle")
+        st.selectbox("Bildungsgang", BILDUNGSGANG, key="bildungsgang")
+        st.selectbox("Ausbildungsberuf / Zielberuf", AUSBILDSBERUFE, key="beruf")
+        st.selectbox("Ausbildungsjahr (falls zutreffend)", ["1", "2", "3", "4"], key="jahr")
+        st.selectbox("Lernort", ["Betrieb", "ÜBA", "Berufsschule", "Prüfungsvorbereitung", "Berufsvorbereitung"], key="lernort")
+        st.selectbox("Aufgabentyp", AUFGABENTYP, key="aufgabentyp")
+        st.multiselect("Gewünschtes Output-Format", OUTPUTFORMATE, key="output")
+        st.selectbox("Sprache", SPRACHE, key="sprache")
+        st.selectbox("Ton & Stil", TON, key="ton")
+
+        st.subheader("2) Technik-Setup")
+        for feld in ("verfahren", "maschinen", "werkstoffe"):
+            katalogfeld(feld)
+
+    with instrumentation.phase("eingaben:rechts"), colR:
+        st.subheader("3) Qualität & Sicherheit")
+        katalogfeld("normen")
+        katalogfeld("messmittel")
+        st.text_input("Maß-/Form-/Lagetoleranzen (z. B. Ø20 H7, Ra 1,6, Ⓜ⌀0,02)", key="toleranzen")
+        toleranzen_pruefen(st.session_state.get("toleranzen", ""))
+        katalogfeld("sicherheit")
+
+        st.subheader("4) Didaktik & Zeit")
+        st.multiselect("Didaktischer Ansatz", DIDAKTIK, key="didaktik")
+        st.text_area("Lernziel(e) (beobachtbar, SMART)", height=80, key="lernziel")
+        st.number_input("Geplante Zeit (Minuten)", min_value=5, max_value=480, step=5, key="zeit")
+
+    with instrumentation.phase("eingaben:kontext"):
+        st.subheader("5) Materialien & Kontext")
+        st.text_area("Material-/Werkzeugliste (eine Position pro Zeile)", height=80, key="materialien")
+        st.text_input("Link/Referenz: Zeichnung/Skizze/Foto (optional)", key="zeichnung")
+        st.text_area("Kontext/Startlage (z. B. Werkstückbeschreibung, Ist-Stand, typische Fehler)", height=100, key="kontext")
+
+def formular():
+    """Alle Abschnitte in einem Formular: Tippen und Auswählen lösen keinen Rerun aus, erst die Buttons."""
+    with st.form("metall_eingaben", enter_to_submit=False, border=False):
+        eingabefelder(fragment=False)
+        links, rechts = st.columns(2)
+        links.form_submit_button("✅ Eingaben übernehmen", use_container_width=True)
+        if rechts.form_submit_button("🔧 Prompt erzeugen", type="primary", use_container_width=True):
+            st.session_state["_metall_erzeugen"] = True
+            return True
+    return False
 
 # ---------------------- Prompt zusammensetzen ----------------------
-if st.button("🔧 Prompt erzeugen", use_container_width=True):
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
-    payload = {
-        "bildungsgang": st.session_state.get('bildungsgang', ''),
-        "rolle": f"Du bist Ausbilder:in/Coach im Metallbereich für {st.session_state.get('beruf','')} (AJ {st.session_state.get('jahr','-')}).",
-        "ziel": "Unterstütze die/den Lernende:n mit klaren, sicheren, normgerechten und prüfungsnahen Anweisungen (Niveau an Bildungsgang anpassen).",
-        "lernort": st.session_state.get('lernort',''),
-        "aufgabentyp": st.session_state.get('aufgabentyp',''),
-        "sprache": st.session_state.get('sprache','Deutsch'),
-        "ton": st.session_state.get('ton','instruktiv & geduldig'),
-        "didaktik": st.session_state.get('didaktik',[]),
-        "lernziel": st.session_state.get('lernziel','').strip(),
-        "verfahren": verfahren,
-        "maschinen": maschinen,
-        "werkstoffe": werkstoffe,
-        "normen": normen,
-        "messmittel": messmittel,
-        "toleranzen": st.session_state.get('toleranzen','').strip(),
-        "sicherheit": sicherheit,
-        "zeit_min": st.session_state.get('zeit',60),
-        "materialliste": [x.strip() for x in st.session_state.get('materialien','').splitlines() if x.strip()],
-        "zeichnung_ref": st.session_state.get('zeichnung','').strip(),
-        "kontext": st.session_state.get('kontext','').strip(),
-        "gewünschter_output": st.session_state.get('output',[]),
-        "meta": {"erstellt": now, "builder": "Promptbuilder Metall (Azubis/Berufsvorbereitung)"}
-    }
-
-    prompt_text = textwrap.dedent(f"""Rolle & Ziel:\n{payload['rolle']} Bildungsgang: {payload['bildungsgang']}. Sprich {('mich' if payload['sprache']=='Deutsch' else 'me')} im Stil: {payload['ton']}. Arbeite {('auf Deutsch' if payload['sprache']=='Deutsch' else 'in English')}. Ziel: {payload['ziel']}\n\nKontext:\n- Lernort: {payload['lernort']}\n- Aufgabentyp: {payload['aufgabentyp']}\n- Ausbildungsjahr: {st.session_state.get('jahr','-')}\n- Verfahren/Arbeitsgänge: {', '.join(verfahren) or '-'}\n- Maschinen/Steuerungen: {', '.join(maschinen) or '-'}\n- Werkstoffe: {', '.join(werkstoffe) or '-'}\n- Normen/Regeln: {', '.join(normen) or '-'}\n- Messmittel/Prüfkriterien: {', '.join(messmittel) or '-'}\n- Toleranzen: {payload['toleranzen'] or '-'}\n- Sicherheitsaspekte: {', '.join(sicherheit) or '-'}\n- Zeitrahmen: {payload['zeit_min']} Minuten\n- Materialien/Werkzeuge: {', '.join(payload['materialliste']) or '-'}\n- Zeichnung/Referenz: {payload['zeichnung_ref'] or '-'}\n- Startlage/typische Fehler: {payload['kontext'] or '-'}\n- Didaktik: {', '.join(payload['didaktik']) or '-'}\n- Lernziel(e): {payload['lernziel'] or '-'}\n\nAufgaben an die KI:\n1) Erstelle die Ausgabe im/als: {', '.join(payload['gewünschter_output']) or '—'}.\n2) Passe Komplexität und Fachsprache an den Bildungsgang an (Berufsvorbereitung → mehr Bilder/Beispiele, einfache Sprache; Duale Ausbildung → fachlich präzise, normnah).\n3) Nenne zuerst Sicherheits-Hinweise (DGUV-konform), dann Material/Setup, dann Vorgehen.\n4) Verwende Nummerierung und, wo sinnvoll, Tabellen.\n5) Mache Maße, Toleranzen, Werkstoff und Messmittel konkret; verweise auf Normstellen (z. B. DIN ISO 2768, ISO 1302) ohne zu erfinden.\n6) Gib typische Fehlerbilder + Ursachen + Gegenmaßnahmen an (Fehlerkatalog).\n7) Schließe mit Reflexionsfragen; in der Berufsvorbereitung zusätzlich 1–2 Alltagsbezüge.\n8) Wenn Informationen fehlen, frage gezielt nach (max. 3 Rückfragen).\n\nAusgabeformat (Beispielstruktur):\n- **Sicherheit**\n- **Material & Rüstung** (Tabelle)\n- **Arbeitsablauf** (Schritte 1..n)\n- **Qualitätsprüfung** (Toleranzen/Messmittel)\n- **Fehlerkatalog**\n- **Reflexion** (3–5 Fragen)""").strip()
-
-    st.success("Prompt erzeugt. Unten kopieren oder als Datei speichern.")
-    st.text_area("Generierter Prompt", prompt_text, height=320)
-    st.download_button(label="⬇️ Prompt als .txt speichern", data=prompt_text, file_name=f"prompt_metall_{datetime.now().strftime('%Y%m%d_%H%M')}.txt", mime="text/plain", use_container_width=True)
-
-    safe = prompt_text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '&quot;').replace("'", "&#39;")
-    components.html(textwrap.dedent(f"""
-<div style='display:flex;gap:8px;align-items:center;margin-top:8px;'>
-  <button id='copyBtn' style='padding:8px 12px;border-radius:10px;border:1px solid #ddd;cursor:pointer;'>📋 In Zwischenablage kopieren</button>
-  <span id='copyInfo' style='opacity:0.8'></span>
-</div>
-<script>
-  const text = "{safe}";
-  const btn = document.getElementById('copyBtn');
-  const info = document.getElementById('copyInfo');
-  btn.addEventListener('click', async () => {{
-    try {{ await navigator.clipboard.writeText(text); info.textContent = 'Kopiert!'; }}
-    catch (e) {{ info.textContent = 'Kopieren nicht erlaubt. Markiere den Text und kopiere manuell (Ctrl/Cmd+C).'; }}
-  }});
-</script>
-"""), height=60)
-
-    with st.expander("Maschinenlesbare Prompt-Metadaten (JSON)"):
+def eingabe_aus_state() -> MetallEingabe:
+    """Eingabe aus dem Session State – auch in Fragment-Reruns, in denen die Widgets nicht neu gezeichnet werden."""
+    ss = st.session_state
+    listen = {feld: kombiniere(ss.get(ms, []), ss.get(txt, ""), katalog(name))
+              for feld, (_, name, ms, txt) in KATALOGFELDER.items()}
+    return MetallEingabe(
+        bildungsgang=ss.get('bildungsgang', ''),
+        beruf=ss.get('beruf', ''),
+        jahr=ss.get('jahr', '-'),
+        lernort=ss.get('lernort', ''),
+        aufgabentyp=ss.get('aufgabentyp', ''),
+        output=tuple(ss.get('output', [])),
+        sprache=ss.get('sprache', 'Deutsch'),
+        ton=ss.get('ton', 'instruktiv & geduldig'),
+        didaktik=tuple(ss.get('didaktik', [])),
+        lernziel=ss.get('lernziel', ''),
+        toleranzen=ss.get('toleranzen', ''),
+        zeit=ss.get('zeit', 60),
+        materialien=ss.get('materialien', ''),
+        zeichnung=ss.get('zeichnung', ''),
+        kontext=ss.get('kontext', ''),
+        **listen,
+    )
+
+def prompt_aus_state() -> tuple[MetallEingabe, str, dict]:
+    # Prompt/Payload gecacht (ausbildung.cache), nur geänderte Abschnitte werden neu gerendert
+    eingabe = eingabe_aus_state()
+    zustand = st.session_state.setdefault("_vorlagen_zustand", {}).setdefault("metall_prompt", {})
+    return eingabe, *erzeuge_prompt(eingabe, zustand=zustand)
+
+@st.fragment
+def live_vorschau(mit_formular: bool):
+    """
+    Eingaben samt Vorschau als Fragment: Eine Änderung (bzw. „Übernehmen“ im
+    Formular) zeichnet nur diesen Bereich neu. Sidebar, Bibliothek und Footer
+    folgen erst beim nächsten vollen Lauf, z. B. beim Erzeugen.
+    """
+    with instrumentation.fragment_lauf("metall"):
+        if mit_formular:
+            if formular():
+                st.rerun()  # Erzeugen braucht den vollen Lauf
+        else:
+            eingabefelder(fragment=False)
+        with instrumentation.phase("vorschau"):
+            eingabe, text, payload = prompt_aus_state()
+            if st.session_state.get("kompakt"):
+                text = erzeuge_kompakt(eingabe, st.session_state.get("token_budget", BUDGET), payload).prompt
+            with st.expander(f"👁️ Live-Vorschau · ≈ {schaetze(text):,} Tokens".replace(",", "."), expanded=True):
+                st.code(text, language=None, height=320)
+        autosave.merken("metall", ENTWURF_FELDER, iso_woche(date.today()))
+
+ss = st.session_state
+if ss.get("vorschau"):
+    live_vorschau(bool(ss.get("formular")))
+elif ss.get("formular"):
+    formular()
+else:
+    eingabefelder(fragment=True)
+
+with instrumentation.phase("gen:metall_prompt"):
+    eingabe, prompt_text, payload = prompt_aus_state()
+beruf = eingabe.beruf
+
+# ---------------------- Token-Budget ----------------------
+# Größe bei jeder Änderung schätzen (zeilenweise gecacht); optional auf ein Budget kürzen
+with instrumentation.phase("tokens"), st.sidebar:
+    st.subheader("📏 Prompt-Größe")
+    st.session_state.setdefault("token_budget", BUDGET)
+    kompakt = st.toggle("Kompakt (auf Token-Budget kürzen)", key="kompakt")
+    budget = st.number_input("Token-Budget", min_value=100, max_value=20000, step=50, key="token_budget",
+                             disabled=not kompakt)
+    tokens = schaetze(prompt_text)
+    if kompakt:
+        k = erzeuge_kompakt(eingabe, budget, payload)
+        prompt_text = k.prompt
+        st.metric("Geschätzte Tokens", f"≈ {k.tokens_nachher:,}".replace(",", "."),
+                  delta=-(k.tokens_vorher - k.tokens_nachher) or None, delta_color="inverse")
+        if k.schritte:
+            st.caption(f"Vorher ≈ {k.tokens_vorher:,} · ".replace(",", ".") + " · ".join(k.schritte))
+        if not k.passt:
+            st.warning("Budget auch nach dem Kürzen überschritten – Eingaben reduzieren oder Budget erhöhen.")
+    else:
+        st.metric("Geschätzte Tokens", f"≈ {tokens:,}".replace(",", "."))
+
+# Im Formular-Modus sitzt der Button im Formular, damit ungespeicherte Eingaben mitkommen
+erzeugen = ss.pop("_metall_erzeugen", False)
+if not ss.get("formular"):
+    erzeugen = st.button("🔧 Prompt erzeugen", use_container_width=True)
+if erzeugen:
+    # Der Zeitstempel kommt erst nach dem Cache dazu
+    payload = mit_meta(payload, datetime.now().strftime("%Y-%m-%d %H:%M"))
+
+    with instrumentation.phase("render:prompt"):
+        st.success("Prompt erzeugt. Unten kopieren oder als Datei speichern.")
+        st.text_area("Generierter Prompt", prompt_text, height=320)
+        st.download_button(label="⬇️ Prompt als .txt speichern", data=prompt_text, file_name=f"prompt_metall_{datetime.now().strftime('%Y%m%d_%H%M')}.txt", mime="text/plain", use_container_width=True)
+        # Weitere Formate über ausbildung.export – erst beim Klick gerendert
+        for spalte, fmt in zip(st.columns(3), ["md", "docx", "pdf"]):
+            _, endung, mime = FORMATE[fmt]
+            spalte.download_button(
+                label=f"⬇️ {fmt.upper()}",
+                data=lambda fmt=fmt: rendere(fmt, f"Prompt {beruf}", prompt_text),
+                file_name=f"prompt_metall_{datetime.now():%Y%m%d_%H%M}.{endung}",
+                mime=mime, on_click="ignore", use_container_width=True,
+            )
+
+    with instrumentation.phase("clipboard"):
+        copy_button(prompt_text, key="prompt_metall", label="📋 In Zwischenablage kopieren")
+
+    with instrumentation.phase("render:json"), st.expander("Maschinenlesbare Prompt-Metadaten (JSON)"):
         st.code(json.dumps(payload, ensure_ascii=False, indent=2))
 
+    # Jeder erzeugte Prompt landet in der Bibliothek (gleicher Text = ein Eintrag)
+    with instrumentation.phase("promptlib"):
+        bibliothek().ablegen(prompt_text, payload, beruf)
+
+# Direkt an die KI (nur mit AUSBILDUNG_LLM_URL); die Antwort bleibt bis zur nächsten Prompt-Änderung stehen
+ki_antwort(prompt_text, "metall")
+
+# ---------------------- Prompt-Bibliothek ----------------------
+@st.fragment
+def prompt_bibliothek():
+    """Suche in allen gespeicherten Prompts; Tippen und Filtern starten nur dieses Fragment neu."""
+    bib = bibliothek()
+    with instrumentation.fragment_lauf("metall"), st.expander(f"📚 Prompt-Bibliothek ({len(bib):,} Prompts)".replace(",", ".")):
+        facetten = bib.facetten()
+        anfrage = st.text_input("Suche (Volltext)", key="bib_suche", placeholder="z. B. welle passung drehen")
+        filter_ = [
+            spalte.selectbox(titel, [w for w, _ in facetten[feld]], index=None, key=f"bib_{feld}", placeholder="alle",
+                             format_func=lambda w, n=dict(facetten[feld]): f"{w} ({n[w]})")
+            for spalte, (feld, titel) in zip(st.columns(3), [("beruf", "Beruf"), ("aufgabentyp", "Aufgabentyp"),
+                                                            ("verfahren", "Verfahren")])
+        ]
+        treffer = {t.hash: t for t in bib.suche(anfrage, *filter_, limit=20)}
+        if not treffer:
+            st.caption("Keine Treffer.")
+        gewaehlt = st.radio(
+            "Treffer", list(treffer), index=None, key="bib_treffer", label_visibility="collapsed",
+            format_func=lambda h: f"{treffer[h].beruf} · {treffer[h].aufgabentyp or '–'} · "
+                                  f"{treffer[h].zuletzt:%d.%m.%Y} · ×{treffer[h].anzahl} — {treffer[h].auszug}",
+        )
+        if gewaehlt and (gefunden := bib.lade(gewaehlt)):
+            st.code(gefunden[0], language=None)
+            with st.expander("Payload (JSON)"):
+                st.json(gefunden[1], expanded=False)
+        st.download_button(
+            "⬇️ Bibliothek als JSONL", data=bib.export_datei, file_name=f"prompts_metall_{datetime.now():%Y%m%d}.jsonl",
+            mime="application/jsonl", on_click="ignore", disabled=not len(bib),
+        )
+
+with instrumentation.phase("promptlib"):
+    prompt_bibliothek()
+
+with instrumentation.phase("autosave"):
+    autosave.merken("metall", ENTWURF_FELDER, iso_woche(date.today()))
+
 # ---------------------- Footer ----------------------
 st.markdown(
     """---
@@ -200,3 +313,5 @@ st.markdown(
 - Sicherheit geht vor: DGUV-Hinweise zuerst.
 """
 )
+
+instrumentation.beende()
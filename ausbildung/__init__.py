@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""Gemeinsame Bausteine der Ausbildungs-Apps.
+
+Streamlit wird nur in den UI-Modulen importiert (`auswahl`, `autosave`,
+`clipboard`, `instrumentation`, `versand`). Die übrigen Module – Engine, Metall,
+Vorlagen, Kalender, Export, Toleranzen, Bibliotheken, CLI, API und LLM-Client –
+laufen ohne Streamlit.
+"""
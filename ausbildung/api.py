@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP-API (ASGI) für die Büro-Generatoren und den Metall-Promptbuilder – ohne Streamlit.
+
+    python -m ausbildung.api --port 8000 --workers 4
+    uvicorn ausbildung.api:app --port 8000
+
+Endpunkte (JSON rein, Text bzw. JSON raus):
+    GET  /health                 Status, Pool-Größe, Cache-Zähler
+    POST /v1/buero/<art>         Datensatz → Text (text/markdown; mit `Accept: application/json` als {"text": …})
+    POST /v1/buero               {"arten": [...], …Datensatz} → {"berichtsheft": …, …}
+    POST /v1/metall              Datensatz → {"prompt": …, "payload": …}
+    POST /v1/batch               {"buero": [...], "arten": [...]} oder {"metall": [...]} → {"ergebnisse": [...]}
+
+Datensätze wie im CLI (`BueroEingabe.from_record`, `MetallEingabe.from_record`).
+Ungültige Eingaben → 422 {"fehler": …}. Gerendert wird über den gemeinsamen
+Text-Cache und bei Fehltreffern in einem Prozess-Pool; die Zahl offener
+Aufträge ist begrenzt (ein Batch zählt als ein Auftrag), bei voller
+Warteschlange antwortet die API mit 503.
+
+Konfiguration über Umgebungsvariablen:
+    AUSBILDUNG_API_WORKERS     Worker-Prozesse (Standard: CPU-Kerne, 0 = Threads im Server-Prozess)
+    AUSBILDUNG_API_QUEUE       max. offene Aufträge (Standard: 8 je Worker)
+    AUSBILDUNG_API_MAX_BYTES   max. Größe des Request-Bodys (Standard 1 MiB)
+    AUSBILDUNG_API_MAX_BATCH   max. Datensätze je Batch (Standard 1000)
+"""
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from ausbildung.cache import TEXT_CACHE, canonical_key
+from ausbildung.engine import GENERATOREN, BueroEingabe, eingabe_schluessel, generate
+from ausbildung.metall import MetallEingabe, build_payload, build_prompt
+from ausbildung.parallel import batched
+
+JSON = b"application/json; charset=utf-8"
+TEXT = b"text/markdown; charset=utf-8"
+WARTEZEIT_S = 2.0  # so lange darf ein Request auf einen Platz in der Warteschlange warten
+PAKET = 64         # Datensätze je Pool-Auftrag im Batch
+
+class HttpFehler(Exception):
+    def __init__(self, status: int, meldung: str):
+        super().__init__(meldung)
+        self.status = status
+        self.meldung = meldung
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Arbeit im Worker-Prozess (picklebar, ohne Cache)
+# ────────────────────────────────────────────────────────────────────────────────
+def _metall(e: MetallEingabe) -> tuple[str, dict]:
+    payload = build_payload(e)
+    return build_prompt(e, payload), payload
+
+def _buero_paket(paket: list[BueroEingabe], arten: list[str]) -> list[dict]:
+    return [generate(e, arten) for e in paket]
+
+def _metall_paket(paket: list[MetallEingabe]) -> list[dict]:
+    return [dict(zip(("prompt", "payload"), _metall(e))) for e in paket]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Hilfen
+# ────────────────────────────────────────────────────────────────────────────────
+def _json(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+def _arten(wert) -> list[str]:
+    arten = GENERATOREN if wert is None else wert
+    if isinstance(arten, str):
+        arten = [a.strip() for a in arten.split(",") if a.strip()]
+    if not isinstance(arten, list) or not arten or any(a not in GENERATOREN for a in arten):
+        raise HttpFehler(422, f"'arten' muss eine Auswahl aus {', '.join(GENERATOREN)} sein")
+    return arten
+
+def _datensatz(wert, klasse):
+    if not isinstance(wert, dict):
+        raise HttpFehler(422, "Datensatz muss ein JSON-Objekt sein")
+    try:
+        return klasse.from_record(wert)
+    except (ValueError, TypeError) as exc:
+        raise HttpFehler(422, str(exc)) from None
+
+class Api:
+    """ASGI-Anwendung mit eigenem, begrenztem Prozess-Pool."""
+
+    def __init__(self, workers: int | None = None, queue: int | None = None,
+                 max_bytes: int | None = None, max_batch: int | None = None):
+        env = os.environ.get
+        self.workers = int(env("AUSBILDUNG_API_WORKERS", os.cpu_count() or 1)) if workers is None else workers
+        self.queue = int(env("AUSBILDUNG_API_QUEUE", 8 * max(1, self.workers))) if queue is None else queue
+        self.max_bytes = int(env("AUSBILDUNG_API_MAX_BYTES", 1024 * 1024)) if max_bytes is None else max_bytes
+        self.max_batch = int(env("AUSBILDUNG_API_MAX_BATCH", 1000)) if max_batch is None else max_batch
+        self._pool = None
+        self._plaetze = asyncio.Semaphore(self.queue)
+
+    # ── Worker-Pool ─────────────────────────────────────────────────────────────
+    def starten(self):
+        if self.workers > 0 and self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def beenden(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    @asynccontextmanager
+    async def _platz(self):
+        """Ein Platz in der Warteschlange; wartet höchstens WARTEZEIT_S, sonst 503."""
+        try:
+            await asyncio.wait_for(self._plaetze.acquire(), timeout=WARTEZEIT_S)
+        except asyncio.TimeoutError:
+            raise HttpFehler(503, "Server ausgelastet, bitte später erneut versuchen") from None
+        try:
+            yield
+        finally:
+            self._plaetze.release()
+
+    async def _im_pool(self, fn, *args):
+        """`fn(*args)` im Prozess-Pool; ohne Worker in einem Thread, damit die Event-Loop frei bleibt."""
+        if self.workers > 0:
+            self.starten()
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    async def _ausfuehren(self, fn, *args):
+        """`fn(*args)` mit einem Platz in der Warteschlange ausführen."""
+        async with self._platz():
+            return await self._im_pool(fn, *args)
+
+    # ── Endpunkte ───────────────────────────────────────────────────────────────
+    async def buero(self, e: BueroEingabe, arten: list[str]) -> dict[str, str]:
+        """Texte aus dem Cache, fehlende in einem Pool-Auftrag erzeugen."""
+        schluessel = {art: canonical_key(art, eingabe_schluessel(e, art)) for art in arten}
+        texte = {art: TEXT_CACHE.get(k) for art, k in schluessel.items()}
+        fehlend = [art for art, t in texte.items() if t is None]
+        if fehlend:
+            for art, text in (await self._ausfuehren(generate, e, fehlend)).items():
+                TEXT_CACHE.put(schluessel[art], text)
+                texte[art] = text
+        return texte
+
+    async def metall(self, e: MetallEingabe) -> dict:
+        schluessel = canonical_key("metall_prompt", e)
+        ergebnis = TEXT_CACHE.get(schluessel)
+        if ergebnis is None:
+            ergebnis = await self._ausfuehren(_metall, e)
+            TEXT_CACHE.put(schluessel, ergebnis)
+        return {"prompt": ergebnis[0], "payload": ergebnis[1]}
+
+    async def batch(self, daten: dict) -> dict:
+        art = "buero" if "buero" in daten else "metall" if "metall" in daten else None
+        if art is None or not isinstance(daten[art], list):
+            raise HttpFehler(422, "Erwartet {\"buero\": [...]} oder {\"metall\": [...]}")
+        if len(daten[art]) > self.max_batch:
+            raise HttpFehler(413, f"Höchstens {self.max_batch} Datensätze je Batch")
+        arten = _arten(daten.get("arten")) if art == "buero" else None
+        klasse = BueroEingabe if art == "buero" else MetallEingabe
+        ergebnisse, gueltig = [], []
+        for nr, rec in enumerate(daten[art]):
+            rid = str(rec.get("id", nr + 1)) if isinstance(rec, dict) else str(nr + 1)
+            try:
+                gueltig.append((len(ergebnisse), _datensatz(rec, klasse)))
+                ergebnisse.append({"id": rid})
+            except HttpFehler as exc:
+                ergebnisse.append({"id": rid, "fehler": exc.meldung})
+        pakete = list(batched(gueltig, PAKET))
+        # Ein Batch belegt einen Platz in der Warteschlange; seine Pakete laufen darin zu höchstens
+        # so vielen gleichzeitig, wie es Worker gibt – statt mit Einzel-Requests um Plätze zu konkurrieren
+        gleichzeitig = asyncio.Semaphore(max(1, self.workers))
+
+        async def auftrag(p):
+            async with gleichzeitig:
+                if art == "buero":
+                    return await self._im_pool(_buero_paket, [e for _, e in p], arten)
+                return await self._im_pool(_metall_paket, [e for _, e in p])
+
+        async with self._platz():
+            fertig = await asyncio.gather(*(auftrag(p) for p in pakete))
+        for paket, texte in zip(pakete, fertig):
+            for (i, _), t in zip(paket, texte):
+                ergebnisse[i].update(t)
+        return {"ergebnisse": ergebnisse}
+
+    # ── ASGI ────────────────────────────────────────────────────────────────────
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        try:
+            status, body, typ = await self._route(scope, receive)
+        except HttpFehler as exc:
+            status, body, typ = exc.status, _json({"fehler": exc.meldung}), JSON
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", typ), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            msg = await receive()
+            if msg["type"] == "lifespan.startup":
+                self.starten()
+                await send({"type": "lifespan.startup.complete"})
+            elif msg["type"] == "lifespan.shutdown":
+                self.beenden()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _body(self, receive) -> dict:
+        teile, groesse = [], 0
+        while True:
+            msg = await receive()
+            teile.append(msg.get("body", b""))
+            groesse += len(teile[-1])
+            if groesse > self.max_bytes:
+                raise HttpFehler(413, f"Request größer als {self.max_bytes} Bytes")
+            if not msg.get("more_body"):
+                break
+        try:
+            daten = json.loads(b"".join(teile) or b"{}")
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise HttpFehler(400, f"Kein gültiges JSON: {exc}") from None
+        if not isinstance(daten, dict):
+            raise HttpFehler(422, "Body muss ein JSON-Objekt sein")
+        return daten
+
+    async def _route(self, scope, receive):
+        methode, pfad = scope["method"], scope["path"].rstrip("/") or "/"
+        if pfad == "/health":
+            if methode != "GET":
+                raise HttpFehler(405, "Nur GET")
+            return 200, _json({"status": "ok", "workers": self.workers, "cache": TEXT_CACHE.stats()}), JSON
+        if not pfad.startswith("/v1/"):
+            raise HttpFehler(404, f"Unbekannter Pfad {pfad}")
+        if methode != "POST":
+            raise HttpFehler(405, "Nur POST")
+        daten = await self._body(receive)
+
+        if pfad.startswith("/v1/buero/"):
+            art = pfad.rsplit("/", 1)[1]
+            if art not in GENERATOREN:
+                raise HttpFehler(404, f"Unbekannter Text {art!r} (erlaubt: {', '.join(GENERATOREN)})")
+            text = (await self.buero(_datensatz(daten, BueroEingabe), [art]))[art]
+            accept = dict(scope["headers"]).get(b"accept", b"")
+            if b"application/json" in accept:
+                return 200, _json({"text": text}), JSON
+            return 200, text.encode("utf-8"), TEXT
+        if pfad == "/v1/buero":
+            arten = _arten(daten.pop("arten", None))
+            return 200, _json(await self.buero(_datensatz(daten, BueroEingabe), arten)), JSON
+        if pfad == "/v1/metall":
+            return 200, _json(await self.metall(_datensatz(daten, MetallEingabe))), JSON
+        if pfad == "/v1/batch":
+            return 200, _json(await self.batch(daten)), JSON
+        raise HttpFehler(404, f"Unbekannter Pfad {pfad}")
+
+app = Api()
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m ausbildung.api", description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8000)
+    p.add_argument("--workers", type=int, default=None, help="Worker-Prozesse für das Rendern (0 = Threads im Server-Prozess)")
+    p.add_argument("--queue", type=int, default=None, help="Max. offene Aufträge, danach 503")
+    args = p.parse_args(argv)
+    try:
+        import uvicorn
+    except ImportError:
+        print("uvicorn fehlt: pip install uvicorn", file=sys.stderr)
+        return 1
+    uvicorn.run(Api(workers=args.workers, queue=args.queue), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Aufgabenbank für die Prüfungsübungen – ohne Streamlit.
+
+Aufgaben stehen in Textdateien (`ausbildung/aufgaben/*.txt`, eigene Dateien
+über `AUSBILDUNG_AUFGABEN`; gleichnamige ersetzen die mitgelieferten), eine
+Aufgabe pro Zeile:
+
+    Niveau | Lernfelder | Tools | Berufsschule | Aufgabe
+
+Beim ersten Zugriff werden invertierte Indizes aufgebaut: je Lernfeld, Tool,
+Berufsschulfach und Niveau ein Tupel von Aufgabennummern. Gezogen wird ohne
+Zustand und reproduzierbar: Die Nummern der passenden Aufgaben werden je
+Auswahl einmal ohne Doppelte zusammengeführt (gecacht), je Azubi mit einer
+festen Permutation gemischt (affin, O(1) je Zugriff) und in Fenster zu `k`
+bzw. `k − 1` Aufgaben geteilt; die Wochen gehen die Fenster reihum durch.
+Damit ist die Abdeckung durch die Wochennummer selbst festgehalten: Innerhalb
+jeder Folge so vieler Wochen, wie es Fenster gibt, kommt jede passende Aufgabe
+genau einmal – egal in welcher Reihenfolge Wochen erzeugt werden.
+"""
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from itertools import islice
+from math import gcd
+from pathlib import Path
+import hashlib
+import os
+import re
+import threading
+
+from ausbildung.eintraege import schluessel
+from ausbildung.katalog import normalisieren
+
+PAKET_DIR = Path(__file__).with_name("aufgaben")
+EXTERN_DIR = os.environ.get("AUSBILDUNG_AUFGABEN")
+ANZAHL = 3  # Aufgaben je Woche
+TAGS_JE_FELD = 24  # weitere Angaben eines Felds bestimmen die Auswahl nicht mehr
+
+DIMENSIONEN = ("lf", "tools", "schule")
+ALLGEMEIN = ("allgemein", "")
+_LF = re.compile(r"^lf\s*(\d+)\b")
+
+@lru_cache(maxsize=4096)  # Angaben kommen meist aus den Katalogen und wiederholen sich
+def tag(text: str) -> str:
+    """Vergleichsschlüssel: „LF 7 Kaufmännische …“ → „lf 7“, sonst normalisierter Text."""
+    n = schluessel(text)
+    if not n.isascii():
+        n = normalisieren(n)
+    if n.startswith("lf") and (m := _LF.match(n)):
+        return f"lf {m.group(1)}"
+    return n
+
+@dataclass(frozen=True)
+class Aufgabe:
+    nr: int
+    id: str  # stabil über Versionen der Datei: Hash des Aufgabentexts
+    text: str
+    niveau: int
+    lf: tuple[str, ...] = ()
+    tools: tuple[str, ...] = ()
+    schule: tuple[str, ...] = ()
+
+def _liste(feld: str) -> tuple[str, ...]:
+    return tuple(x.strip() for x in feld.split(";") if x.strip() and x.strip() != "-")
+
+def lies_aufgaben(pfad: Path):
+    """(Zeilennummer, Niveau, Lernfelder, Tools, Fächer, Text) je gültiger Zeile; ungültige Zeilen werfen ValueError."""
+    with open(pfad, encoding="utf-8") as fh:
+        for nr, zeile in enumerate(fh, start=1):
+            zeile = zeile.strip()
+            if not zeile or zeile.startswith("#"):
+                continue
+            teile = [t.strip() for t in zeile.split("|", 4)]
+            if len(teile) != 5 or not teile[0].isdigit() or not teile[4]:
+                raise ValueError(f"{pfad.name}:{nr}: erwartet „Niveau | Lernfelder | Tools | Berufsschule | Aufgabe“")
+            yield nr, int(teile[0]), _liste(teile[1]), _liste(teile[2]), _liste(teile[3]), teile[4]
+
+def woche_nr(tag_: date) -> int:
+    """Fortlaufende Wochennummer (Montag bis Sonntag)."""
+    return tag_.toordinal() // 7
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Bank
+# ────────────────────────────────────────────────────────────────────────────────
+class Aufgabenbank:
+    """Unveränderliche Aufgabenliste mit invertierten Indizes (Dimension, Schlüssel, Niveau) → Nummern."""
+
+    def __init__(self, aufgaben: Iterable[tuple[int, tuple, tuple, tuple, str]]):
+        self.aufgaben: list[Aufgabe] = []
+        index: dict[tuple[str, str], dict[int, list[int]]] = {}
+        gesehen = set()
+        for niveau, lf, tools, schule, text in aufgaben:
+            h = hashlib.sha256(text.encode("utf-8")).hexdigest()[:10]
+            if h in gesehen:
+                continue
+            gesehen.add(h)
+            a = Aufgabe(len(self.aufgaben), h, text, niveau, lf, tools, schule)
+            self.aufgaben.append(a)
+            tags = frozenset((dim, tag(x)) for dim in DIMENSIONEN for x in getattr(a, dim)) or frozenset([ALLGEMEIN])
+            for dim, k in tags:
+                index.setdefault((dim, k), {}).setdefault(niveau, []).append(a.nr)
+        self._index = {k: {n: tuple(nrs) for n, nrs in sorted(v.items())} for k, v in index.items()}
+        self._passend = lru_cache(maxsize=1024)(self._passend_berechnen)
+
+    def __len__(self):
+        return len(self.aufgaben)
+
+    def liste(self, dim: str, wert: str, niveaus: Iterable[int]) -> tuple[tuple[int, ...], ...]:
+        """Indexlisten zu einem Tag über mehrere Niveaus (ohne sie zusammenzukopieren)."""
+        je_niveau = self._index.get((dim, wert))
+        return tuple(je_niveau[n] for n in niveaus if n in je_niveau) if je_niveau else ()
+
+    def facetten(self) -> dict[str, dict[str, int]]:
+        """Anzahl Aufgaben je Dimension und Schlüssel (über alle Niveaus)."""
+        out: dict[str, dict[str, int]] = {}
+        for (dim, k), je_niveau in self._index.items():
+            out.setdefault(dim, {})[k] = sum(map(len, je_niveau.values()))
+        return out
+
+    def ziehe(self, azubi: str, woche: int, lf: Iterable[str] = (), tools: Iterable[str] = (),
+              schule: Iterable[str] = (), niveaus: Iterable[int] = (1, 2, 3), k: int = ANZAHL) -> list[Aufgabe]:
+        """
+        Bis zu `k` passende Aufgaben für `azubi` in Woche `woche` (siehe `woche_nr`).
+        Gleiche Argumente ergeben dieselben Aufgaben; ohne passende Einträge
+        kommen allgemeine Aufgaben.
+        """
+        namen, nrs = self.passend(lf, tools, schule, niveaus)
+        n = len(nrs)
+        if not n:
+            return []
+        seed = f"{azubi}\x1f" + "\x1e".join(f"{d}:{w}" for d, w in namen)
+        # Je Woche ein festes Fenster aus k bzw. k − 1 verschiedenen Aufgaben der gemischten Liste;
+        # die Fenster kommen reihum, so enthält jede Folge von `wochen` Wochen jede Aufgabe genau einmal
+        wochen = max(1, -(-n // k))
+        fenster = (woche + _permutation(seed, "versatz", wochen)[1]) % wochen
+        a, b = _permutation(seed, "mischung", n)
+        return [self.aufgaben[nrs[(a * i + b) % n]]
+                for i in range(fenster * n // wochen, (fenster + 1) * n // wochen)]
+
+    def passend(self, lf: Iterable[str] = (), tools: Iterable[str] = (), schule: Iterable[str] = (),
+                niveaus: Iterable[int] = (1, 2, 3)) -> tuple[tuple[tuple[str, str], ...], tuple[int, ...]]:
+        """(Namen der Indexlisten, Nummern der passenden Aufgaben ohne Doppelte) – je Auswahl gecacht."""
+        schluessel = tuple(dict.fromkeys(
+            (dim, tag(w)) for dim, werte in zip(DIMENSIONEN, (lf, tools, schule)) for w in islice(werte, TAGS_JE_FELD)
+        ))
+        return self._passend(schluessel, tuple(niveaus))
+
+    def _passend_berechnen(self, schluessel, niveaus):
+        listen = {name: teile for name in schluessel if (teile := self.liste(*name, niveaus))}
+        nrs = {nr for teile in listen.values() for t in teile for nr in t}
+        # Reichen die passenden Aufgaben nicht für eine Woche, kommen die allgemeinen dazu
+        if len(nrs) < ANZAHL and (teile := self.liste(*ALLGEMEIN, niveaus)):
+            listen[ALLGEMEIN] = teile
+            nrs.update(nr for t in teile for nr in t)
+        return tuple(sorted(listen)), tuple(sorted(nrs))
+
+def _permutation(seed: str, zweck: str, n: int) -> tuple[int, int]:
+    """(a, b) mit ggT(a, n) = 1: i ↦ (a·i + b) mod n ist eine Permutation von 0…n-1."""
+    h = hashlib.sha256(f"{seed}\x1f{zweck}".encode("utf-8")).digest()
+    a, b = int.from_bytes(h[:8], "big") % n or 1, int.from_bytes(h[8:16], "big") % n
+    while gcd(a, n) != 1:
+        a = a % n + 1
+    return a, b
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Laden (lazy, prozessweit)
+# ────────────────────────────────────────────────────────────────────────────────
+_bank: Aufgabenbank | None = None
+_lade_lock = threading.Lock()
+
+def aufgaben_dateien() -> list[Path]:
+    """Alle `*.txt` der Verzeichnisse; eigene Dateien ersetzen gleichnamige mitgelieferte."""
+    dateien = {}
+    for verzeichnis in (PAKET_DIR, EXTERN_DIR):
+        if verzeichnis and Path(verzeichnis).is_dir():
+            dateien.update({p.name: p for p in sorted(Path(verzeichnis).glob("*.txt"))})
+    return [dateien[k] for k in sorted(dateien)]
+
+def aufgabenbank() -> Aufgabenbank:
+    """Bank beim ersten Zugriff laden und indizieren, danach aus dem Speicher."""
+    global _bank
+    if _bank is None:
+        with _lade_lock:
+            if _bank is None:
+                _bank = Aufgabenbank(
+                    (niveau, lf, tools, schule, text)
+                    for pfad in aufgaben_dateien()
+                    for _, niveau, lf, tools, schule, text in lies_aufgaben(pfad)
+                )
+    return _bank
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Abdeckung
+# ────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class Abdeckung:
+    wochen: int
+    gezogen: int
+    verschieden: int
+    passend: int  # Aufgaben in den passenden Indexlisten
+    wiederholt: tuple[str, ...]  # IDs, die mehr als einmal kamen
+
+    @property
+    def anteil(self) -> float:
+        return self.verschieden / self.passend if self.passend else 0.0
+
+def abdeckung(bank: Aufgabenbank, azubi: str, wochen: Iterable[int], **auswahl) -> Abdeckung:
+    """Welche Aufgaben ein Azubi über mehrere Wochen bei gleicher Auswahl bekommt – zum Prüfen der Rotation."""
+    wochen = list(wochen)
+    gezogen = [a.id for w in wochen for a in bank.ziehe(azubi, w, **auswahl)]
+    passend = len(bank.passend(auswahl.get("lf", ()), auswahl.get("tools", ()), auswahl.get("schule", ()),
+                               auswahl.get("niveaus", (1, 2, 3)))[1])
+    zaehler: dict[str, int] = {}
+    for i in gezogen:
+        zaehler[i] = zaehler.get(i, 0) + 1
+    return Abdeckung(len(wochen), len(gezogen), len(zaehler), passend,
+                     tuple(sorted(i for i, n in zaehler.items() if n > 1)))
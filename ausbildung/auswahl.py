@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Katalog-Auswahl samt Freitext für die Eingabefelder beider Seiten.
+
+Kleine Kataloge (≤ `AUSBILDUNG_KATALOG_TOP_K`, Standard 50) erscheinen wie
+bisher vollständig im Multiselect. Große Kataloge bekommen ein Suchfeld; an den
+Browser gehen nur die besten Treffer plus die bereits gewählten Einträge.
+Suchfeld und Multiselect laufen als Fragment: Tippen im Suchfeld startet nur
+die Auswahl neu, erst eine geänderte Auswahl startet die ganze App neu.
+Innerhalb eines Formulars oder eines umgebenden Fragments (`fragment=False`)
+werden beide direkt gezeichnet – dort bündelt schon der Aufrufer die Reruns.
+"""
+import os
+
+import streamlit as st
+
+from ausbildung.eintraege import Eintraege, kombiniere
+from ausbildung.katalog import katalog
+
+TOP_K = int(os.environ.get("AUSBILDUNG_KATALOG_TOP_K", 50))
+
+def _katalog_felder(label: str, name: str, key: str) -> list[str]:
+    kat = katalog(name)
+    gewaehlt = list(st.session_state.get(key, []))
+    anfrage = st.text_input(
+        f"{label} · Suche ({len(kat):,} Einträge)".replace(",", "."),
+        key=f"{key}_suche",
+        placeholder="Suchbegriff … (Enter)",
+    )
+    optionen = list(dict.fromkeys([*gewaehlt, *kat.suche(anfrage, TOP_K)]))
+    return st.multiselect(f"{label} · Vorschläge (Mehrfachauswahl möglich)", options=optionen, key=key)
+
+@st.fragment
+def _katalog_suche(label: str, name: str, key: str):
+    ss = st.session_state
+    neu = _katalog_felder(label, name, key)
+    # Die Ausgaben hängen von der Auswahl ab – bei Änderung die ganze App neu ausführen
+    stand = f"{key}_stand"
+    if stand not in ss:
+        ss[stand] = neu
+    elif ss[stand] != neu:
+        ss[stand] = neu
+        st.rerun()
+
+def katalog_auswahl(label: str, name: str, key: str, fragment: bool = True) -> list[str]:
+    """Mehrfachauswahl aus Katalog `name`; liefert die gewählten Einträge."""
+    kat = katalog(name)
+    if len(kat) <= TOP_K:
+        ss = st.session_state
+        if key in ss and any(x not in kat for x in ss[key]):
+            ss[key] = [x for x in ss[key] if x in kat]  # z. B. aus einem Entwurf mit älterem Katalog
+        return st.multiselect(f"{label} · Vorschläge (Mehrfachauswahl möglich)", options=kat.eintraege, key=key)
+    if not fragment:
+        return _katalog_felder(label, name, key)
+    _katalog_suche(label, name, key)
+    return list(st.session_state.get(key, []))
+
+def mit_freitext(label: str, name: str, key_auswahl: str, key_text: str, height: int = 100,
+                 fragment: bool = True) -> Eintraege:
+    """Katalog-Auswahl plus Textfeld (eine Angabe pro Zeile); beides ohne Duplikate kombiniert."""
+    st.markdown(f"**{label}**")
+    gewaehlt = katalog_auswahl(label, name, key_auswahl, fragment)
+    frei = st.text_area(
+        f"{label} · Eigene Eingaben (eine pro Zeile)",
+        key=key_text,
+        height=height,
+        placeholder="Eigene Punkte je Zeile hinzufügen …",
+    )
+    # Freitext wird nur bei Änderung neu zerlegt (lru_cache in aus_freitext)
+    return kombiniere(gewaehlt, frei, katalog(name))
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Streamlit-Anbindung der Entwurfsablage (`ausbildung.entwuerfe`).
+
+Das Nutzerkürzel steht zusätzlich in der URL (`?nutzer=…`), damit ein
+Neuladen der Seite den letzten Entwurf wiederherstellt. Gespeichert werden
+die Widget-Werte der übergebenen Session-State-Schlüssel; geschrieben wird nur
+bei Änderung, verzögert und gebündelt über die prozessweite Ablage.
+
+    with st.sidebar:
+        autosave.seitenleiste("buero", FELDER)   # vor den Eingabe-Widgets
+    ...
+    autosave.merken("buero", FELDER, woche)      # am Skriptende
+
+Im Multipage-Einstieg (`Ausbildung.py`) ruft `seitenwechsel()` vor `pg.run()`
+die Widget-Werte aller bisher besuchten Seiten über den Seitenwechsel: Streamlit
+verwirft sonst den Zustand von Widgets, die in einem Lauf nicht gezeichnet werden.
+Das Kürzel gilt für beide Seiten, Wiederherstellung und Stand je App.
+"""
+import streamlit as st
+
+from ausbildung.entwuerfe import ablage, als_json
+
+def _anwenden(app: str, daten: dict, felder: tuple[str, ...]):
+    ss = st.session_state
+    for k in felder:
+        if k in daten:
+            v = daten[k]
+            ss[k] = tuple(v) if k == "zeitraum" else v
+    ss[f"_entwurf_stand_{app}"] = als_json({k: daten[k] for k in felder if k in daten})
+
+def _woche_laden(app: str, felder: tuple[str, ...]):
+    ss = st.session_state
+    woche = ss.get(f"_entwurf_woche_{app}")
+    if woche:
+        gefunden = ablage().lade(ss["_entwurf_nutzer"], app, woche)
+        if gefunden:
+            _anwenden(app, gefunden[1], felder)
+    ss[f"_entwurf_woche_{app}"] = None
+
+def seitenleiste(app: str, felder: tuple[str, ...]) -> str:
+    """Kürzel-Feld und Wochenverlauf; stellt beim ersten Lauf den letzten Entwurf wieder her."""
+    ss = st.session_state
+    ss.setdefault("_seiten_felder", set()).update(felder)
+    ss.setdefault("_entwurf_nutzer", st.query_params.get("nutzer", ""))
+    nutzer = st.text_input(
+        "👤 Kürzel (für Entwürfe)", key="_entwurf_nutzer",
+        help="Eingaben werden lokal je Kürzel und Kalenderwoche gespeichert – ohne Kürzel nicht.",
+    ).strip()
+    if not nutzer:
+        st.query_params.pop("nutzer", None)
+        return ""
+    st.query_params["nutzer"] = nutzer
+    if ss.get(f"_entwurf_geladen_{app}") != nutzer:
+        gefunden = ablage().lade(nutzer, app)
+        if gefunden:
+            _anwenden(app, gefunden[1], felder)
+            st.caption(f"Entwurf {gefunden[0]} wiederhergestellt.")
+        ss[f"_entwurf_geladen_{app}"] = nutzer
+    wochen = ablage().wochen(nutzer, app)
+    if wochen:
+        zeiten = dict(wochen)
+        st.selectbox(
+            "🗂️ Frühere Woche laden", [w for w, _ in wochen], index=None, key=f"_entwurf_woche_{app}",
+            placeholder="Kalenderwoche wählen …",
+            format_func=lambda w: f"{w} · {zeiten[w]:%d.%m.%Y %H:%M}",
+            on_change=_woche_laden, args=(app, felder),
+        )
+    return nutzer
+
+def merken(app: str, felder: tuple[str, ...], woche: str):
+    """Am Skriptende: geänderte Eingaben zum Speichern vormerken."""
+    ss = st.session_state
+    nutzer = ss.get("_entwurf_nutzer", "").strip()
+    if not nutzer:
+        return
+    daten = {k: ss[k] for k in felder if k in ss}
+    stand = als_json(daten)
+    if stand != ss.get(f"_entwurf_stand_{app}"):
+        ablage().speichere(nutzer, app, woche, daten)
+        ss[f"_entwurf_stand_{app}"] = stand
+
+def seitenwechsel():
+    """Im Multipage-Einstieg vor `pg.run()`: Eingaben der anderen Seiten behalten."""
+    ss = st.session_state
+    for k in ("_entwurf_nutzer", *ss.get("_seiten_felder", ())):
+        if k in ss:
+            ss[k] = ss[k]  # Zuweisung macht aus dem Widget-Wert normalen Session State
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Inhaltsadressierter Cache für erzeugte Texte (Büro- und Metall-App).
+
+Gleiche Eingaben ergeben immer denselben Text. Der Schlüssel ist ein Hash über
+die kanonisch normalisierten Eingaben (sortierte Schlüssel, Tupel = Listen,
+Datumswerte als ISO-String), der Cache ist prozessweit geteilt – also auch
+über Streamlit-Sessions hinweg – und wird per LRU nach Anzahl und Bytes begrenzt.
+
+Konfiguration über Umgebungsvariablen:
+    AUSBILDUNG_CACHE_MAX_ENTRIES   (Standard 2048)
+    AUSBILDUNG_CACHE_MAX_BYTES     (Standard 32 MiB)
+"""
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from datetime import date
+import hashlib
+import json
+import os
+import threading
+
+def _normalisieren(obj):
+    if is_dataclass(obj) and not isinstance(obj, type):
+        obj = asdict(obj)
+    if isinstance(obj, dict):
+        return {str(k): _normalisieren(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_normalisieren(x) for x in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted(_normalisieren(x) for x in obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return obj
+
+def canonical_key(kind: str, daten) -> str:
+    """Stabiler Hash über `kind` und die normalisierten Eingaben."""
+    roh = json.dumps(_normalisieren(daten), sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return f"{kind}:{hashlib.sha256(roh.encode('utf-8')).hexdigest()}"
+
+def groesse(value) -> int:
+    """Ungefährer Speicherbedarf in Bytes (UTF-8-Länge, sonst JSON-Länge)."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (tuple, list)):
+        return sum(groesse(x) for x in value)
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+class TextCache:
+    """Threadsicherer LRU-Cache mit Begrenzung nach Einträgen und Bytes."""
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()  # key -> (value, bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            eintrag = self._data.get(key)
+            if eintrag is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return eintrag[0]
+
+    def put(self, key: str, value):
+        size = groesse(value)
+        with self._lock:
+            alt = self._data.pop(key, None)
+            if alt is not None:
+                self._bytes -= alt[1]
+            if size > self.max_bytes:
+                return  # passt nie hinein – nicht cachen
+            self._data[key] = (value, size)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, s) = self._data.popitem(last=False)
+                self._bytes -= s
+                self.evictions += 1
+
+    def get_or_create(self, kind: str, daten, erzeugen):
+        """Wert für (`kind`, `daten`) liefern, bei Fehltreffer `erzeugen()` aufrufen und ablegen."""
+        key = canonical_key(kind, daten)
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = erzeugen()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            anfragen = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / anfragen, 3) if anfragen else None,
+            }
+
+TEXT_CACHE = TextCache(
+    max_entries=int(os.environ.get("AUSBILDUNG_CACHE_MAX_ENTRIES", 2048)),
+    max_bytes=int(os.environ.get("AUSBILDUNG_CACHE_MAX_BYTES", 32 * 1024 * 1024)),
+)
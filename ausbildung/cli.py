@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Batch-Erzeugung ohne Streamlit.
+
+Liest Eingabe-Datensätze zeilenweise aus JSONL oder CSV, verteilt sie auf einen
+Prozess-Pool und schreibt die Ergebnisse sofort (in Eingabereihenfolge) weg –
+auch bei hunderten Azubis × 52 Wochen bleibt der Speicherbedarf konstant.
+
+Beispiele:
+    python -m ausbildung.cli wochen.jsonl -o ergebnisse.jsonl
+    python -m ausbildung.cli wochen.csv -o ausgabe/ --arten berichtsheft --workers 8
+    python -m ausbildung.cli jahrgang.jsonl -o ausgabe/ --wochen --land BY --schultage Mo,Do
+
+CSV: eine Spalte je Feld (`id`, `modus`, `date_from`, `date_to`, `lf`, …);
+Listen in einer Zelle durch `|` oder Zeilenumbruch trennen.
+
+Mit `--wochen` ist `date_from`–`date_to` der Ausbildungszeitraum: Je Kalenderwoche
+entsteht ein eigener Datensatz (`<id>_2024-W36`). Optionale Felder dafür: `land`,
+`schultage` („Mo|Do“), `ferien` und `urlaub` („2024-12-23:2025-01-03|…“).
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from ausbildung.engine import BueroEingabe, GENERATOREN, generate
+from ausbildung.kalender import LAENDER, Kalender, parse_wochentage, parse_zeitraeume
+from ausbildung.parallel import batched, bounded_map
+from ausbildung.text import parse_datum
+
+DATEIENDUNG = {"berichtsheft": "md", "arbeitsauftrag": "txt", "pruefung": "md"}
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Ein- und Ausgabe
+# ────────────────────────────────────────────────────────────────────────────────
+def read_records(path: str):
+    """Datensätze lazy lesen; liefert (id, dict) – Zeilennummer als Fallback-ID."""
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8", newline="")
+    try:
+        if path.lower().endswith(".csv"):
+            for nr, row in enumerate(csv.DictReader(stream), start=1):
+                rec = {k: v for k, v in row.items() if k and v not in (None, "")}
+                yield str(rec.get("id", nr)), rec
+        else:
+            for nr, line in enumerate(stream, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    rec = {"_fehler": f"Zeile {nr}: kein gültiges JSON ({exc.msg})"}
+                if not isinstance(rec, dict):
+                    rec = {"_fehler": f"Zeile {nr}: kein JSON-Objekt ({type(rec).__name__})"}
+                yield str(rec.get("id", nr)), rec
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def in_wochen(records, land: str, schultage: tuple[int, ...]):
+    """Datensätze mit Ausbildungszeitraum lazy in einen Datensatz je Kalenderwoche aufteilen."""
+    for rid, rec in records:
+        if "_fehler" in rec:
+            yield rid, rec
+            continue
+        rec = dict(rec)
+        try:
+            if not rec.get("date_from"):
+                raise ValueError("Feld 'date_from' fehlt")
+            kal = Kalender(
+                parse_datum(rec["date_from"]),
+                parse_datum(rec.get("date_to") or rec["date_from"]),
+                land=rec.pop("land", land),
+                schultage=parse_wochentage(rec.pop("schultage", schultage)),
+                ferien=parse_zeitraeume(rec.pop("ferien", "")),
+                urlaub=parse_zeitraeume(rec.pop("urlaub", "")),
+            )
+        except ValueError as exc:
+            yield rid, {"_fehler": str(exc)}
+            continue
+        for woche in kal.wochen():
+            yield f"{rid}_{woche.schluessel}", {**rec, "date_from": woche.von, "date_to": woche.bis}
+
+class JsonlWriter:
+    """Ein Ergebnis pro Zeile: {"id": …, "berichtsheft": …} bzw. {"id": …, "fehler": …}."""
+
+    def __init__(self, path: str):
+        self.fh = sys.stdout if path == "-" else open(path, "w", encoding="utf-8")
+
+    def write(self, rid: str, result: dict):
+        self.fh.write(json.dumps({"id": rid, **result}, ensure_ascii=False) + "\n")
+
+    def close(self):
+        if self.fh is not sys.stdout:
+            self.fh.close()
+
+class DirWriter:
+    """Eine Datei je Datensatz und Text (`<id>_<art>.md`), Fehler gesammelt in `fehler.jsonl`."""
+
+    def __init__(self, path: str):
+        self.root = Path(path)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.errors = None
+
+    def write(self, rid: str, result: dict):
+        if "fehler" in result:
+            if self.errors is None:
+                self.errors = open(self.root / "fehler.jsonl", "w", encoding="utf-8")
+            self.errors.write(json.dumps({"id": rid, **result}, ensure_ascii=False) + "\n")
+            return
+        safe_id = "".join(c if c.isalnum() or c in "-_." else "_" for c in rid)
+        for art, txt in result.items():
+            (self.root / f"{safe_id}_{art}.{DATEIENDUNG[art]}").write_text(txt + "\n", encoding="utf-8")
+
+    def close(self):
+        if self.errors is not None:
+            self.errors.close()
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Verarbeitung
+# ────────────────────────────────────────────────────────────────────────────────
+def process_batch(batch: list[tuple[str, dict]], arten: list[str]) -> list[tuple[str, dict]]:
+    """Läuft im Worker: ein Paket Datensätze erzeugen, Fehler pro Datensatz abfangen."""
+    out = []
+    for rid, rec in batch:
+        try:
+            if "_fehler" in rec:
+                raise ValueError(rec["_fehler"])
+            out.append((rid, generate(BueroEingabe.from_record(rec), arten)))
+        except (ValueError, TypeError) as exc:
+            out.append((rid, {"fehler": str(exc)}))
+    return out
+
+def run(records, writer, arten: list[str], workers: int, batch_size: int, progress_every: int = 0) -> dict:
+    """Alle Datensätze verarbeiten und Durchsatzkennzahlen zurückgeben."""
+    start = time.perf_counter()
+    total = errors = 0
+    next_report = progress_every
+    batches = batched(records, batch_size)
+
+    def consume(results):
+        nonlocal total, errors, next_report
+        for batch_result in results:
+            for rid, result in batch_result:
+                writer.write(rid, result)
+                total += 1
+                errors += "fehler" in result
+            if progress_every and total >= next_report:
+                rate = total / max(time.perf_counter() - start, 1e-9)
+                print(f"… {total} Datensätze ({rate:,.0f}/s)", file=sys.stderr)
+                next_report = total + progress_every
+
+    if workers <= 1:
+        consume(process_batch(b, arten) for b in batches)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            consume(bounded_map(ex, _Job(arten), batches, max_pending=workers * 4))
+
+    seconds = time.perf_counter() - start
+    return {
+        "datensaetze": total,
+        "fehler": errors,
+        "sekunden": round(seconds, 3),
+        "datensaetze_pro_s": round(total / seconds, 1) if seconds else None,
+    }
+
+class _Job:
+    """Picklebarer Aufruf von `process_batch` mit fester Auswahl der Texte."""
+
+    def __init__(self, arten: list[str]):
+        self.arten = arten
+
+    def __call__(self, batch):
+        return process_batch(batch, self.arten)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Kommandozeile
+# ────────────────────────────────────────────────────────────────────────────────
+def parse_arten(value: str) -> list[str]:
+    arten = [a.strip() for a in value.split(",") if a.strip()]
+    unbekannt = [a for a in arten if a not in GENERATOREN]
+    if unbekannt or not arten:
+        raise argparse.ArgumentTypeError(f"Erlaubt: {', '.join(GENERATOREN)}")
+    return arten
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m ausbildung.cli", description=__doc__.split("\n\n")[0].strip(),
+                                formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("input", help="Eingabedatei (.jsonl oder .csv, '-' für stdin)")
+    p.add_argument("-o", "--output", default="-",
+                   help="Ziel: .jsonl-Datei, Verzeichnis (eine Datei je Text) oder '-' für stdout")
+    p.add_argument("--arten", type=parse_arten, default=GENERATOREN,
+                   help=f"Kommagetrennt, Standard: {','.join(GENERATOREN)}")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Anzahl Worker-Prozesse (1 = ohne Pool)")
+    p.add_argument("--batch-size", type=int, default=64, help="Datensätze pro Auftrag an einen Worker")
+    p.add_argument("--progress", type=int, default=0, metavar="N", help="Zwischenstand alle N Datensätze")
+    p.add_argument("--wochen", action="store_true", help="Zeitraum je Datensatz in Kalenderwochen aufteilen")
+    p.add_argument("--land", choices=list(LAENDER), default="NW", help="Bundesland für Feiertage (mit --wochen)")
+    p.add_argument("--schultage", type=parse_wochentage, default=(), help="Berufsschultage, z. B. Mo,Do (mit --wochen)")
+    args = p.parse_args(argv)
+
+    if args.output == "-" or args.output.lower().endswith(".jsonl"):
+        writer = JsonlWriter(args.output)
+    else:
+        writer = DirWriter(args.output)
+    try:
+        records = read_records(args.input)
+        if args.wochen:
+            records = in_wochen(records, args.land, args.schultage)
+        stats = run(records, writer, args.arten, args.workers, args.batch_size, args.progress)
+    finally:
+        writer.close()
+    print(
+        f"{stats['datensaetze']} Datensätze in {stats['sekunden']} s "
+        f"({stats['datensaetze_pro_s']}/s), {stats['fehler']} Fehler",
+        file=sys.stderr,
+    )
+    return 1 if stats["fehler"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
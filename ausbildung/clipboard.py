@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Gemeinsamer Copy-Button für beide Apps.
+
+HTML/CSS/JS sind statisch und werden einmal pro Streamlit-Runtime als
+`st.components.v2`-Komponente registriert; pro Rerun geht nur `data`
+(Text + Beschriftung) an den Browser. Die Komponente hängt direkt im DOM der
+Seite – kein iframe je Button, kein erneut zusammengebautes HTML-Dokument.
+"""
+import streamlit as st
+from streamlit.components.v2 import get_bidi_component_manager
+
+_HTML = """
+<div class="copy">
+  <button type="button"></button>
+  <span class="status"></span>
+</div>
+"""
+
+_CSS = """
+.copy { display: flex; gap: .5rem; align-items: center; }
+button {
+  padding: .5rem .75rem; border: 1px solid #ddd; border-radius: .5rem; cursor: pointer;
+  background: var(--st-background-color); color: var(--st-text-color); font: inherit;
+}
+.status { font-size: .9rem; opacity: .8; }
+"""
+
+# Nutzt navigator.clipboard; fällt bei restriktiven Browsern auf Auswahl+Copy zurück.
+_JS = """
+export default function({ parentElement, data }) {
+  const btn = parentElement.querySelector("button");
+  const status = parentElement.querySelector(".status");
+  btn.textContent = data.label;
+  const melden = (msg, ms) => {
+    status.textContent = msg;
+    setTimeout(() => { status.textContent = ""; }, ms);
+  };
+  btn.onclick = async () => {
+    try {
+      if (navigator.clipboard && window.isSecureContext) {
+        await navigator.clipboard.writeText(data.text);
+      } else {
+        const ta = document.createElement("textarea");
+        ta.value = data.text;
+        ta.style.position = "fixed";
+        ta.style.left = "-9999px";
+        document.body.appendChild(ta);
+        ta.focus();
+        ta.select();
+        document.execCommand("copy");
+        document.body.removeChild(ta);
+      }
+      melden("Kopiert!", 2000);
+    } catch (e) {
+      melden("Kopieren fehlgeschlagen – Text markieren und manuell kopieren (Ctrl/Cmd+C).", 4000);
+    }
+  };
+}
+"""
+
+_registriert = (None, None)  # (Komponenten-Manager der Runtime, Mount-Funktion)
+
+def _komponente():
+    """Komponente einmal je Runtime registrieren – die Registry hängt an der Runtime, nicht am Modul."""
+    global _registriert
+    manager = get_bidi_component_manager()
+    if _registriert[0] is not manager:
+        _registriert = (manager, st.components.v2.component("ausbildung_clipboard", html=_HTML, css=_CSS, js=_JS))
+    return _registriert[1]
+
+def copy_button(text: str, key: str, label: str = "📋 In Zwischenablage"):
+    """Copy-Button; der Text wird genau einmal als Komponenten-Daten übertragen."""
+    _komponente()(data={"text": text, "label": label}, key=f"copy_{key}")
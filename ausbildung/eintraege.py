@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Kompaktes Modell für Listenfelder (Lernfelder, Tätigkeiten, Verfahren …).
+
+Ein Listenfeld besteht aus Katalog-Vorschlägen und eigenen Freitextzeilen.
+`Eintrag` hält den Text, den Vergleichsschlüssel und – bei Vorschlägen – die
+Position im Katalog; der Text ist dann der internierte Katalogstring, den sich
+alle Sessions teilen. `Eintraege` ist das unveränderliche, duplikatfreie
+Tupel daraus, das Generatoren und Payload über `.texte` lesen.
+
+Duplikate werden über `schluessel` (casefold, Leerraum zusammengefasst)
+erkannt: „MS Excel“ gewählt und „ms  excel“ getippt ergibt einen Eintrag, der
+zuerst genannte gewinnt. Freitext wird nur zerlegt, wenn er sich ändert.
+"""
+from functools import cached_property, lru_cache
+import sys
+
+from ausbildung.text import zeilen
+
+def schluessel(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+class Eintrag:
+    """Ein Listeneintrag; `katalog_id` ist None bei Freitext."""
+    __slots__ = ("text", "schluessel", "katalog_id")
+
+    def __init__(self, text: str, katalog_id: int | None = None):
+        self.text = text
+        self.schluessel = schluessel(text)
+        self.katalog_id = katalog_id
+
+    def __eq__(self, other):
+        return isinstance(other, Eintrag) and self.schluessel == other.schluessel
+
+    def __hash__(self):
+        return hash(self.schluessel)
+
+    def __str__(self):
+        return self.text
+
+    def __copy__(self):
+        return self  # unveränderlich – auch `dataclasses.asdict` muss nicht kopieren
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"Eintrag({self.text!r}, katalog_id={self.katalog_id})"
+
+class Eintraege(tuple):
+    """Duplikatfreies Tupel von `Eintrag` in Eingabereihenfolge."""
+
+    def __new__(cls, eintraege=()):
+        gesehen = set()
+        eindeutig = []
+        for e in eintraege:
+            if not isinstance(e, Eintrag):
+                e = Eintrag(str(e).strip())
+            if e.schluessel and e.schluessel not in gesehen:
+                gesehen.add(e.schluessel)
+                eindeutig.append(e)
+        return super().__new__(cls, eindeutig)
+
+    @cached_property
+    def texte(self) -> tuple[str, ...]:
+        return tuple(e.text for e in self)
+
+    def __add__(self, other):
+        return Eintraege(tuple.__add__(self, other))
+
+    def __repr__(self):
+        return f"Eintraege({list(self.texte)!r})"
+
+@lru_cache(maxsize=512)
+def aus_freitext(text: str) -> Eintraege:
+    """Freitext (eine Angabe pro Zeile) zerlegen – je Text nur einmal."""
+    return Eintraege(Eintrag(sys.intern(x)) for x in zeilen(text))
+
+def aus_auswahl(auswahl, kat=None) -> Eintraege:
+    """Gewählte Vorschläge; mit Katalog werden Texte auf dessen internierte Strings abgebildet."""
+    if kat is None:
+        return Eintraege(auswahl)
+    out = []
+    for text in auswahl:
+        i = kat.id(text)
+        out.append(Eintrag(text) if i is None else Eintrag(kat.eintraege[i], i))
+    return Eintraege(out)
+
+def kombiniere(auswahl, freitext: str, kat=None) -> Eintraege:
+    """Vorschläge und eigene Zeilen eines Feldes zusammenführen (ohne Duplikate)."""
+    return aus_auswahl(auswahl, kat) + aus_freitext(freitext or "")
+
+def listenwerte(name: str, wert) -> list[str]:
+    """Listenfeld eines Datensatzes (JSONL/CSV/API) prüfen: Einträge müssen Text oder Zahlen sein, `null` fällt weg."""
+    if not isinstance(wert, (list, tuple)):
+        raise ValueError(f"Feld {name!r} muss eine Liste oder Text sein")
+    for x in wert:
+        if x is not None and (isinstance(x, bool) or not isinstance(x, (str, int, float))):
+            raise ValueError(f"Feld {name!r}: Einträge müssen Text sein, nicht {type(x).__name__}")
+    return [str(x) for x in wert if x is not None]
+
+def aus_datensatz(name: str, wert) -> Eintraege:
+    """Listenfeld eines Datensatzes: Liste oder Text (eine Angabe pro Zeile bzw. durch `|` getrennt)."""
+    if wert is None:
+        return Eintraege()
+    if isinstance(wert, str):
+        return aus_freitext(wert.replace("|", "\n"))
+    return Eintraege(listenwerte(name, wert))
+
+def als_eintraege(obj, felder):
+    """Für `__post_init__` eingefrorener Dataclasses: Listenfelder zu `Eintraege` wandeln."""
+    for name in felder:
+        wert = getattr(obj, name)
+        if not isinstance(wert, Eintraege):
+            object.__setattr__(obj, name, Eintraege(wert))
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Headless-Generatoren für Berichtsheft, Arbeitsauftrag und Prüfungsübungen.
+
+Das Modul importiert kein Streamlit: Alle Eingaben kommen als `BueroEingabe`
+herein, damit dieselben Texte in der App, im CLI (Batch für ganze Jahrgänge)
+und in Worker-Prozessen erzeugt werden können.
+"""
+from dataclasses import dataclass, fields, replace
+from datetime import date
+
+from ausbildung.aufgabenbank import aufgabenbank, woche_nr
+from ausbildung.cache import TEXT_CACHE
+from ausbildung.eintraege import Eintraege, als_eintraege, aus_datensatz
+from ausbildung.kalender import Kalender
+from ausbildung.text import zeilen, bullet, section, daterange_str, parse_datum  # noqa: F401 (Re-Export)
+from ausbildung.vorlage import lade
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Konstanten
+# ────────────────────────────────────────────────────────────────────────────────
+MODI = ["Ausbildung (Büromanagement)", "Berufsvorbereitung"]
+
+# Niveaus der Aufgabenbank je Modus (1 = Einstieg, 2 = Ausbildung, 3 = prüfungsnah)
+PRUEFUNGSNIVEAUS = {MODI[0]: (2, 3), MODI[1]: (1,)}
+
+GENERATOREN = ["berichtsheft", "arbeitsauftrag", "pruefung"]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Eingabe-Datensatz
+# ────────────────────────────────────────────────────────────────────────────────
+LISTENFELDER = ("lf", "taetigkeiten", "tools", "kompetenzen", "nachweise", "schule")
+
+@dataclass(frozen=True)
+class BueroEingabe:
+    """Alle Eingaben einer Berichtswoche – unabhängig von Streamlit. Listenfelder werden zu `Eintraege`."""
+    modus: str
+    date_from: date
+    date_to: date
+    lf: Eintraege = Eintraege()
+    taetigkeiten: Eintraege = Eintraege()
+    tools: Eintraege = Eintraege()
+    kompetenzen: Eintraege = Eintraege()
+    nachweise: Eintraege = Eintraege()
+    schule: Eintraege = Eintraege()
+    azubi: str = ""  # Kürzel – Seed für die Aufgabenauswahl
+
+    def __post_init__(self):
+        als_eintraege(self, LISTENFELDER)
+
+    @classmethod
+    def from_record(cls, rec: dict) -> "BueroEingabe":
+        """
+        Datensatz aus JSONL/CSV übernehmen.
+        Listenfelder dürfen Listen oder Text (eine Angabe pro Zeile bzw. durch `|` getrennt) sein.
+        """
+        bekannte = {f.name for f in fields(cls)}
+        unbekannt = set(rec) - bekannte - {"id"}
+        if unbekannt:
+            raise ValueError(f"Unbekannte Felder: {', '.join(sorted(unbekannt))}")
+        modus = rec.get("modus") or MODI[0]
+        if modus not in MODI:
+            raise ValueError(f"Ungültiger Modus: {modus!r}")
+        if not rec.get("date_from"):
+            raise ValueError("Feld 'date_from' fehlt")
+        d1 = parse_datum(rec["date_from"])
+        d2 = parse_datum(rec.get("date_to") or d1)
+        if d1 > d2:
+            raise ValueError("Das Startdatum liegt nach dem Enddatum.")
+        listen = {name: aus_datensatz(name, rec.get(name)) for name in LISTENFELDER}
+        return cls(modus=modus, date_from=d1, date_to=d2, azubi=str(rec.get("azubi") or "").strip(), **listen)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Generatoren (Wortlaut in ausbildung/vorlagen/*.txt, beim Import kompiliert)
+# ────────────────────────────────────────────────────────────────────────────────
+VORLAGEN = {art: lade(art) for art in GENERATOREN}
+
+def vorlagen_kontext(e: BueroEingabe) -> dict:
+    return {
+        "modus": e.modus,
+        "zeitraum": daterange_str(e.date_from, e.date_to),
+        "lf": e.lf.texte,
+        "taetigkeiten": e.taetigkeiten.texte,
+        "tools": e.tools.texte,
+        "kompetenzen": e.kompetenzen.texte,
+        "nachweise": e.nachweise.texte,
+        "schule": e.schule.texte,
+    }
+
+def pruefungsaufgaben(e: BueroEingabe) -> list[str]:
+    """Aufgaben der Woche aus der Aufgabenbank – passend zu Lernfeldern, Tools und Berufsschule, je Azubi rotierend."""
+    return [a.text for a in aufgabenbank().ziehe(
+        e.azubi, woche_nr(e.date_from), e.lf.texte, e.tools.texte, e.schule.texte, PRUEFUNGSNIVEAUS[e.modus])]
+
+def gen_berichtsheft(e: BueroEingabe, zustand: dict | None = None) -> str:
+    return VORLAGEN["berichtsheft"].render(vorlagen_kontext(e), zustand, strip=True)
+
+def gen_arbeitsauftrag(e: BueroEingabe, zustand: dict | None = None) -> str:
+    return VORLAGEN["arbeitsauftrag"].render(vorlagen_kontext(e), zustand, strip=True)
+
+def gen_pruefung(e: BueroEingabe, zustand: dict | None = None) -> str:
+    return VORLAGEN["pruefung"].render({**vorlagen_kontext(e), "aufgaben": pruefungsaufgaben(e)}, zustand, strip=True)
+
+# Welche Eingabefelder in welchen Text einfließen – Grundlage für Teil-Neuberechnungen
+ABHAENGIGKEITEN = {
+    "berichtsheft": ("modus", "date_from", "date_to", *LISTENFELDER),
+    "arbeitsauftrag": ("modus", "date_from", "date_to", "lf", "taetigkeiten", "tools", "kompetenzen", "nachweise"),
+    "pruefung": ("modus", "date_from", "date_to", "lf", "tools", "schule", "azubi"),
+}
+
+def eingabe_schluessel(e: BueroEingabe, art: str) -> dict:
+    """Nur die Felder, von denen der Text `art` abhängt."""
+    return {name: getattr(e, name) for name in ABHAENGIGKEITEN[art]}
+
+GENERATOR_FUNKTIONEN = {
+    "berichtsheft": gen_berichtsheft,
+    "arbeitsauftrag": gen_arbeitsauftrag,
+    "pruefung": gen_pruefung,
+}
+
+def erzeuge(art: str, e: BueroEingabe, cache=TEXT_CACHE, zustand: dict | None = None) -> str:
+    """
+    Text über den gemeinsamen Cache erzeugen. Schlüssel sind nur die Felder, von
+    denen `art` abhängt – eine Änderung an „Berufsschule“ trifft z. B. den
+    Arbeitsauftrag nicht. Bei einem Fehltreffer rendert `zustand` (je Nutzer und
+    Text) nur die Vorlagen-Abschnitte neu, deren Felder sich geändert haben.
+    """
+    return cache.get_or_create(art, eingabe_schluessel(e, art), lambda: GENERATOR_FUNKTIONEN[art](e, zustand))
+
+def generate(e: BueroEingabe, arten: list[str] = GENERATOREN) -> dict[str, str]:
+    """Die gewünschten Texte für einen Datensatz erzeugen."""
+    return {art: GENERATOR_FUNKTIONEN[art](e) for art in arten}
+
+def berichtswochen(e: BueroEingabe, kal: Kalender):
+    """(Woche, Datensatz) je Kalenderwoche von `kal` – Zeitraum passend zur Woche, sonst wie `e`."""
+    for woche in kal.wochen():
+        yield woche, replace(e, date_from=woche.von, date_to=woche.bis)
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Lokale Entwurfsablage (SQLite) für die Eingaben beider Apps – ohne Streamlit.
+
+Je Nutzerkürzel, App und ISO-Woche (`2024-W36`) wird ein Entwurf als JSON
+gespeichert. Eine Verbindung je Prozess (WAL, von allen Sessions geteilt);
+Autosaves werden gesammelt und nach `AUSBILDUNG_AUTOSAVE_S` Sekunden Ruhe in
+einer Transaktion geschrieben – je Schlüssel gewinnt der letzte Stand.
+
+Konfiguration über Umgebungsvariablen:
+    AUSBILDUNG_DB            (Standard: ausbildung.sqlite3)
+    AUSBILDUNG_AUTOSAVE_S    (Standard 2.0)
+"""
+from datetime import date, datetime
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DB_PFAD = os.environ.get("AUSBILDUNG_DB", "ausbildung.sqlite3")
+VERZOEGERUNG = float(os.environ.get("AUSBILDUNG_AUTOSAVE_S", 2.0))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entwuerfe (
+    nutzer    TEXT NOT NULL,
+    app       TEXT NOT NULL,
+    woche     TEXT NOT NULL,
+    daten     TEXT NOT NULL,
+    geaendert REAL NOT NULL,
+    PRIMARY KEY (nutzer, app, woche)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entwuerfe_zuletzt ON entwuerfe (nutzer, app, geaendert);
+"""
+
+def iso_woche(d: date) -> str:
+    jahr, woche, _ = d.isocalendar()
+    return f"{jahr}-W{woche:02d}"
+
+# Datumswerte (Zeitraum) verlustfrei durch JSON bringen
+def _kodieren(obj):
+    if isinstance(obj, date):
+        return {"$date": obj.isoformat()}
+    raise TypeError(f"nicht speicherbar: {type(obj).__name__}")
+
+def _dekodieren(d: dict):
+    return date.fromisoformat(d["$date"]) if d.keys() == {"$date"} else d
+
+def als_json(daten: dict) -> str:
+    return json.dumps(daten, ensure_ascii=False, sort_keys=True, default=_kodieren)
+
+def aus_json(text: str) -> dict:
+    return json.loads(text, object_hook=_dekodieren)
+
+class Entwurfsablage:
+    """SQLite-Ablage mit gebündeltem, verzögertem Schreiben."""
+
+    def __init__(self, pfad: str = DB_PFAD, verzoegerung: float = VERZOEGERUNG):
+        self.pfad = pfad
+        self.verzoegerung = verzoegerung
+        self._db = None
+        self._lock = threading.Lock()        # Verbindung
+        self._offen_lock = threading.Lock()  # Warteschlange
+        self._offen = {}  # (nutzer, app, woche) -> (json, zeit)
+        self._letzte_aenderung = 0.0
+        self._wecker = threading.Event()
+        self._schreiber = None
+        self.geschrieben = self.transaktionen = 0
+
+    def _verbindung(self) -> sqlite3.Connection:
+        if self._db is None:
+            db = sqlite3.connect(self.pfad, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(SCHEMA)
+            self._db = db
+        return self._db
+
+    # ── Schreiben ───────────────────────────────────────────────────────────────
+    def speichere(self, nutzer: str, app: str, woche: str, daten: dict):
+        """Entwurf vormerken; geschrieben wird gebündelt nach `verzoegerung` Sekunden Ruhe."""
+        eintrag = (als_json(daten), time.time())
+        with self._offen_lock:
+            self._offen[(nutzer, app, woche)] = eintrag
+            self._letzte_aenderung = time.monotonic()
+            if self._schreiber is None or not self._schreiber.is_alive():
+                self._schreiber = threading.Thread(target=self._schreibschleife, name="entwuerfe", daemon=True)
+                self._schreiber.start()
+        self._wecker.set()
+
+    def _schreibschleife(self):
+        while True:
+            self._wecker.wait()
+            self._wecker.clear()
+            while (rest := self._letzte_aenderung + self.verzoegerung - time.monotonic()) > 0:
+                time.sleep(rest)
+            self.flush()
+            with self._offen_lock:
+                if not self._offen:
+                    self._schreiber = None
+                    return
+
+    def flush(self):
+        """Alle vorgemerkten Entwürfe sofort in einer Transaktion schreiben."""
+        with self._offen_lock:
+            offen, self._offen = self._offen, {}
+        if not offen:
+            return
+        zeilen = [(n, a, w, daten, zeit) for (n, a, w), (daten, zeit) in offen.items()]
+        with self._lock:
+            db = self._verbindung()
+            with db:
+                db.execute("BEGIN")
+                db.executemany(
+                    "INSERT INTO entwuerfe (nutzer, app, woche, daten, geaendert) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (nutzer, app, woche) DO UPDATE SET daten = excluded.daten, geaendert = excluded.geaendert",
+                    zeilen,
+                )
+            self.geschrieben += len(zeilen)
+            self.transaktionen += 1
+
+    # ── Lesen ───────────────────────────────────────────────────────────────────
+    def lade(self, nutzer: str, app: str, woche: str | None = None) -> tuple[str, dict] | None:
+        """(woche, daten) einer Woche bzw. – ohne `woche` – des zuletzt geänderten Entwurfs."""
+        with self._offen_lock:
+            kandidaten = [(z, w, d) for (n, a, w), (d, z) in self._offen.items()
+                          if n == nutzer and a == app and (woche is None or w == woche)]
+        if kandidaten:
+            _, w, daten = max(kandidaten)
+            return w, aus_json(daten)
+        with self._lock:
+            db = self._verbindung()
+            if woche is None:
+                zeile = db.execute(
+                    "SELECT woche, daten FROM entwuerfe WHERE nutzer = ? AND app = ? ORDER BY geaendert DESC LIMIT 1",
+                    (nutzer, app),
+                ).fetchone()
+            else:
+                zeile = db.execute(
+                    "SELECT woche, daten FROM entwuerfe WHERE nutzer = ? AND app = ? AND woche = ?",
+                    (nutzer, app, woche),
+                ).fetchone()
+        return (zeile[0], aus_json(zeile[1])) if zeile else None
+
+    def wochen(self, nutzer: str, app: str, limit: int = 104) -> list[tuple[str, datetime]]:
+        """Gespeicherte Wochen, neueste zuerst (nur Schlüssel und Zeitstempel)."""
+        with self._offen_lock:
+            offen = {w: z for (n, a, w), (_, z) in self._offen.items() if n == nutzer and a == app}
+        with self._lock:
+            zeilen = self._verbindung().execute(
+                "SELECT woche, geaendert FROM entwuerfe WHERE nutzer = ? AND app = ? ORDER BY woche DESC LIMIT ?",
+                (nutzer, app, limit),
+            ).fetchall()
+        alle = {**dict(zeilen), **offen}
+        return [(w, datetime.fromtimestamp(alle[w])) for w in sorted(alle, reverse=True)[:limit]]
+
+    def schliessen(self):
+        self.flush()
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+_ablage = None
+_ablage_lock = threading.Lock()
+
+def ablage() -> Entwurfsablage:
+    """Prozessweite Ablage (eine Verbindung für alle Sessions), beim Beenden wird geflusht."""
+    global _ablage
+    if _ablage is None:
+        with _ablage_lock:
+            if _ablage is None:
+                _ablage = Entwurfsablage()
+                atexit.register(_ablage.schliessen)
+    return _ablage
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Export erzeugter Texte als Markdown, DOCX oder PDF – einzeln oder als ZIP.
+
+Die Texte der Generatoren sind einfaches Markdown (`#`/`##`-Überschriften,
+`- `-Aufzählungen, `**fett**`). DOCX und PDF werden ohne Zusatzpakete direkt
+geschrieben (Standardschrift Helvetica bzw. Word-Vorgaben).
+
+Ein Sammelexport nimmt Dokumente als Generator entgegen und schreibt sie
+nacheinander in das Archiv: Es liegt immer nur ein Dokument im Speicher, das
+Archiv selbst wächst in einer temporären Datei (ab 8 MiB auf der Platte) und
+wird erst am Ende als Ganzes gelesen – so, wie es `st.download_button` braucht.
+
+    daten = zip_datei(dokumente(), ["md", "pdf"])
+"""
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterable
+from xml.sax.saxutils import escape
+import io
+import re
+import tempfile
+import textwrap
+import time
+import zipfile
+
+SPOOL_BYTES = 8 * 1024 * 1024
+
+@dataclass(frozen=True)
+class Dokument:
+    """Ein Exportdokument; `name` ist der Dateiname ohne Endung (darf Ordner enthalten)."""
+    name: str
+    titel: str
+    text: str
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Markdown-Zeilen → Blöcke
+# ────────────────────────────────────────────────────────────────────────────────
+_FETT = re.compile(r"\*\*(.+?)\*\*")
+
+def bloecke(text: str):
+    """(art, inhalt) je Zeile mit art ∈ h1/h2/li/p/leer."""
+    for zeile in text.splitlines():
+        s = zeile.strip()
+        if not s:
+            yield "leer", ""
+        elif s.startswith("# "):
+            yield "h1", s[2:]
+        elif s.startswith("## "):
+            yield "h2", s[3:]
+        elif s.startswith(("- ", "* ")):
+            yield "li", s[2:]
+        else:
+            yield "p", s
+
+def laeufe(text: str) -> list[tuple[str, bool]]:
+    """Text in (abschnitt, fett)-Läufe nach `**…**` zerlegen."""
+    teile = _FETT.split(text)
+    return [(t, i % 2 == 1) for i, t in enumerate(teile) if t]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Renderer: (titel, text) -> bytes
+# ────────────────────────────────────────────────────────────────────────────────
+def als_markdown(titel: str, text: str) -> bytes:
+    kopf = "" if text.lstrip().startswith("#") else f"# {titel}\n\n"
+    return (kopf + text.rstrip() + "\n").encode("utf-8")
+
+def als_text(titel: str, text: str) -> bytes:
+    return text.encode("utf-8")
+
+_DOCX_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+    "</Types>"
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" '
+    'Target="docProps/core.xml"/>'
+    "</Relationships>"
+)
+_DOCX_CORE = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+    'xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:title>{titel}</dc:title></cp:coreProperties>'
+)
+
+def _docx_absatz(text: str, fett: bool = False, groesse: int | None = None, einzug: bool = False) -> str:
+    ppr = '<w:pPr><w:ind w:left="360" w:hanging="360"/></w:pPr>' if einzug else ""
+    runs = []
+    for abschnitt, f in laeufe(text):
+        rpr = ("<w:b/>" if fett or f else "") + (f'<w:sz w:val="{groesse * 2}"/>' if groesse else "")
+        runs.append(f'<w:r>{f"<w:rPr>{rpr}</w:rPr>" if rpr else ""}<w:t xml:space="preserve">{escape(abschnitt)}</w:t></w:r>')
+    return f"<w:p>{ppr}{''.join(runs)}</w:p>"
+
+def als_docx(titel: str, text: str) -> bytes:
+    absaetze = []
+    for art, inhalt in bloecke(text):
+        if art == "h1":
+            absaetze.append(_docx_absatz(inhalt, fett=True, groesse=16))
+        elif art == "h2":
+            absaetze.append(_docx_absatz(inhalt, fett=True, groesse=13))
+        elif art == "li":
+            absaetze.append(_docx_absatz(f"•\t{inhalt}", einzug=True))
+        elif art == "p":
+            absaetze.append(_docx_absatz(inhalt))
+    dokument = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+        + "".join(absaetze)
+        + '<w:sectPr><w:pgSz w:w="11906" w:h="16838"/>'
+        '<w:pgMar w:top="1134" w:right="1134" w:bottom="1134" w:left="1134"/></w:sectPr></w:body></w:document>'
+    )
+    puffer = io.BytesIO()
+    with zipfile.ZipFile(puffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _DOCX_TYPES)
+        zf.writestr("_rels/.rels", _DOCX_RELS)
+        zf.writestr("docProps/core.xml", _DOCX_CORE.format(titel=escape(titel)))
+        zf.writestr("word/document.xml", dokument)
+    return puffer.getvalue()
+
+# PDF: A4, Helvetica (WinAnsi), einfacher Zeilenumbruch nach mittlerer Zeichenbreite
+_A4 = (595, 842)
+_RAND = 56
+
+# Zeichen ohne WinAnsi-Glyphe, die in Vorlagen und Toleranzen vorkommen – sonst würden sie zu „?“
+_WINANSI = str.maketrans({
+    "→": "->", "←": "<-", "↔": "<->", "⇒": "=>", "↦": "->",
+    "≈": "~", "≤": "<=", "≥": ">=", "≠": "!=", "−": "-", "∓": "-/+", "⌀": "Ø", "∅": "Ø", "∈": "in",
+    "‐": "-", "‑": "-", "\u2009": " ", "\u202f": " ", "\ufe0f": None, "✓": "x", "✔": "x",
+})
+
+def _pdf_text(s: str) -> bytes:
+    b = s.translate(_WINANSI).encode("cp1252", errors="replace")
+    return b.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+def _pdf_zeilen(text: str):
+    """(schrift, groesse, x, text, abstand_davor) je gesetzter Zeile."""
+    breite = _A4[0] - 2 * _RAND
+    for art, inhalt in bloecke(text):
+        if art == "leer":
+            yield None, 10, 0, "", 4
+            continue
+        schlicht = _FETT.sub(r"\1", inhalt)
+        schrift, groesse, x, vorne = {
+            "h1": ("F2", 16, 0, 8), "h2": ("F2", 13, 0, 6), "li": ("F1", 10, 12, 0), "p": ("F1", 10, 0, 0),
+        }[art]
+        zeilen = textwrap.wrap(schlicht, width=max(20, int((breite - x) / (groesse * 0.5)))) or [""]
+        for i, z in enumerate(zeilen):
+            if art == "li" and i == 0:
+                yield schrift, groesse, 0, "•", vorne
+                yield schrift, groesse, x, z, -1  # gleiche Zeile wie der Punkt
+            else:
+                yield schrift, groesse, x, z, vorne if i == 0 else 0
+
+def als_pdf(titel: str, text: str) -> bytes:
+    seiten, inhalt = [], []
+    y = _A4[1] - _RAND
+    for schrift, groesse, x, zeile, vorne in _pdf_zeilen(text):
+        if vorne == -1:
+            y += groesse * 1.4  # zurück auf die Zeile des Aufzählungszeichens
+        else:
+            y -= vorne
+        if y - groesse < _RAND:
+            seiten.append(b"\n".join(inhalt))
+            inhalt, y = [], _A4[1] - _RAND
+        if schrift:
+            inhalt.append(b"BT /%s %d Tf %.1f %.1f Td (%s) Tj ET" % (
+                schrift.encode(), groesse, _RAND + x, y - groesse, _pdf_text(zeile)))
+        y -= groesse * 1.4
+    seiten.append(b"\n".join(inhalt))
+
+    # Objekte: 1 Katalog, 2 Seitenbaum, 3/4 Schriften, 5 Info, dann je Seite (Page, Contents)
+    objekte = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        4: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        5: b"<< /Title (%s) /Producer (ausbildung.export) >>" % _pdf_text(titel),
+    }
+    kinder = []
+    for i, strom in enumerate(seiten):
+        seite, inhalt_nr = 6 + 2 * i, 7 + 2 * i
+        kinder.append(b"%d 0 R" % seite)
+        objekte[seite] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>" % (*_A4, inhalt_nr)
+        )
+        objekte[inhalt_nr] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(strom) + 1, strom)
+    objekte[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kinder), len(kinder))
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    versatz = {}
+    for nr in sorted(objekte):
+        versatz[nr] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (nr, objekte[nr])
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objekte) + 1)
+    out += b"".join(b"%010d 00000 n \n" % versatz[nr] for nr in sorted(objekte))
+    out += b"trailer\n<< /Size %d /Root 1 0 R /Info 5 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objekte) + 1, xref)
+    return bytes(out)
+
+# Format → (Renderer, Dateiendung, MIME-Typ)
+FORMATE: dict[str, tuple[Callable[[str, str], bytes], str, str]] = {
+    "md": (als_markdown, "md", "text/markdown"),
+    "txt": (als_text, "txt", "text/plain"),
+    "docx": (als_docx, "docx", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    "pdf": (als_pdf, "pdf", "application/pdf"),
+}
+
+def rendere(format_: str, titel: str, text: str) -> bytes:
+    return FORMATE[format_][0](titel, text)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Sammelexport
+# ────────────────────────────────────────────────────────────────────────────────
+def schreibe_zip(dokumente: Iterable[Dokument], formate: list[str], ziel: BinaryIO) -> int:
+    """Dokumente nacheinander rendern und ins ZIP `ziel` streamen; liefert die Anzahl Dateien."""
+    unbekannt = set(formate) - FORMATE.keys()
+    if unbekannt:
+        raise ValueError(f"Unbekannte Formate: {', '.join(sorted(unbekannt))}")
+    n = 0
+    zeit = time.localtime()[:6]
+    with zipfile.ZipFile(ziel, "w") as zf:
+        for dok in dokumente:
+            for f in formate:
+                renderer, endung, _ = FORMATE[f]
+                info = zipfile.ZipInfo(f"{dok.name}.{endung}", date_time=zeit)
+                # DOCX ist selbst ein ZIP – nicht noch einmal komprimieren
+                info.compress_type = zipfile.ZIP_STORED if f == "docx" else zipfile.ZIP_DEFLATED
+                with zf.open(info, "w") as fh:
+                    fh.write(renderer(dok.titel, dok.text))
+                n += 1
+    return n
+
+def zip_datei(dokumente: Iterable[Dokument], formate: list[str]) -> bytes:
+    """
+    ZIP über eine temporäre Datei erzeugen und als Bytes zurückgeben. Streamlit nimmt
+    vom Download-Callable nur bytes/BytesIO/BufferedReader, keine SpooledTemporaryFile.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES) as fh:
+        schreibe_zip(dokumente, formate, fh)
+        fh.seek(0)
+        return fh.read()
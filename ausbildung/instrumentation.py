@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Opt-in-Zeitmessung der Rerun-Phasen (Sidebar, Eingaben, Generatoren, Ausgabe,
+Copy-Komponente) für beide Apps.
+
+Aktiv mit Umgebungsvariable `AUSBILDUNG_DEBUG=1` oder URL-Parameter `?debug=1`.
+Dann zeigt ein Debug-Panel in der Sidebar die Phasen des letzten Reruns, die
+Rerun-Zahl der Session und die Cache-Zähler; jeder Rerun wird zusätzlich als
+JSON-Zeile in `AUSBILDUNG_TIMING_LOG` (Standard: `ausbildung_timing.jsonl`)
+geschrieben. Ohne Opt-in sind alle Aufrufe No-ops.
+
+    messung = instrumentation.beginne("buero")
+    with instrumentation.phase("sidebar"):
+        ...
+    instrumentation.beende()
+"""
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+import json
+import os
+import threading
+import time
+import uuid
+
+import streamlit as st
+
+from ausbildung.cache import TEXT_CACHE
+
+LOG_PFAD = os.environ.get("AUSBILDUNG_TIMING_LOG", "ausbildung_timing.jsonl")
+HISTORIE = 50  # Messungen je Session für das Panel
+
+_log_lock = threading.Lock()
+
+class Messung:
+    """Phasenzeiten eines (Fragment-)Reruns in Millisekunden."""
+
+    def __init__(self, app: str, art: str = "rerun"):
+        self.app = app
+        self.art = art
+        self.phasen = {}
+        self.start = time.perf_counter()
+        self.abgeschlossen = False
+
+    @contextmanager
+    def phase(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phasen[name] = self.phasen.get(name, 0.0) + (time.perf_counter() - t0) * 1000
+
+    def record(self, session: str, rerun: int) -> dict:
+        return {
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "app": self.app,
+            "session": session,
+            "art": self.art,
+            "rerun": rerun,
+            "gesamt_ms": round((time.perf_counter() - self.start) * 1000, 3),
+            "phasen": {k: round(v, 3) for k, v in self.phasen.items()},
+        }
+
+def schreibe_log(record: dict, pfad: str = LOG_PFAD):
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with _log_lock, open(pfad, "a", encoding="utf-8") as fh:
+        fh.write(line)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Streamlit-Anbindung
+# ────────────────────────────────────────────────────────────────────────────────
+def aktiv() -> bool:
+    return os.environ.get("AUSBILDUNG_DEBUG") == "1" or st.query_params.get("debug") == "1"
+
+def _abschliessen(messung: Messung) -> dict:
+    ss = st.session_state
+    messung.abgeschlossen = True
+    record = messung.record(ss["_debug_session"], ss.get("_debug_reruns", 0))
+    verlauf = ss.setdefault("_debug_verlauf", [])
+    verlauf.append(record)
+    del verlauf[:-HISTORIE]
+    try:
+        schreibe_log(record)
+    except OSError:
+        pass  # Log ist optional – die App darf daran nicht scheitern
+    return record
+
+def beginne(app: str) -> Messung | None:
+    """Zu Beginn des Skripts: Rerun zählen und neue Messung anlegen (nur im Debug-Modus)."""
+    ss = st.session_state
+    ss["_debug_reruns"] = ss.get("_debug_reruns", 0) + 1
+    if not aktiv():
+        ss.pop("_messung", None)
+        return None
+    ss.setdefault("_debug_session", uuid.uuid4().hex[:8])
+    ss["_messung"] = Messung(app)
+    return ss["_messung"]
+
+def phase(name: str):
+    """Kontextmanager für eine Phase der laufenden Messung; ohne Debug-Modus ein No-op."""
+    messung = st.session_state.get("_messung")
+    if messung is None or messung.abgeschlossen:
+        return nullcontext()
+    return messung.phase(name)
+
+@contextmanager
+def fragment_lauf(app: str):
+    """
+    Für `st.fragment`-Funktionen: Im vollen Rerun zählen die Phasen zur
+    laufenden Messung, bei einem reinen Fragment-Rerun entsteht eine eigene.
+    """
+    ss = st.session_state
+    messung = ss.get("_messung")
+    if messung is None or not messung.abgeschlossen:
+        yield
+        return
+    ss["_messung"] = Messung(app, art="fragment")
+    try:
+        yield
+    finally:
+        _abschliessen(ss["_messung"])
+
+def beende():
+    """Am Skriptende: Messung abschließen, loggen und Debug-Panel zeichnen."""
+    messung = st.session_state.get("_messung")
+    if messung is None or messung.abgeschlossen:
+        return
+    record = _abschliessen(messung)
+    with st.sidebar.expander("🐞 Debug: Laufzeiten", expanded=True):
+        st.caption(f"Session {record['session']} · Rerun {record['rerun']} · {record['gesamt_ms']:.1f} ms gesamt")
+        st.table({"Phase": list(record["phasen"]), "ms": [f"{v:.2f}" for v in record["phasen"].values()]})
+        fragmente = [r for r in st.session_state["_debug_verlauf"] if r["art"] == "fragment"]
+        if fragmente:
+            st.caption(f"Fragment-Reruns: {len(fragmente)} · letzter {fragmente[-1]['gesamt_ms']:.1f} ms")
+        st.markdown("**Text-Cache**")
+        st.json(TEXT_CACHE.stats(), expanded=False)
+        st.caption(f"Log: `{LOG_PFAD}`")
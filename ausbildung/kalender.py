@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Kalender für die Berichtsheft-Planung – ohne Streamlit.
+
+Ein `Kalender` deckt einen Ausbildungszeitraum ab und ordnet jedem Tag eine
+Art zu (Betrieb, Berufsschule, Feiertag, Urlaub, Wochenende). Feiertage je
+Bundesland, Berufsschultage, Schulferien und Urlaubsblöcke werden beim Anlegen
+einmal in ein Byte je Tag übersetzt; jede Abfrage ist danach ein
+Array-Zugriff. `wochen()` teilt den Zeitraum in ISO-Kalenderwochen mit dem
+jeweils richtigen Berichtszeitraum (Montag bzw. Ausbildungsbeginn bis
+letzter Arbeitstag).
+
+    kal = Kalender(date(2024, 8, 1), date(2027, 7, 31), land="NW", schultage=(0, 3))
+    for woche in kal.wochen():
+        e = replace(vorlage, date_from=woche.von, date_to=woche.bis)
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Iterable
+
+from ausbildung.text import daterange_str, parse_datum
+
+LAENDER = {
+    "BW": "Baden-Württemberg", "BY": "Bayern", "BE": "Berlin", "BB": "Brandenburg",
+    "HB": "Bremen", "HH": "Hamburg", "HE": "Hessen", "MV": "Mecklenburg-Vorpommern",
+    "NI": "Niedersachsen", "NW": "Nordrhein-Westfalen", "RP": "Rheinland-Pfalz", "SL": "Saarland",
+    "SN": "Sachsen", "ST": "Sachsen-Anhalt", "SH": "Schleswig-Holstein", "TH": "Thüringen",
+}
+
+WOCHENTAGE = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
+
+# Tagesarten (ein Byte je Tag im Index)
+BETRIEB, SCHULE, FEIERTAG, URLAUB, WOCHENENDE = range(5)
+ARTEN = ["Betrieb", "Berufsschule", "Feiertag", "Urlaub", "Wochenende"]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Feiertage
+# ────────────────────────────────────────────────────────────────────────────────
+def ostersonntag(jahr: int) -> date:
+    """Gregorianischer Ostersonntag (anonymer Algorithmus nach Meeus/Jones/Butcher)."""
+    a, b, c = jahr % 19, jahr // 100, jahr % 100
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    monat, tag = divmod(h + l - 7 * m + 114, 31)
+    return date(jahr, monat, tag + 1)
+
+@lru_cache(maxsize=512)
+def feiertage(jahr: int, land: str) -> dict[date, str]:
+    """Gesetzliche Feiertage eines Jahres in einem Bundesland (ohne nur örtliche Feiertage)."""
+    if land not in LAENDER:
+        raise ValueError(f"Unbekanntes Bundesland: {land!r} (erlaubt: {', '.join(LAENDER)})")
+    ostern = ostersonntag(jahr)
+    tage = {
+        date(jahr, 1, 1): "Neujahr",
+        ostern - timedelta(days=2): "Karfreitag",
+        ostern + timedelta(days=1): "Ostermontag",
+        date(jahr, 5, 1): "Tag der Arbeit",
+        ostern + timedelta(days=39): "Christi Himmelfahrt",
+        ostern + timedelta(days=50): "Pfingstmontag",
+        date(jahr, 10, 3): "Tag der Deutschen Einheit",
+        date(jahr, 12, 25): "1. Weihnachtstag",
+        date(jahr, 12, 26): "2. Weihnachtstag",
+    }
+
+    def regional(tag: date, name: str, laender: str, ab: int = 0):
+        if land in laender.split() and jahr >= ab:
+            tage[tag] = name
+
+    regional(date(jahr, 1, 6), "Heilige Drei Könige", "BW BY ST")
+    regional(date(jahr, 3, 8), "Internationaler Frauentag", "BE", ab=2019)
+    regional(date(jahr, 3, 8), "Internationaler Frauentag", "MV", ab=2023)
+    regional(ostern, "Ostersonntag", "BB")
+    regional(ostern + timedelta(days=49), "Pfingstsonntag", "BB")
+    regional(ostern + timedelta(days=60), "Fronleichnam", "BW BY HE NW RP SL")
+    regional(date(jahr, 8, 15), "Mariä Himmelfahrt", "SL")
+    regional(date(jahr, 9, 20), "Weltkindertag", "TH", ab=2019)
+    regional(date(jahr, 10, 31), "Reformationstag", "BB MV SN ST TH")
+    regional(date(jahr, 10, 31), "Reformationstag", "HB HH NI SH", ab=2018)
+    regional(date(jahr, 11, 1), "Allerheiligen", "BW BY NW RP SL")
+    # Buß- und Bettag: Mittwoch vor dem 23. November
+    regional(date(jahr, 11, 22) - timedelta(days=(date(jahr, 11, 22).weekday() - 2) % 7), "Buß- und Bettag", "SN")
+    if jahr == 2017:
+        tage[date(2017, 10, 31)] = "Reformationstag (500. Jahrestag)"
+    if jahr in (2020, 2025):
+        regional(date(jahr, 5, 8), "Tag der Befreiung", "BE")
+    return tage
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Kalender-Index
+# ────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class Woche:
+    """Eine ISO-Kalenderwoche innerhalb des Ausbildungszeitraums."""
+    jahr: int
+    kw: int
+    von: date
+    bis: date
+    tage: tuple[tuple[date, int], ...]
+
+    @property
+    def schluessel(self) -> str:
+        return f"{self.jahr}-W{self.kw:02d}"
+
+    def anzahl(self, art: int) -> int:
+        return sum(1 for _, a in self.tage if a == art)
+
+class Kalender:
+    """Tagesarten eines Zeitraums als Bytearray; `art(tag)` ist O(1)."""
+
+    def __init__(
+        self,
+        beginn: date,
+        ende: date,
+        land: str = "NW",
+        schultage: Iterable[int] = (),
+        ferien: Iterable[tuple[date, date]] = (),
+        urlaub: Iterable[tuple[date, date]] = (),
+    ):
+        if beginn > ende:
+            raise ValueError("Der Ausbildungsbeginn liegt nach dem Ende.")
+        self.beginn, self.ende, self.land = beginn, ende, land
+        self.schultage = frozenset(schultage)
+        self._basis = beginn.toordinal()
+        n = ende.toordinal() - self._basis + 1
+        self._feiertag_namen = {}
+        for jahr in range(beginn.year, ende.year + 1):
+            self._feiertag_namen.update(feiertage(jahr, land))
+
+        # Woche als Muster: Wochenende, Schultage, sonst Betrieb – dann Ausnahmen überschreiben
+        muster = bytes(WOCHENENDE if wd >= 5 else SCHULE if wd in self.schultage else BETRIEB for wd in range(7))
+        versatz = beginn.weekday()
+        arten = bytearray((muster[versatz:] + muster * (n // 7 + 2))[:n])
+        for von, bis in ferien:  # Schulferien: keine Berufsschule, Betrieb statt Schule
+            for i in self._bereich(von, bis):
+                if arten[i] == SCHULE:
+                    arten[i] = BETRIEB
+        for von, bis in urlaub:
+            for i in self._bereich(von, bis):
+                if arten[i] in (BETRIEB, SCHULE):
+                    arten[i] = URLAUB
+        for tag in self._feiertag_namen:
+            i = tag.toordinal() - self._basis
+            if 0 <= i < n and arten[i] != WOCHENENDE:
+                arten[i] = FEIERTAG
+        self._arten = bytes(arten)
+
+    def _bereich(self, von: date, bis: date) -> range:
+        return range(max(0, von.toordinal() - self._basis), min(len(self), bis.toordinal() - self._basis + 1))
+
+    def __len__(self):
+        return self.ende.toordinal() - self._basis + 1
+
+    def art(self, tag: date) -> int:
+        i = tag.toordinal() - self._basis
+        if not 0 <= i < len(self._arten):
+            raise KeyError(f"{tag:%d.%m.%Y} liegt außerhalb des Ausbildungszeitraums")
+        return self._arten[i]
+
+    def feiertag(self, tag: date) -> str | None:
+        return self._feiertag_namen.get(tag)
+
+    def wochen(self) -> Iterable[Woche]:
+        """ISO-Wochen mit mindestens einem Arbeitstag; `von`/`bis` auf Zeitraum und Arbeitstage gekürzt."""
+        montag = self.beginn - timedelta(days=self.beginn.weekday())
+        while montag <= self.ende:
+            i0 = max(0, montag.toordinal() - self._basis)
+            i1 = min(len(self._arten), montag.toordinal() - self._basis + 7)
+            tage = tuple((date.fromordinal(self._basis + i), self._arten[i]) for i in range(i0, i1))
+            arbeit = [t for t, a in tage if a != WOCHENENDE]
+            if arbeit:
+                jahr, kw, _ = montag.isocalendar()
+                yield Woche(jahr, kw, arbeit[0], arbeit[-1], tage)
+            montag += timedelta(days=7)
+
+    def zusammenfassung(self) -> dict[str, int]:
+        """Tage je Art im ganzen Zeitraum."""
+        return {name: self._arten.count(art) for art, name in enumerate(ARTEN)}
+
+def wochenbeschreibung(woche: Woche, kal: Kalender) -> str:
+    """Kurztext für die Oberfläche: „3× Betrieb, 1× Berufsschule, Feiertag: Tag der Deutschen Einheit“."""
+    teile = [f"{n}× {ARTEN[a]}" for a in (BETRIEB, SCHULE, URLAUB) if (n := woche.anzahl(a))]
+    namen = [kal.feiertag(t) for t, a in woche.tage if a == FEIERTAG]
+    if namen:
+        teile.append("Feiertag: " + ", ".join(namen))
+    return ", ".join(teile)
+
+def parse_wochentage(wert) -> tuple[int, ...]:
+    """„Mo|Do“, „Mo, Do“ oder [0, 3] → (0, 3)."""
+    if isinstance(wert, str):
+        wert = [w for w in wert.replace("|", ",").split(",") if w.strip()]
+    out = []
+    for w in wert:
+        if isinstance(w, int) or str(w).strip().isdigit():
+            if not 0 <= int(w) <= 6:
+                raise ValueError(f"Wochentag {w!r} außerhalb 0–6 (0 = Mo, 6 = So)")
+            out.append(int(w))
+        else:
+            kurz = str(w).strip()[:2].capitalize()
+            if kurz not in WOCHENTAGE:
+                raise ValueError(f"Unbekannter Wochentag: {w!r}")
+            out.append(WOCHENTAGE.index(kurz))
+    return tuple(sorted(set(out)))
+
+def parse_zeitraeume(wert) -> list[tuple[date, date]]:
+    """„2024-12-23:2025-01-03|2025-04-14:2025-04-17“ oder [[von, bis], …] → [(von, bis), …]."""
+    if isinstance(wert, str):
+        wert = [w.split(":") for w in wert.replace("\n", "|").split("|") if w.strip()]
+    out = []
+    for teil in wert:
+        von, bis = (teil[0], teil[-1]) if len(teil) in (1, 2) else (None, None)
+        if von is None:
+            raise ValueError(f"Ungültiger Zeitraum: {teil!r}")
+        von, bis = parse_datum(von), parse_datum(bis)
+        if von > bis:
+            raise ValueError(f"Zeitraum {daterange_str(von, bis)}: Beginn liegt nach dem Ende")
+        out.append((von, bis))
+    return out
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Vorschlagskataloge (Lernfelder, Tätigkeiten, Verfahren, Werkstoffe, Normen …)
+mit Präfix- und Fuzzy-Index für die serverseitige Suche.
+
+Kataloge sind Textdateien mit einem Eintrag pro Zeile (`#` = Kommentar) in
+`AUSBILDUNG_KATALOGE` (falls gesetzt) oder `ausbildung/kataloge/`. Sie werden
+erst beim ersten Zugriff geladen und indiziert und dann prozessweit geteilt.
+Die Suche liefert nur die besten `k` Treffer – auch bei zehntausenden
+Einträgen geht so nur eine kurze Liste an den Browser.
+"""
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+import heapq
+import os
+import re
+import sys
+import threading
+import unicodedata
+
+PAKET_DIR = Path(__file__).with_name("kataloge")
+EXTERN_DIR = os.environ.get("AUSBILDUNG_KATALOGE")
+
+_WORT = re.compile(r"\w+")
+
+def normalisieren(text: str) -> str:
+    """Kleinschreibung ohne diakritische Zeichen: „Büro“ → „buro“."""
+    zerlegt = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in zerlegt if not unicodedata.combining(c))
+
+def _trigramme(wort: str) -> set[str]:
+    w = f"  {wort} "
+    return {w[i:i + 3] for i in range(len(w) - 2)}
+
+class Katalog:
+    """Unveränderliche Eintragsliste mit sortiertem Wortindex (Präfix) und Trigramm-Index (Tippfehler)."""
+
+    def __init__(self, name: str, eintraege: list[str]):
+        self.name = name
+        self.eintraege = list(dict.fromkeys(sys.intern(e.strip()) for e in eintraege if e.strip()))
+        self._norm = [normalisieren(e) for e in self.eintraege]
+        self._position = {e: i for i, e in enumerate(self.eintraege)}
+        paare = sorted((w, i) for i, n in enumerate(self._norm) for w in set(_WORT.findall(n)))
+        self._woerter = [w for w, _ in paare]
+        self._ids = [i for _, i in paare]
+        self._tri = None
+        self._tri_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.eintraege)
+
+    def __contains__(self, eintrag: str):
+        return eintrag in self._position
+
+    def id(self, eintrag: str) -> int | None:
+        """Position von `eintrag` im Katalog (None bei Freitext)."""
+        return self._position.get(eintrag)
+
+    def _praefix(self, wort: str) -> set[int]:
+        lo = bisect_left(self._woerter, wort)
+        hi = bisect_left(self._woerter, wort + "\U0010ffff", lo)
+        return set(self._ids[lo:hi])
+
+    def _trigramm_index(self) -> dict[str, list[int]]:
+        if self._tri is None:
+            with self._tri_lock:
+                if self._tri is None:
+                    idx = {}
+                    for i, n in enumerate(self._norm):
+                        tri = set()
+                        for w in _WORT.findall(n):
+                            tri |= _trigramme(w)
+                        for t in tri:
+                            idx.setdefault(t, []).append(i)
+                    self._tri = idx
+        return self._tri
+
+    def suche(self, anfrage: str, k: int = 20) -> list[str]:
+        """
+        Beste `k` Einträge zu `anfrage`: zuerst Einträge, in denen jedes Suchwort
+        als Wortanfang vorkommt (Eintragsanfang vor Wortanfang, kürzer vor länger),
+        dann – bei zu wenigen Treffern – tippfehlertolerant über Trigramme.
+        """
+        q = normalisieren(anfrage).strip()
+        woerter = _WORT.findall(q)
+        if not woerter:
+            return self.eintraege[:k]
+        treffer = None
+        for w in woerter:
+            ids = self._praefix(w)
+            treffer = ids if treffer is None else treffer & ids
+            if not treffer:
+                break
+        treffer = treffer or set()
+        beste = heapq.nsmallest(
+            k, treffer, key=lambda i: (not self._norm[i].startswith(q), len(self._norm[i]), i)
+        )
+        if len(beste) < k and len(q) >= 3:
+            idx = self._trigramm_index()
+            q_tri = set()
+            for w in woerter:
+                q_tri |= _trigramme(w)
+            zaehler = Counter()
+            for t in q_tri:
+                zaehler.update(idx.get(t, ()))
+            schwelle = max(2, len(q_tri) // 3)
+            gesehen = set(beste)
+            kandidaten = ((n, i) for i, n in zaehler.items() if n >= schwelle and i not in gesehen)
+            beste += [i for _, i in heapq.nsmallest(k - len(beste), kandidaten, key=lambda x: (-x[0], x[1]))]
+        return [self.eintraege[i] for i in beste]
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Laden (lazy, prozessweit)
+# ────────────────────────────────────────────────────────────────────────────────
+_kataloge: dict[str, Katalog] = {}
+_lade_lock = threading.Lock()
+
+def katalog_pfad(name: str) -> Path:
+    for verzeichnis in (EXTERN_DIR, PAKET_DIR):
+        if verzeichnis:
+            pfad = Path(verzeichnis) / f"{name}.txt"
+            if pfad.exists():
+                return pfad
+    raise KeyError(f"Katalog {name!r} nicht gefunden")
+
+def lies_katalog(pfad: Path):
+    with open(pfad, encoding="utf-8") as fh:
+        for zeile in fh:
+            zeile = zeile.strip()
+            if zeile and not zeile.startswith("#"):
+                yield zeile
+
+def katalog(name: str) -> Katalog:
+    """Katalog beim ersten Zugriff laden und indizieren, danach aus dem Speicher."""
+    kat = _kataloge.get(name)
+    if kat is None:
+        with _lade_lock:
+            kat = _kataloge.get(name)
+            if kat is None:
+                kat = _kataloge[name] = Katalog(name, list(lies_katalog(katalog_pfad(name))))
+    return kat
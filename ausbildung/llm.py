@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+"""
+Direkter Versand von Prompts an einen OpenAI-kompatiblen Endpunkt – ohne Streamlit, ohne Zusatzpakete.
+
+Angesprochen wird `POST {AUSBILDUNG_LLM_URL}/chat/completions` (OpenAI, Azure-
+Proxy, Ollama, vLLM, LM Studio …). Der Client hält Keep-alive-Verbindungen in
+einem Pool (`http.client`), liest Antworten als Server-Sent Events Stück für
+Stück (`stream`) und schickt viele Prompts mit begrenzter Parallelität und
+Wiederholungen bei 429/5xx/Verbindungsfehlern (`batch`).
+
+    AUSBILDUNG_LLM_URL        Basis-URL, z. B. http://localhost:11434/v1 (leer = Versand aus)
+    AUSBILDUNG_LLM_MODELL     Modellname (Standard: gpt-4o-mini)
+    AUSBILDUNG_LLM_KEY        API-Schlüssel (Bearer), optional
+    AUSBILDUNG_LLM_PARALLEL   gleichzeitige Anfragen im Batch (Standard 4)
+    AUSBILDUNG_LLM_TIMEOUT_S  Timeout je Anfrage (Standard 120)
+
+    python -m ausbildung.llm prompts.jsonl -o antworten.jsonl --parallel 8
+    python -m ausbildung.promptlib export - | python -m ausbildung.llm - -o antworten.jsonl
+    echo "Erkläre die Passung H7/g6." | python -m ausbildung.llm --stream
+"""
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+import argparse
+import atexit
+import http.client
+import json
+import os
+import random
+import socket
+import sys
+import threading
+import time
+
+from ausbildung.parallel import bounded_map
+
+URL = os.environ.get("AUSBILDUNG_LLM_URL", "").rstrip("/")
+MODELL = os.environ.get("AUSBILDUNG_LLM_MODELL", "gpt-4o-mini")
+PARALLEL = int(os.environ.get("AUSBILDUNG_LLM_PARALLEL", 4))
+TIMEOUT_S = float(os.environ.get("AUSBILDUNG_LLM_TIMEOUT_S", 120))
+
+WIEDERHOLBAR = {408, 409, 425, 429, 500, 502, 503, 504}
+_VERBINDUNGSFEHLER = (http.client.HTTPException, ConnectionError, socket.timeout, OSError)
+
+def _fehlertext(inhalt: bytes) -> str:
+    """Meldung einer Fehlerantwort: {"error": {"message": …}}, {"error": "…"}, {"message": "…"} oder der Text selbst."""
+    with suppress(ValueError):
+        daten = json.loads(inhalt)
+        if isinstance(daten, dict):
+            fehler = daten.get("error")
+            if isinstance(fehler, dict) and isinstance(fehler.get("message"), str):
+                return fehler["message"]
+            if isinstance(fehler, str):
+                return fehler
+            if isinstance(daten.get("message"), str):
+                return daten["message"]
+    return inhalt.decode("utf-8", "replace")
+
+class LlmFehler(Exception):
+    """Fehlgeschlagene Anfrage; `wiederholbar` bei Überlast, Serverfehlern und Verbindungsabbrüchen."""
+
+    def __init__(self, meldung: str, status: int | None = None, wiederholbar: bool = False,
+                 warten_s: float | None = None):
+        super().__init__(meldung)
+        self.status = status
+        self.wiederholbar = wiederholbar
+        self.warten_s = warten_s
+
+@dataclass(frozen=True)
+class Antwort:
+    text: str
+    modell: str
+    tokens_ein: int | None
+    tokens_aus: int | None
+    dauer_s: float
+    versuche: int = 1
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Client
+# ────────────────────────────────────────────────────────────────────────────────
+class Client:
+    """Ein Endpunkt, ein Pool von Keep-alive-Verbindungen; threadsicher."""
+
+    def __init__(self, url: str = URL, modell: str = MODELL, key: str | None = None,
+                 timeout: float = TIMEOUT_S, pool: int = PARALLEL):
+        teile = urlsplit(url)
+        if teile.scheme not in ("http", "https") or not teile.hostname:
+            raise ValueError(f"Ungültige LLM-URL: {url!r}")
+        self.url, self.modell, self.timeout, self.pool = url, modell, timeout, pool
+        self._ziel = (teile.scheme, teile.hostname, teile.port)
+        self._pfad = teile.path.rstrip("/") + "/chat/completions"
+        key = os.environ.get("AUSBILDUNG_LLM_KEY", "") if key is None else key
+        self._kopf = {"Content-Type": "application/json", "Accept": "application/json, text/event-stream"}
+        if key:
+            self._kopf["Authorization"] = f"Bearer {key}"
+        self._frei: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.verbindungen = 0  # insgesamt geöffnet – zeigt, ob Keep-alive greift
+
+    # ── Verbindungen ────────────────────────────────────────────────────────────
+    def _verbindung(self, neu: bool) -> http.client.HTTPConnection:
+        if not neu:
+            with self._lock:
+                if self._frei:
+                    return self._frei.pop()
+        schema, host, port = self._ziel
+        klasse = http.client.HTTPSConnection if schema == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.verbindungen += 1
+        return klasse(host, port, timeout=self.timeout)
+
+    def _zurueck(self, conn: http.client.HTTPConnection, r: http.client.HTTPResponse):
+        if r.will_close:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._frei) < self.pool:
+                self._frei.append(conn)
+                return
+        conn.close()
+
+    def _senden(self, daten: dict) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Anfrage absetzen; Nicht-200 wird als LlmFehler geworfen (Verbindung ist dann schon zurück)."""
+        body = json.dumps({"model": self.modell, **daten}, ensure_ascii=False).encode("utf-8")
+        for neu in (False, True):
+            conn = self._verbindung(neu)
+            try:
+                conn.request("POST", self._pfad, body, self._kopf)
+                r = conn.getresponse()
+                break
+            except _VERBINDUNGSFEHLER as exc:
+                conn.close()
+                # Eine vom Server geschlossene Keep-alive-Verbindung einmal mit frischer Verbindung wiederholen
+                if neu or isinstance(exc, socket.timeout):
+                    raise LlmFehler(f"Verbindung zu {self.url}: {exc}", wiederholbar=True) from exc
+        if r.status != 200:
+            try:
+                inhalt = r.read()
+            except _VERBINDUNGSFEHLER as exc:
+                conn.close()
+                raise LlmFehler(f"HTTP {r.status}, Antwort abgebrochen: {exc}", r.status, wiederholbar=True) from exc
+            self._zurueck(conn, r)
+            warten = r.getheader("Retry-After")
+            raise LlmFehler(
+                f"HTTP {r.status}: {_fehlertext(inhalt)[:300]}", r.status, r.status in WIEDERHOLBAR,
+                float(warten) if warten and warten.replace(".", "", 1).isdigit() else None,
+            )
+        return conn, r
+
+    @staticmethod
+    def _nachrichten(prompt: str, system: str | None) -> list[dict]:
+        return ([{"role": "system", "content": system}] if system else []) + [{"role": "user", "content": prompt}]
+
+    # ── Anfragen ────────────────────────────────────────────────────────────────
+    def chat(self, prompt: str, system: str | None = None, versuche: int = 3, **optionen) -> Antwort:
+        """Komplette Antwort; wiederholt wiederholbare Fehler mit exponentiellem Backoff."""
+        t0 = time.perf_counter()
+
+        def einmal() -> dict:
+            conn, r = self._senden({"messages": self._nachrichten(prompt, system), **optionen})
+            try:
+                daten = json.loads(r.read())
+            except _VERBINDUNGSFEHLER as exc:
+                conn.close()
+                raise LlmFehler(f"Antwort abgebrochen: {exc}", wiederholbar=True) from exc
+            except ValueError as exc:
+                conn.close()
+                raise LlmFehler(f"Keine JSON-Antwort: {exc}") from exc
+            self._zurueck(conn, r)
+            return daten
+
+        daten, n = wiederholt(einmal, versuche)
+        try:
+            text = daten["choices"][0]["message"].get("content") or ""
+            nutzung = daten.get("usage") or {}
+            tokens = nutzung.get("prompt_tokens"), nutzung.get("completion_tokens")
+        except (KeyError, IndexError, TypeError, AttributeError) as exc:  # kein Chat-Completion-Objekt
+            raise LlmFehler(f"Unerwartete Antwort: {json.dumps(daten, ensure_ascii=False)[:200]}") from exc
+        return Antwort(
+            text=text if isinstance(text, str) else str(text),
+            modell=daten.get("model", self.modell),
+            tokens_ein=tokens[0], tokens_aus=tokens[1],
+            dauer_s=time.perf_counter() - t0, versuche=n,
+        )
+
+    def stream(self, prompt: str, system: str | None = None, versuche: int = 3, **optionen) -> Iterator[str]:
+        """
+        Antwort Stück für Stück (Server-Sent Events). Wiederholt wird nur bis zum
+        ersten Stück; wer den Generator vorzeitig schließt, schließt die Verbindung.
+        """
+        conn, r = wiederholt(
+            lambda: self._senden({"messages": self._nachrichten(prompt, system), "stream": True, **optionen}), versuche,
+        )[0]
+        fertig = False
+        try:
+            for zeile in r:
+                zeile = zeile.strip()
+                if not zeile.startswith(b"data:"):
+                    continue  # Kommentare, event:/id:-Zeilen, Leerzeilen zwischen Events
+                daten = zeile[5:].strip()
+                if daten == b"[DONE]":
+                    break
+                try:
+                    wahlen = json.loads(daten).get("choices") or ()
+                except (ValueError, AttributeError) as exc:  # kaputtes oder kein JSON-Objekt
+                    raise LlmFehler(f"Keine JSON-Antwort im Stream: {daten[:200].decode('utf-8', 'replace')}") from exc
+                for wahl in wahlen:
+                    if stueck := (wahl.get("delta") or {}).get("content"):
+                        yield stueck
+            r.read()  # Rest bis zum Ende des Chunked-Bodys, damit die Verbindung wiederverwendbar bleibt
+            fertig = True
+        except _VERBINDUNGSFEHLER as exc:
+            raise LlmFehler(f"Stream abgebrochen: {exc}", wiederholbar=True) from exc
+        finally:
+            if fertig:
+                self._zurueck(conn, r)
+            else:
+                conn.close()
+
+    def batch(self, prompts: Iterable[str], parallel: int | None = None, system: str | None = None,
+              versuche: int = 4, **optionen) -> Iterator[Antwort | LlmFehler]:
+        """
+        Viele Prompts mit höchstens `parallel` gleichzeitigen Anfragen; Ergebnisse
+        in Eingabereihenfolge. Endgültig gescheiterte Prompts liefern ihren LlmFehler.
+        """
+        parallel = parallel or self.pool
+
+        def eins(prompt: str) -> Antwort | LlmFehler:
+            try:
+                return self.chat(prompt, system, versuche, **optionen)
+            except LlmFehler as fehler:
+                return fehler
+
+        with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="llm") as ex:
+            yield from bounded_map(ex, eins, prompts, max_pending=parallel * 2)
+
+    def schliessen(self):
+        with self._lock:
+            frei, self._frei = self._frei, []
+        for conn in frei:
+            conn.close()
+
+def wiederholt(fn, versuche: int, basis_s: float = 0.5, max_s: float = 30.0):
+    """`fn()` bis zu `versuche`-mal; liefert (Ergebnis, Anzahl Versuche). Wartet Retry-After bzw. Backoff mit Jitter."""
+    for n in range(1, versuche + 1):
+        try:
+            return fn(), n
+        except LlmFehler as fehler:
+            if not fehler.wiederholbar or n == versuche:
+                raise
+            warten = fehler.warten_s if fehler.warten_s is not None else basis_s * 2 ** (n - 1) * random.uniform(0.5, 1.5)
+            time.sleep(min(warten, max_s))
+
+_client = None
+_client_lock = threading.Lock()
+
+def konfiguriert() -> bool:
+    return bool(URL)
+
+def client() -> Client:
+    """Prozessweiter Client (ein Verbindungspool für alle Sessions); nur mit AUSBILDUNG_LLM_URL."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if not URL:
+                    raise LlmFehler("Kein Endpunkt konfiguriert (AUSBILDUNG_LLM_URL).")
+                _client = Client()
+                atexit.register(_client.schliessen)
+    return _client
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Kommandozeile
+# ────────────────────────────────────────────────────────────────────────────────
+def _prompts(fh) -> Iterator[tuple[dict, str]]:
+    for nr, zeile in enumerate(fh, start=1):
+        if not zeile.strip():
+            continue
+        try:
+            rec = json.loads(zeile)
+            if not isinstance(rec, dict) or not isinstance(rec.get("prompt"), str):
+                raise ValueError
+        except ValueError:
+            print(f"Zeile {nr}: kein Eintrag mit 'prompt' – übersprungen", file=sys.stderr)
+            continue
+        yield rec, rec["prompt"]
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m ausbildung.llm", description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("quelle", nargs="?", default="-", help="JSONL mit Feld 'prompt' (bzw. Prompt-Text mit --stream)")
+    p.add_argument("-o", "--output", default="-", help="JSONL-Ausgabe (Standard: stdout)")
+    p.add_argument("--stream", action="store_true", help="Einen Prompt senden und die Antwort live ausgeben")
+    p.add_argument("--url", default=URL, help="Basis-URL (Standard: AUSBILDUNG_LLM_URL)")
+    p.add_argument("--modell", default=MODELL)
+    p.add_argument("--parallel", type=int, default=PARALLEL, help="Gleichzeitige Anfragen")
+    p.add_argument("--versuche", type=int, default=4, help="Versuche je Prompt bei 429/5xx/Verbindungsfehlern")
+    p.add_argument("--system", help="System-Prompt")
+    args = p.parse_args(argv)
+    if not args.url:
+        p.error("Kein Endpunkt: --url oder AUSBILDUNG_LLM_URL setzen")
+
+    c = Client(args.url, args.modell, pool=args.parallel)
+    fh = sys.stdin if args.quelle == "-" else open(args.quelle, encoding="utf-8")
+    try:
+        if args.stream:
+            for stueck in c.stream(fh.read(), args.system, args.versuche):
+                sys.stdout.write(stueck)
+                sys.stdout.flush()
+            print()
+            return 0
+
+        out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+        t0, stand = time.perf_counter(), {"ok": 0, "fehler": 0}
+        try:
+            recs = deque()
+
+            def prompts():
+                for rec, prompt in _prompts(fh):
+                    recs.append(rec)
+                    yield prompt
+
+            for ergebnis in c.batch(prompts(), args.parallel, args.system, args.versuche):
+                rec = recs.popleft()
+                zeile = {k: rec[k] for k in ("hash", "id") if k in rec}
+                if isinstance(ergebnis, LlmFehler):
+                    zeile.update(fehler=str(ergebnis), status=ergebnis.status)
+                    stand["fehler"] += 1
+                else:
+                    zeile.update(antwort=ergebnis.text, modell=ergebnis.modell, tokens_ein=ergebnis.tokens_ein,
+                                 tokens_aus=ergebnis.tokens_aus, dauer_s=round(ergebnis.dauer_s, 3),
+                                 versuche=ergebnis.versuche)
+                    stand["ok"] += 1
+                out.write(json.dumps(zeile, ensure_ascii=False) + "\n")
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        dauer = time.perf_counter() - t0
+        print(f"{stand['ok']} Antworten, {stand['fehler']} Fehler in {dauer:.1f} s "
+              f"({c.verbindungen} Verbindungen)", file=sys.stderr)
+        return 1 if stand["fehler"] else 0
+    except LlmFehler as fehler:
+        print(f"Fehler: {fehler}", file=sys.stderr)
+        return 1
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
+        c.schliessen()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Prompt- und Payload-Aufbau des Metall-Promptbuilders – ohne Streamlit.
+
+`build_payload` und `build_prompt` sind rein: gleiche `MetallEingabe` ergibt
+denselben Text. Der Wortlaut steht in `vorlagen/metall_prompt.txt`. Der
+zeitabhängige Teil (`meta.erstellt`) wird erst in `mit_meta` ergänzt, damit
+die Ergebnisse gecacht werden können.
+"""
+from dataclasses import dataclass, fields
+import re
+
+from ausbildung.cache import TEXT_CACHE
+from ausbildung.eintraege import Eintraege, als_eintraege, aus_datensatz, listenwerte
+from ausbildung.toleranzen import aufloesen
+from ausbildung.vorlage import lade
+
+BUILDER = "Promptbuilder Metall (Azubis/Berufsvorbereitung)"
+
+# Felder aus Vorschlägen + Freitext (multiselect_with_free_text)
+LISTENFELDER = ("verfahren", "maschinen", "werkstoffe", "normen", "messmittel", "sicherheit")
+
+@dataclass(frozen=True)
+class MetallEingabe:
+    """Alle Eingaben des Metall-Promptbuilders."""
+    bildungsgang: str = ""
+    beruf: str = ""
+    jahr: str = "-"
+    lernort: str = ""
+    aufgabentyp: str = ""
+    output: tuple[str, ...] = ()
+    sprache: str = "Deutsch"
+    ton: str = "instruktiv & geduldig"
+    didaktik: tuple[str, ...] = ()
+    lernziel: str = ""
+    verfahren: Eintraege = Eintraege()
+    maschinen: Eintraege = Eintraege()
+    werkstoffe: Eintraege = Eintraege()
+    normen: Eintraege = Eintraege()
+    messmittel: Eintraege = Eintraege()
+    toleranzen: str = ""
+    sicherheit: Eintraege = Eintraege()
+    zeit: int = 60
+    materialien: str = ""
+    zeichnung: str = ""
+    kontext: str = ""
+
+    def __post_init__(self):
+        als_eintraege(self, LISTENFELDER)
+
+    @classmethod
+    def from_record(cls, rec: dict) -> "MetallEingabe":
+        """
+        Datensatz (z. B. aus der HTTP-API) übernehmen und prüfen.
+        Listenfelder dürfen Listen oder Text (eine Angabe pro Zeile bzw. durch `|` getrennt) sein.
+        """
+        felder = {f.name: f for f in fields(cls)}
+        unbekannt = set(rec) - felder.keys() - {"id"}
+        if unbekannt:
+            raise ValueError(f"Unbekannte Felder: {', '.join(sorted(unbekannt))}")
+        werte = {}
+        for name, wert in rec.items():
+            if name == "id" or wert is None:
+                continue
+            if name in LISTENFELDER:
+                werte[name] = aus_datensatz(name, wert)
+            elif name in ("output", "didaktik"):
+                liste = wert.split("|") if isinstance(wert, str) else listenwerte(name, wert)
+                werte[name] = tuple(x.strip() for x in liste if x.strip())
+            elif name == "zeit":
+                try:
+                    werte[name] = int(wert)
+                except (TypeError, ValueError):
+                    raise ValueError("Feld 'zeit' muss eine Zahl (Minuten) sein") from None
+                if not 5 <= werte[name] <= 480:
+                    raise ValueError("Feld 'zeit' muss zwischen 5 und 480 Minuten liegen")
+            elif isinstance(wert, (str, int, float)):
+                werte[name] = str(wert)
+            else:
+                raise ValueError(f"Feld {name!r} muss Text sein")
+        return cls(**werte)
+
+def build_payload(e: MetallEingabe) -> dict:
+    """Maschinenlesbare Prompt-Metadaten (ohne `meta`)."""
+    return {
+        "bildungsgang": e.bildungsgang,
+        "rolle": f"Du bist Ausbilder:in/Coach im Metallbereich für {e.beruf} (AJ {e.jahr}).",
+        "ziel": "Unterstütze die/den Lernende:n mit klaren, sicheren, normgerechten und prüfungsnahen Anweisungen (Niveau an Bildungsgang anpassen).",
+        "lernort": e.lernort,
+        "aufgabentyp": e.aufgabentyp,
+        "sprache": e.sprache,
+        "ton": e.ton,
+        "didaktik": list(e.didaktik),
+        "lernziel": e.lernziel.strip(),
+        "verfahren": list(e.verfahren.texte),
+        "maschinen": list(e.maschinen.texte),
+        "werkstoffe": list(e.werkstoffe.texte),
+        "normen": list(e.normen.texte),
+        "messmittel": list(e.messmittel.texte),
+        "toleranzen": e.toleranzen.strip(),
+        "toleranzen_aufgeloest": [x.als_dict() for x in aufloesen(e.toleranzen.strip()).eintraege],
+        "sicherheit": list(e.sicherheit.texte),
+        "zeit_min": e.zeit,
+        "materialliste": [x.strip() for x in e.materialien.splitlines() if x.strip()],
+        "zeichnung_ref": e.zeichnung.strip(),
+        "kontext": e.kontext.strip(),
+        "gewünschter_output": list(e.output),
+    }
+
+VORLAGE = lade("metall_prompt")
+
+# Entspricht dem früheren textwrap.dedent: Zeilen nur aus Leerraum werden geleert
+_NUR_LEERRAUM = re.compile(r"(?m)^[ \t]+$")
+
+def build_prompt(e: MetallEingabe, payload: dict, zustand: dict | None = None, kurz: bool = False) -> str:
+    """Prompt aus dem Payload; `kurz` wählt den knappen Anweisungsblock (Kompaktierung)."""
+    tol = aufloesen(payload["toleranzen"])  # gecacht; passt auch zu gekürztem Text
+    text = VORLAGE.render({**payload, "jahr": e.jahr, "kurz": kurz,
+                           "toleranzwerte": [x.zeile() for x in tol.werte],
+                           "toleranzfehler": [f.zeile() for f in tol.fehler]}, zustand, strip=True)
+    return _NUR_LEERRAUM.sub("", text)
+
+def erzeuge_prompt(e: MetallEingabe, cache=TEXT_CACHE, zustand: dict | None = None) -> tuple[str, dict]:
+    """(prompt_text, payload) über den gemeinsamen Cache; `zustand` wie bei `Vorlage.render`."""
+    def erzeugen():
+        payload = build_payload(e)
+        return build_prompt(e, payload, zustand), payload
+    return cache.get_or_create("metall_prompt", e, erzeugen)
+
+def mit_meta(payload: dict, erstellt: str) -> dict:
+    """Zeitabhängige Metadaten außerhalb des gecachten Teils ergänzen."""
+    return {**payload, "meta": {"erstellt": erstellt, "builder": BUILDER}}
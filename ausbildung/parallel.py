@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""Paketieren und begrenzt paralleles Abarbeiten – gemeinsam für CLI, API, Promptbibliothek und LLM-Client."""
+from collections import deque
+
+def batched(iterable, size: int):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def bounded_map(executor, fn, batches, max_pending: int):
+    """
+    Wie `executor.map`, aber mit begrenzter Anzahl offener Aufträge.
+    `Executor.map` würde die gesamte Eingabe sofort einlesen und einreichen.
+    """
+    pending = deque()
+    for batch in batches:
+        pending.append(executor.submit(fn, batch))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
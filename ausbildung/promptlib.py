@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+Prompt-Bibliothek (SQLite mit FTS5) für erzeugte Metall-Prompts – ohne Streamlit.
+
+Jeder Prompt wird unter dem SHA-256 seines Textes abgelegt: Derselbe Prompt
+steht nur einmal in der Bibliothek, weitere Erzeugungen erhöhen `anzahl` und
+`zuletzt`. Volltextsuche über Prompt, Beruf, Aufgabentyp und Verfahren (FTS5,
+Präfixe, Umlaute/Akzente egal, Ranking nach BM25); Filter über Indizes auf
+Beruf, Aufgabentyp und eine Verfahrenstabelle. Import und Export als JSONL
+laufen zeilenweise bzw. in Paketen – auch bei zehntausenden Prompts.
+
+    python -m ausbildung.promptlib suche "drehen welle" --beruf "Zerspanungsmechaniker:in"
+    python -m ausbildung.promptlib export prompts.jsonl
+    python -m ausbildung.promptlib import prompts.jsonl
+
+Datei wie die Entwurfsablage (`AUSBILDUNG_DB`, eigene Tabellen).
+"""
+from dataclasses import dataclass
+from datetime import datetime
+import argparse
+import atexit
+import hashlib
+import io
+import json
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+from ausbildung.entwuerfe import DB_PFAD
+from ausbildung.export import SPOOL_BYTES
+from ausbildung.parallel import batched
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS prompts (
+    id          INTEGER PRIMARY KEY,
+    hash        TEXT NOT NULL UNIQUE,
+    beruf       TEXT NOT NULL DEFAULT '',
+    aufgabentyp TEXT NOT NULL DEFAULT '',
+    verfahren   TEXT NOT NULL DEFAULT '',
+    erstellt    REAL NOT NULL,
+    zuletzt     REAL NOT NULL,
+    anzahl      INTEGER NOT NULL DEFAULT 1,
+    -- große Spalten zuletzt: Filter und Sortierung lesen keine Überlaufseiten
+    prompt      TEXT NOT NULL,
+    payload     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS prompts_beruf ON prompts (beruf, zuletzt);
+CREATE INDEX IF NOT EXISTS prompts_aufgabentyp ON prompts (aufgabentyp, zuletzt);
+CREATE INDEX IF NOT EXISTS prompts_zuletzt ON prompts (zuletzt);
+CREATE TABLE IF NOT EXISTS prompt_verfahren (
+    verfahren TEXT NOT NULL,
+    prompt_id INTEGER NOT NULL,
+    PRIMARY KEY (verfahren, prompt_id)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS prompts_fts USING fts5(
+    prompt, beruf, aufgabentyp, verfahren,
+    content='prompts', content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS prompts_neu AFTER INSERT ON prompts BEGIN
+    INSERT INTO prompts_fts (rowid, prompt, beruf, aufgabentyp, verfahren)
+    VALUES (new.id, new.prompt, new.beruf, new.aufgabentyp, new.verfahren);
+END;
+CREATE TRIGGER IF NOT EXISTS prompts_weg AFTER DELETE ON prompts BEGIN
+    INSERT INTO prompts_fts (prompts_fts, rowid, prompt, beruf, aufgabentyp, verfahren)
+    VALUES ('delete', old.id, old.prompt, old.beruf, old.aufgabentyp, old.verfahren);
+    DELETE FROM prompt_verfahren WHERE prompt_id = old.id;
+END;
+"""
+
+MAX_MELDUNGEN = 100  # gemeldete übersprungene Zeilen je Import (gezählt werden alle)
+
+# Gewichte für bm25(): Prompt, Beruf, Aufgabentyp, Verfahren
+_GEWICHTE = "1.0, 4.0, 2.0, 3.0"
+_WORT = re.compile(r"\w+")
+
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+def fts_anfrage(text: str) -> str:
+    """Freie Eingabe → FTS5-Ausdruck: alle Wörter als Präfix, UND-verknüpft (keine Syntaxfehler möglich)."""
+    return " ".join(f'"{w}"*' for w in _WORT.findall(text))
+
+@dataclass(frozen=True)
+class Treffer:
+    hash: str
+    beruf: str
+    aufgabentyp: str
+    verfahren: tuple[str, ...]
+    zuletzt: datetime
+    anzahl: int
+    auszug: str
+
+class Promptbibliothek:
+    """Inhaltsadressierte Ablage mit Volltextsuche; eine Verbindung, von allen Sessions geteilt."""
+
+    def __init__(self, pfad: str = DB_PFAD):
+        self.pfad = pfad
+        self._db = None
+        self._lock = threading.Lock()
+        self._facetten = None  # (Stand, Ergebnis); verworfen bei eigenen Schreibvorgängen
+
+    def _verbindung(self) -> sqlite3.Connection:
+        if self._db is None:
+            db = sqlite3.connect(self.pfad, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(SCHEMA)
+            self._db = db
+        return self._db
+
+    # ── Schreiben ───────────────────────────────────────────────────────────────
+    def _ablegen(self, db, prompt: str, payload: dict, beruf: str, zeit: float, anzahl: int = 1) -> bool:
+        payload = {k: v for k, v in payload.items() if k != "meta"}  # Zeitstempel gehört nicht zum Inhalt
+        verfahren = [str(v) for v in payload.get("verfahren", [])]
+        h = prompt_hash(prompt)
+        cur = db.execute(
+            "INSERT OR IGNORE INTO prompts (hash, prompt, payload, beruf, aufgabentyp, verfahren, erstellt, zuletzt, anzahl) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (h, prompt, json.dumps(payload, ensure_ascii=False), beruf,
+             str(payload.get("aufgabentyp", "")), "\n".join(verfahren), zeit, zeit, anzahl),
+        )
+        if not cur.rowcount:
+            db.execute("UPDATE prompts SET zuletzt = max(zuletzt, ?), anzahl = anzahl + ? WHERE hash = ?", (zeit, anzahl, h))
+            return False
+        db.executemany("INSERT OR IGNORE INTO prompt_verfahren (verfahren, prompt_id) VALUES (?, ?)",
+                       [(v, cur.lastrowid) for v in verfahren])
+        self._facetten = None
+        return True
+
+    def ablegen(self, prompt: str, payload: dict, beruf: str = "") -> str:
+        """Prompt ablegen (oder Zähler erhöhen); liefert den Hash."""
+        with self._lock:
+            db = self._verbindung()
+            with db:
+                db.execute("BEGIN")
+                self._ablegen(db, prompt, payload, beruf, time.time())
+        return prompt_hash(prompt)
+
+    def loeschen(self, hash: str) -> bool:
+        with self._lock:
+            db = self._verbindung()
+            with db:
+                db.execute("BEGIN")
+                self._facetten = None
+                return db.execute("DELETE FROM prompts WHERE hash = ?", (hash,)).rowcount > 0
+
+    # ── Lesen ───────────────────────────────────────────────────────────────────
+    def suche(self, anfrage: str = "", beruf: str | None = None, aufgabentyp: str | None = None,
+              verfahren: str | None = None, limit: int = 20) -> list[Treffer]:
+        """Treffer nach Relevanz (mit Suchtext) bzw. zuletzt genutzt zuerst."""
+        bedingungen, werte = [], []
+        for spalte, wert in (("p.beruf", beruf), ("p.aufgabentyp", aufgabentyp)):
+            if wert:
+                bedingungen.append(f"{spalte} = ?")
+                werte.append(wert)
+        if verfahren:
+            bedingungen.append("p.id IN (SELECT prompt_id FROM prompt_verfahren WHERE verfahren = ?)")
+            werte.append(verfahren)
+        felder = "p.hash, p.beruf, p.aufgabentyp, p.verfahren, p.zuletzt, p.anzahl"
+        ausdruck = fts_anfrage(anfrage)
+        if ausdruck:
+            # Erst die besten Zeilen-IDs bestimmen (ohne Join, falls kein Filter), Auszug nur für diese
+            quelle = "prompts_fts" + (" JOIN prompts p ON p.id = prompts_fts.rowid" if bedingungen else "")
+            sql = (
+                f"WITH beste AS (SELECT prompts_fts.rowid AS id, bm25(prompts_fts, {_GEWICHTE}) AS rang FROM {quelle} "
+                f"WHERE {' AND '.join(['prompts_fts MATCH ?', *bedingungen])} ORDER BY rang LIMIT ?) "
+                f"SELECT {felder}, snippet(prompts_fts, 0, '**', '**', ' … ', 16) FROM beste "
+                "JOIN prompts p ON p.id = beste.id JOIN prompts_fts ON prompts_fts.rowid = beste.id "
+                "WHERE prompts_fts MATCH ? ORDER BY beste.rang"
+            )
+            werte = [ausdruck, *werte, limit, ausdruck]
+        else:
+            sql = (f"SELECT {felder}, substr(p.prompt, 1, 160) FROM prompts p"
+                   + (" WHERE " + " AND ".join(bedingungen) if bedingungen else "")
+                   + " ORDER BY p.zuletzt DESC LIMIT ?")
+            werte.append(limit)
+        with self._lock:
+            zeilen = self._verbindung().execute(sql, werte).fetchall()
+        return [
+            Treffer(h, b, a, tuple(v.split("\n")) if v else (), datetime.fromtimestamp(z), n, " ".join(s.split()))
+            for h, b, a, v, z, n, s in zeilen
+        ]
+
+    def lade(self, hash: str) -> tuple[str, dict] | None:
+        """(prompt, payload) zu einem Hash."""
+        with self._lock:
+            zeile = self._verbindung().execute("SELECT prompt, payload FROM prompts WHERE hash = ?", (hash,)).fetchone()
+        return (zeile[0], json.loads(zeile[1])) if zeile else None
+
+    def facetten(self) -> dict[str, list[tuple[str, int]]]:
+        """Werte je Filterfeld mit Anzahl Prompts, häufigste zuerst.
+
+        Gecacht, bis diese Instanz schreibt oder ein anderer Prozess die Datenbank
+        ändert (`PRAGMA data_version`) – die Filter-Auswahl fragt bei jedem Rerun.
+        """
+        abfragen = {
+            "beruf": "SELECT beruf, COUNT(*) FROM prompts WHERE beruf != '' GROUP BY beruf",
+            "aufgabentyp": "SELECT aufgabentyp, COUNT(*) FROM prompts WHERE aufgabentyp != '' GROUP BY aufgabentyp",
+            "verfahren": "SELECT verfahren, COUNT(*) FROM prompt_verfahren GROUP BY verfahren",
+        }
+        with self._lock:
+            db = self._verbindung()
+            stand = db.execute("PRAGMA data_version").fetchone()[0]
+            if self._facetten is None or self._facetten[0] != stand:
+                self._facetten = (stand, {
+                    k: sorted(db.execute(sql).fetchall(), key=lambda x: (-x[1], x[0])) for k, sql in abfragen.items()
+                })
+            return self._facetten[1]
+
+    def __len__(self):
+        with self._lock:
+            return self._verbindung().execute("SELECT COUNT(*) FROM prompts").fetchone()[0]
+
+    # ── JSONL ───────────────────────────────────────────────────────────────────
+    def exportiere(self, ziel, paket: int = 500) -> int:
+        """Alle Prompts zeilenweise als JSONL nach `ziel` (Textstrom); liefert die Anzahl."""
+        n, letzte_id = 0, 0
+        while True:
+            with self._lock:  # paketweise, damit andere Sessions zwischendurch zum Zug kommen
+                zeilen = self._verbindung().execute(
+                    "SELECT id, hash, prompt, payload, beruf, erstellt, zuletzt, anzahl FROM prompts "
+                    "WHERE id > ? ORDER BY id LIMIT ?", (letzte_id, paket),
+                ).fetchall()
+            if not zeilen:
+                return n
+            for letzte_id, h, prompt, payload, beruf, erstellt, zuletzt, anzahl in zeilen:
+                ziel.write(json.dumps({
+                    "hash": h, "prompt": prompt, "payload": json.loads(payload), "beruf": beruf,
+                    "erstellt": erstellt, "zuletzt": zuletzt, "anzahl": anzahl,
+                }, ensure_ascii=False) + "\n")
+            n += len(zeilen)
+
+    def export_datei(self) -> bytes:
+        """JSONL-Export über eine temporäre Datei als Bytes, z. B. für einen Download-Button (wie `zip_datei`)."""
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES) as fh:
+            text = io.TextIOWrapper(fh, encoding="utf-8", write_through=True)
+            self.exportiere(text)
+            text.detach()
+            fh.seek(0)
+            return fh.read()
+
+    def importiere(self, quelle, paket: int = 500) -> dict:
+        """
+        JSONL-Zeilen (z. B. offene Datei) einlesen; je Paket eine Transaktion. Der Hash wird neu berechnet.
+        Ungültige Zeilen werden übersprungen und gezählt; die ersten `MAX_MELDUNGEN` stehen als
+        (Zeilennummer, Grund) in `"uebersprungen"` – anzeigen ist Sache von CLI bzw. App.
+        """
+        stand = {"neu": 0, "vorhanden": 0, "fehler": 0, "uebersprungen": []}
+
+        def pruefen(zeile: str) -> tuple:
+            try:
+                rec = json.loads(zeile)
+            except ValueError as exc:
+                raise ValueError(f"kein gültiges JSON ({getattr(exc, 'msg', exc)})") from None
+            if not isinstance(rec, dict):
+                raise ValueError(f"kein JSON-Objekt ({type(rec).__name__})")
+            if not isinstance(rec.get("prompt"), str):
+                raise ValueError("Feld 'prompt' fehlt oder ist kein Text")
+            if not isinstance(rec.get("payload", {}), dict):
+                raise ValueError("Feld 'payload' muss ein Objekt sein")
+            try:
+                anzahl = int(rec.get("anzahl", 1))
+                zeit = float(rec.get("zuletzt") or time.time())
+            except (ValueError, TypeError):
+                raise ValueError("Felder 'anzahl' und 'zuletzt' müssen Zahlen sein") from None
+            if anzahl < 1:
+                raise ValueError("Feld 'anzahl' muss mindestens 1 sein")
+            return rec["prompt"], rec.get("payload", {}), str(rec.get("beruf", "")), zeit, anzahl
+
+        def zeilen():
+            for nr, zeile in enumerate(quelle, start=1):
+                if not zeile.strip():
+                    continue
+                try:
+                    yield pruefen(zeile)
+                except ValueError as exc:
+                    stand["fehler"] += 1
+                    if len(stand["uebersprungen"]) < MAX_MELDUNGEN:
+                        stand["uebersprungen"].append((nr, str(exc)))
+
+        for pack in batched(zeilen(), paket):
+            with self._lock:
+                db = self._verbindung()
+                with db:
+                    db.execute("BEGIN")
+                    for prompt, payload, beruf, zeit, anzahl in pack:
+                        neu = self._ablegen(db, prompt, payload, beruf, zeit, anzahl)
+                        stand["neu" if neu else "vorhanden"] += 1
+        return stand
+
+    def schliessen(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+_bibliothek = None
+_bibliothek_lock = threading.Lock()
+
+def bibliothek() -> Promptbibliothek:
+    """Prozessweite Bibliothek (eine Verbindung für alle Sessions)."""
+    global _bibliothek
+    if _bibliothek is None:
+        with _bibliothek_lock:
+            if _bibliothek is None:
+                _bibliothek = Promptbibliothek()
+                atexit.register(_bibliothek.schliessen)
+    return _bibliothek
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Kommandozeile
+# ────────────────────────────────────────────────────────────────────────────────
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m ausbildung.promptlib", description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("--db", default=DB_PFAD, help="SQLite-Datei (Standard: AUSBILDUNG_DB)")
+    sub = p.add_subparsers(dest="befehl", required=True)
+    s = sub.add_parser("suche", help="Prompts suchen")
+    s.add_argument("anfrage", nargs="?", default="")
+    s.add_argument("--beruf")
+    s.add_argument("--aufgabentyp")
+    s.add_argument("--verfahren")
+    s.add_argument("-n", "--limit", type=int, default=20)
+    sub.add_parser("export", help="Alle Prompts als JSONL").add_argument("ziel", help="Datei oder '-' für stdout")
+    sub.add_parser("import", help="Prompts aus JSONL").add_argument("quelle", help="Datei oder '-' für stdin")
+    args = p.parse_args(argv)
+
+    bib = Promptbibliothek(args.db)
+    try:
+        if args.befehl == "suche":
+            for t in bib.suche(args.anfrage, args.beruf, args.aufgabentyp, args.verfahren, args.limit):
+                print(f"{t.hash[:12]}  {t.zuletzt:%d.%m.%Y}  ×{t.anzahl}  {t.beruf} · {t.aufgabentyp}\n    {t.auszug}")
+        elif args.befehl == "export":
+            fh = sys.stdout if args.ziel == "-" else open(args.ziel, "w", encoding="utf-8")
+            try:
+                n = bib.exportiere(fh)
+            finally:
+                if fh is not sys.stdout:
+                    fh.close()
+            print(f"{n} Prompts exportiert", file=sys.stderr)
+        else:
+            fh = sys.stdin if args.quelle == "-" else open(args.quelle, encoding="utf-8")
+            try:
+                stand = bib.importiere(fh)
+            finally:
+                if fh is not sys.stdin:
+                    fh.close()
+            for nr, grund in stand["uebersprungen"]:
+                print(f"Zeile {nr}: übersprungen – {grund}", file=sys.stderr)
+            if stand["fehler"] > len(stand["uebersprungen"]):
+                print(f"… und {stand['fehler'] - len(stand['uebersprungen'])} weitere ungültige Zeilen", file=sys.stderr)
+            print(f"{stand['neu']} neu, {stand['vorhanden']} bereits vorhanden, {stand['fehler']} Fehler", file=sys.stderr)
+            return 1 if stand["fehler"] else 0
+    finally:
+        bib.schliessen()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Text-Hilfsfunktionen für Generatoren und Vorlagen (ohne Streamlit)."""
+from datetime import date, datetime
+
+def zeilen(text: str) -> list[str]:
+    """Freitext (eine Angabe pro Zeile) in bereinigte Einträge zerlegen."""
+    return [x.strip("- ").strip() for x in text.splitlines() if x.strip()]
+
+def bullet(lines: list[str]) -> str:
+    return "\n".join([f"- {x}" for x in lines if x.strip()])
+
+def section(title: str) -> str:
+    return f"\n## {title}\n"
+
+def daterange_str(d1: date, d2: date) -> str:
+    if d1 == d2:
+        return d1.strftime("%d.%m.%Y")
+    return f"{d1.strftime('%d.%m.%Y')} – {d2.strftime('%d.%m.%Y')}"
+
+def parse_datum(value) -> date:
+    """Datum aus `date`, ISO-String (2024-09-02) oder deutschem Format (02.09.2024)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    s = str(value).strip()
+    for fmt in ("%Y-%m-%d", "%d.%m.%Y"):
+        try:
+            return datetime.strptime(s, fmt).date()
+        except ValueError:
+            pass
+    raise ValueError(f"Ungültiges Datum: {value!r}")
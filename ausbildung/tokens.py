@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Token-Schätzung und Kompaktierung des Metall-Prompts – offline, ohne Streamlit.
+
+`schaetze(text)` nähert die Tokenzahl gängiger BPE-Tokenizer (GPT-/Claude-Familie)
+ohne Tokenizer-Download an: Wörter kosten etwa ein Token je vier Buchstaben,
+Umlaute und ß zusätzlich, Zahlen eins je drei Ziffern, Satzzeichen und
+Zeilenumbrüche je eins. Für deutsche Prompts liegt das meist innerhalb ±15 %.
+Gezählt wird zeilenweise mit Cache: Ändert sich ein Feld, werden nur die
+geänderten Zeilen neu geschätzt.
+
+`kompaktiere(e, budget)` bringt den Prompt stufenweise unter ein Token-Budget
+und hört auf, sobald es passt:
+
+    1. leere Felder („-“) und doppelte Materialangaben entfernen
+    2. knappen Anweisungsblock verwenden
+    3. lange Listen kürzen (8 → 5 → 3 → 1 Einträge, Rest als „+n weitere“)
+    4. lange Freitexte (Kontext, Lernziel) kürzen
+
+Das Toleranzfeld bleibt ungekürzt: Ein abgeschnittener Eintrag (oder eine
+fehlende Allgemeintoleranz) erschiene im Prompt als ungültige Toleranzangabe.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+
+from ausbildung.cache import TEXT_CACHE
+from ausbildung.eintraege import schluessel
+from ausbildung.metall import MetallEingabe, build_payload, build_prompt
+
+BUDGET = 800  # Standard-Budget in Tokens
+
+_STUECK = re.compile(r"[^\W\d_]+|\d+|[ \t]+|.")
+
+# Payload-Felder, die bei Platzmangel gekürzt werden dürfen (Output-Formate bleiben)
+LISTEN = ("verfahren", "maschinen", "werkstoffe", "normen", "messmittel", "sicherheit", "materialliste", "didaktik")
+TEXTE = ("kontext", "lernziel")  # nicht "toleranzen", siehe oben
+_LEERES_FELD = re.compile(r"(?m)^- [^:\n]+:[ \t]*[-—]?[ \t]*\n")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Schätzung
+# ────────────────────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=8192)
+def _zeile(zeile: str) -> int:
+    n = 0
+    for stueck in _STUECK.findall(zeile):
+        c = stueck[0]
+        if c.isalpha():
+            n += -(-len(stueck) // 4) + sum(1 for x in stueck if ord(x) > 127) // 2
+        elif c.isdigit():
+            n += -(-len(stueck) // 3)
+        elif c in " \t":
+            n += len(stueck) > 1  # ein Leerzeichen gehört zum folgenden Wort
+        else:
+            n += 1 if ord(c) < 0x2000 else 2
+    return n
+
+def schaetze(text: str) -> int:
+    """Geschätzte Tokenzahl von `text`."""
+    zeilen = text.split("\n")
+    return sum(_zeile(z) for z in zeilen) + len(zeilen) - 1
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Kompaktierung
+# ────────────────────────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class Kompaktierung:
+    prompt: str
+    tokens_vorher: int
+    tokens_nachher: int
+    schritte: tuple[str, ...]
+    budget: int = BUDGET
+
+    @property
+    def passt(self) -> bool:
+        return self.tokens_nachher <= self.budget
+
+def _gekuerzt(liste: list[str], n: int) -> list[str]:
+    return liste if len(liste) <= n else [*liste[:n], f"+{len(liste) - n} weitere"]
+
+def _text_gekuerzt(text: str, n: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= n else text[:n].rsplit(" ", 1)[0] + " …"
+
+def _ohne_doppelte(payload: dict) -> dict:
+    """Materialliste ohne Wiederholungen und ohne Einträge, die schon bei Maschinen/Messmitteln stehen."""
+    gesehen = {schluessel(x) for feld in ("maschinen", "messmittel") for x in payload[feld]}
+    material = []
+    for x in payload["materialliste"]:
+        if (k := schluessel(x)) not in gesehen:
+            gesehen.add(k)
+            material.append(x)
+    return {**payload, "materialliste": material}
+
+def kompaktiere(e: MetallEingabe, budget: int = BUDGET, payload: dict | None = None) -> Kompaktierung:
+    """Prompt so weit wie nötig kürzen, bis er höchstens `budget` Tokens hat (sofern möglich)."""
+    payload = build_payload(e) if payload is None else payload
+    text = build_prompt(e, payload)
+    vorher = schaetze(text)
+    schritte = []
+
+    def stufe(name: str, neu: str) -> bool:
+        nonlocal text
+        if neu != text:
+            text = neu
+            schritte.append(name)
+        return schaetze(text) <= budget
+
+    def rendern(p: dict) -> str:
+        return _LEERES_FELD.sub("", build_prompt(e, p, kurz=True))
+
+    if vorher > budget:
+        payload = _ohne_doppelte(payload)
+        fertig = stufe("leere Felder und Doppelte entfernt", _LEERES_FELD.sub("", build_prompt(e, payload)))
+        fertig = fertig or stufe("knappe Anweisungen", rendern(payload))
+        basis = payload
+        for n in (8, 5, 3, 1):
+            if fertig:
+                break
+            payload = {**basis, **{f: _gekuerzt(basis[f], n) for f in LISTEN}}
+            fertig = stufe(f"Listen auf {n} {'Eintrag' if n == 1 else 'Einträge'} gekürzt", rendern(payload))
+        basis = payload
+        for n in (400, 200, 80):
+            if fertig:
+                break
+            payload = {**basis, **{f: _text_gekuerzt(basis[f], n) for f in TEXTE}}
+            fertig = stufe(f"Freitexte auf {n} Zeichen gekürzt", rendern(payload))
+    return Kompaktierung(text, vorher, schaetze(text), tuple(schritte), budget)
+
+def erzeuge_kompakt(e: MetallEingabe, budget: int = BUDGET, payload: dict | None = None, cache=TEXT_CACHE) -> Kompaktierung:
+    """`kompaktiere` über den gemeinsamen Cache (Schlüssel: Eingabe und Budget)."""
+    return cache.get_or_create("metall_kompakt", {"e": e, "budget": budget}, lambda: kompaktiere(e, budget, payload))
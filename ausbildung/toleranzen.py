@@ -0,0 +1,534 @@
+# -*- coding: utf-8 -*-
+"""
+Toleranzangaben des Metall-Promptbuilders auflösen – ohne Streamlit.
+
+Das Feld „Toleranzen“ (z. B. „Ø20 H7/g6, 35 ±0,1, ISO 2768-mK, 120, Ra 1,6“)
+wird in Angaben zerlegt und zu Grenzmaßen aufgelöst:
+
+    Ø20 H7, 20g6, Ø20 H7/g6   ISO 286 (Grundabmaße + IT-Grundtoleranzen, bis 500 mm)
+    35 ±0,1, 40 +0,1/-0,05    eingetragene Abmaße
+    120 (mit ISO 2768-m)      Allgemeintoleranz für Längenmaße ohne Angabe
+    Ra 1,6, Ⓜ⌀0,02 …          bleiben unverändert im Text
+
+Unbekannte Toleranzfelder, Grade oder Nennmaße außerhalb der Tabellen werden
+als Fehler gemeldet statt geraten – ebenso alles, was wie ein Maß beginnt (Zahl,
+Ø, L …), aber nicht aufgelöst wird („50 m“, „60°“, „L 50“ ohne ISO 2768-Klasse). Die Normtabellen stehen als Tupel je
+Nennmaßbereich im Modul; beim ersten Zugriff werden daraus die Abmaße aller
+Toleranzfelder × Grade × Bereiche vorberechnet, danach ist jede Angabe ein
+Index-Zugriff. `grenzabmasse` rechnet ganze Zeichnungen (Hunderte Maße)
+vektorisiert mit numpy.
+
+    python -m ausbildung.toleranzen "Ø20 H7/g6, 35 ±0,1, ISO 2768-m, 120"
+    python -m ausbildung.toleranzen --csv zeichnung.csv -o grenzmasse.csv
+"""
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+import argparse
+import csv
+import re
+import sys
+import threading
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Normtabellen (Werte in µm, ISO 2768 in mm)
+# ────────────────────────────────────────────────────────────────────────────────
+# Nennmaßbereiche „über … bis“ (mm), fein unterteilt wie bei den Grundabmaßen c, r, s
+BEREICHE = (3, 6, 10, 14, 18, 24, 30, 40, 50, 65, 80, 100, 120, 140, 160, 180, 200, 225, 250,
+            280, 315, 355, 400, 450, 500)
+# Hauptbereich (3, 6, 10, 18, 30, 50, 80, 120, 180, 250, 315, 400, 500) je feinem Bereich
+_HAUPT = (0, 1, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 8, 9, 9, 9, 10, 10, 11, 11, 12, 12)
+
+# ISO 286-1, Tabelle 1: Grundtoleranzen IT1–IT18 je Hauptbereich
+_IT = {
+    1: (0.8, 1, 1, 1.2, 1.5, 1.5, 2, 2.5, 3.5, 4.5, 6, 7, 8),
+    2: (1.2, 1.5, 1.5, 2, 2.5, 2.5, 3, 4, 5, 7, 8, 9, 10),
+    3: (2, 2.5, 2.5, 3, 4, 4, 5, 6, 8, 10, 12, 13, 15),
+    4: (3, 4, 4, 5, 6, 7, 8, 10, 12, 14, 16, 18, 20),
+    5: (4, 5, 6, 8, 9, 11, 13, 15, 18, 20, 23, 25, 27),
+    6: (6, 8, 9, 11, 13, 16, 19, 22, 25, 29, 32, 36, 40),
+    7: (10, 12, 15, 18, 21, 25, 30, 35, 40, 46, 52, 57, 63),
+    8: (14, 18, 22, 27, 33, 39, 46, 54, 63, 72, 81, 89, 97),
+    9: (25, 30, 36, 43, 52, 62, 74, 87, 100, 115, 130, 140, 155),
+    10: (40, 48, 58, 70, 84, 100, 120, 140, 160, 185, 210, 230, 250),
+    11: (60, 75, 90, 110, 130, 160, 190, 220, 250, 290, 320, 360, 400),
+    12: (100, 120, 150, 180, 210, 250, 300, 350, 400, 460, 520, 570, 630),
+    13: (140, 180, 220, 270, 330, 390, 460, 540, 630, 720, 810, 890, 970),
+    14: (250, 300, 360, 430, 520, 620, 740, 870, 1000, 1150, 1300, 1400, 1550),
+    15: (400, 480, 580, 700, 840, 1000, 1200, 1400, 1600, 1850, 2100, 2300, 2500),
+    16: (600, 750, 900, 1100, 1300, 1600, 1900, 2200, 2500, 2900, 3200, 3600, 4000),
+    17: (1000, 1200, 1500, 1800, 2100, 2500, 3000, 3500, 4000, 4600, 5200, 5700, 6300),
+    18: (1400, 1800, 2200, 2700, 3300, 3900, 4600, 5400, 6300, 7200, 8100, 8900, 9700),
+}
+GRADE = range(1, 19)
+
+# ISO 286-1, Tabellen 2/3: Grundabmaße der Wellen – oberes (es, c–h) bzw. unteres (ei, k–s),
+# 13 Werte je Hauptbereich oder 25 je feinem Bereich; k gilt für IT4–IT7, sonst 0
+_WELLE_ES = {
+    "c": (-60, -70, -80, -95, -95, -110, -110, -120, -130, -140, -150, -170, -180, -200, -210, -230,
+          -240, -260, -280, -300, -330, -360, -400, -440, -480),
+    "d": (-20, -30, -40, -50, -65, -80, -100, -120, -145, -170, -190, -210, -230),
+    "e": (-14, -20, -25, -32, -40, -50, -60, -72, -85, -100, -110, -125, -135),
+    "f": (-6, -10, -13, -16, -20, -25, -30, -36, -43, -50, -56, -62, -68),
+    "g": (-2, -4, -5, -6, -7, -9, -10, -12, -14, -15, -17, -18, -20),
+    "h": (0,) * 13,
+}
+_WELLE_EI = {
+    "k": (0, 1, 1, 1, 2, 2, 2, 3, 3, 4, 4, 4, 5),
+    "m": (2, 4, 6, 7, 8, 9, 11, 13, 15, 17, 20, 21, 23),
+    "n": (4, 8, 10, 12, 15, 17, 20, 23, 27, 31, 34, 37, 40),
+    "p": (6, 12, 15, 18, 22, 26, 32, 37, 43, 50, 56, 62, 68),
+    "r": (10, 15, 19, 23, 23, 28, 28, 34, 34, 41, 43, 51, 54, 63, 65, 68, 77, 80, 84, 94, 98, 108, 114,
+          126, 132),
+    "s": (14, 19, 23, 28, 28, 35, 35, 43, 43, 53, 59, 71, 79, 92, 100, 108, 122, 130, 140, 158, 170, 190,
+          208, 232, 252),
+}
+WELLEN = (*_WELLE_ES, "js", *_WELLE_EI)
+BOHRUNGEN = tuple(s.upper() for s in WELLEN)
+SYMBOLE = BOHRUNGEN + WELLEN
+
+# ISO 2768-1: Grenzabmaße (±, mm) für Längenmaße ohne Toleranzangabe, Bereiche „0,5 bis 3“, „über 3 bis 6“ …
+ALLGEMEIN_BEREICHE = (3, 6, 30, 120, 400, 1000, 2000, 4000)
+ALLGEMEIN = {
+    "f": (0.05, 0.05, 0.1, 0.15, 0.2, 0.3, 0.5, None),
+    "m": (0.1, 0.1, 0.2, 0.3, 0.5, 0.8, 1.2, 2),
+    "c": (0.2, 0.3, 0.5, 0.8, 1.2, 2, 3, 4),
+    "v": (None, 0.5, 1, 1.5, 2.5, 4, 6, 8),
+}
+ALLGEMEIN_NAMEN = {"f": "fein", "m": "mittel", "c": "grob", "v": "sehr grob"}
+
+def _fein(werte: tuple) -> tuple:
+    return werte if len(werte) == len(BEREICHE) else tuple(werte[h] for h in _HAUPT)
+
+def _it(grad: int, b: int) -> float:
+    return _IT[grad][_HAUPT[b]]
+
+def _berechne(symbol: str, grad: int, b: int) -> tuple[float, float]:
+    """(oberes, unteres) Abmaß in µm nach den Regeln von ISO 286-1 – Grundlage der vorberechneten Tabelle."""
+    it = _it(grad, b)
+    s = symbol.lower()
+    if s == "js":
+        halb = (it - it % 2 if 7 <= grad <= 11 and it == int(it) else it) / 2  # js7–js11: ungerade IT abrunden
+        return halb, -halb
+    if symbol in WELLEN:
+        if s in _WELLE_ES:
+            es = _fein(_WELLE_ES[s])[b]
+            return es, es - it
+        ei = _fein(_WELLE_EI[s])[b] if s != "k" or 4 <= grad <= 7 else 0
+        return ei + it, ei
+    if s in _WELLE_ES:  # Bohrungen A–H: EI = −es
+        ei = -_fein(_WELLE_ES[s])[b]
+        return ei + it, ei
+    ei_welle = _fein(_WELLE_EI[s])[b]
+    delta = _it(grad, b) - _it(grad - 1, b) if 3 <= grad <= 8 and b > 0 else 0
+    if s in "kmn" and grad <= 8:
+        es = -ei_welle + delta
+        if symbol == "M" and grad == 6 and _HAUPT[b] == 10:
+            es = -9  # Sonderfall der Norm (M6, 250–315 mm)
+    elif s == "k":
+        es = 0
+    elif s == "m":
+        es = -ei_welle
+    elif s == "n":
+        es = 0 if b > 0 else -ei_welle
+    else:  # P, R, S
+        es = -ei_welle + delta if grad <= 7 else -ei_welle
+    return es, es - it
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Vorberechnete Abmaße (lazy, prozessweit)
+# ────────────────────────────────────────────────────────────────────────────────
+_tabelle: dict[str, tuple[array, array]] | None = None
+_tabelle_lock = threading.Lock()
+
+def tabelle() -> dict[str, tuple[array, array]]:
+    """
+    Symbol → (oberes, unteres) Abmaß in µm als flache Arrays, Index `(Grad − 1) · len(BEREICHE) + Bereich`;
+    beim ersten Zugriff berechnet.
+    """
+    global _tabelle
+    if _tabelle is None:
+        with _tabelle_lock:
+            if _tabelle is None:
+                t = {}
+                for sym in SYMBOLE:
+                    werte = [_berechne(sym, g, b) for g in GRADE for b in range(len(BEREICHE))]
+                    t[sym] = array("d", (o for o, _ in werte)), array("d", (u for _, u in werte))
+                _tabelle = t
+    return _tabelle
+
+def bereich(nennmass: float) -> int:
+    """Index des Nennmaßbereichs („über … bis“); ValueError außerhalb 0 … 500 mm."""
+    if not 0 < nennmass <= BEREICHE[-1]:
+        raise ValueError(f"Nennmaß {_zahl(nennmass)} mm außerhalb ISO 286-Tabelle (über 0 bis {BEREICHE[-1]} mm)")
+    return bisect_left(BEREICHE, nennmass)
+
+def _kurzzeichen(kurz: str) -> tuple[str, int]:
+    """„H7“ → ("H", 7), „js6“ → ("js", 6); ValueError bei unbekanntem Feld oder Grad."""
+    m = re.fullmatch(r"\s*([A-Za-z]{1,2})\s*(\d{1,2})\s*", kurz)
+    if not m:
+        raise ValueError(f"„{kurz}“ ist kein ISO-Kurzzeichen (z. B. H7, g6)")
+    buchst, grad = m.group(1), int(m.group(2))
+    symbol = "JS" if buchst in ("JS", "Js") else buchst
+    if symbol not in SYMBOLE:
+        if symbol.upper() == "J":
+            raise ValueError(f"Toleranzfeld {symbol} ist nicht tabelliert – {symbol}S/{symbol.lower()}s verwenden")
+        raise ValueError(f"Unbekanntes Toleranzfeld „{buchst}“ (bekannt: {' '.join(BOHRUNGEN)} / {' '.join(WELLEN)})")
+    if grad not in GRADE:
+        raise ValueError(f"Grad IT{grad} gibt es nicht (IT1–IT18)")
+    return symbol, grad
+
+def abmasse(nennmass: float, kurz: str) -> tuple[float, float]:
+    """(oberes, unteres) Abmaß in mm für z. B. `abmasse(20, "H7")` → (0.021, 0.0)."""
+    symbol, grad = _kurzzeichen(kurz)
+    b = bereich(nennmass)
+    if grad >= 14 and nennmass <= 1:
+        raise ValueError(f"IT{grad} ist erst über 1 mm Nennmaß festgelegt")
+    oben, unten = tabelle()[symbol]
+    i = (grad - 1) * len(BEREICHE) + b
+    return oben[i] / 1000, unten[i] / 1000
+
+def allgemeintoleranz(nennmass: float, klasse: str) -> float:
+    """Grenzabmaß ± in mm nach ISO 2768-1 für Klasse f, m, c oder v."""
+    if klasse not in ALLGEMEIN:
+        raise ValueError(f"ISO 2768-1 kennt die Klassen f, m, c, v – nicht „{klasse}“")
+    if not 0.5 <= nennmass <= ALLGEMEIN_BEREICHE[-1]:
+        raise ValueError(f"Nennmaß {_zahl(nennmass)} mm außerhalb ISO 2768-1 (0,5 bis 4000 mm) – Toleranz direkt angeben")
+    wert = ALLGEMEIN[klasse][bisect_left(ALLGEMEIN_BEREICHE, nennmass)]
+    if wert is None:
+        raise ValueError(f"ISO 2768-{klasse} legt für {_zahl(nennmass)} mm keine Allgemeintoleranz fest")
+    return wert
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Ergebnisse
+# ────────────────────────────────────────────────────────────────────────────────
+def _zahl(x: float, stellen: int | None = None) -> str:
+    text = f"{x:.{stellen}f}" if stellen is not None else f"{x:g}"
+    return text.replace(".", ",")
+
+# Zeilen landen im Prompt: nur Latin-1-Zeichen, damit der knappe Prompt (Kompaktierung) bei 1 Byte je Zeichen bleibt
+def _abmass(x: float) -> str:
+    return "0" if abs(x) < 1e-9 else f"{'+' if x > 0 else '-'}{_zahl(abs(x), 3).rstrip('0').rstrip(',')}"
+
+@dataclass(frozen=True)
+class Grenzmass:
+    """Aufgelöste Maßangabe; Abmaße und Grenzmaße in mm."""
+    angabe: str
+    nennmass: float
+    toleranz: str  # „H7“, „±0,1“, „ISO 2768-m“
+    norm: str  # „ISO 286“, „ISO 2768-1“ oder „Angabe“
+    oben: float
+    unten: float
+
+    @property
+    def hoechstmass(self) -> float:
+        return round(self.nennmass + self.oben, 4)
+
+    @property
+    def mindestmass(self) -> float:
+        return round(self.nennmass + self.unten, 4)
+
+    def zeile(self) -> str:
+        return (f"{self.angabe}: {_abmass(self.oben)}/{_abmass(self.unten)} = "
+                f"{_zahl(self.mindestmass, 3)} bis {_zahl(self.hoechstmass, 3)} mm")
+
+    def als_dict(self) -> dict:
+        return {
+            "angabe": self.angabe, "nennmass_mm": self.nennmass, "toleranz": self.toleranz, "norm": self.norm,
+            "oberes_abmass_mm": round(self.oben, 4), "unteres_abmass_mm": round(self.unten, 4),
+            "hoechstmass_mm": self.hoechstmass, "mindestmass_mm": self.mindestmass,
+        }
+
+@dataclass(frozen=True)
+class Passung:
+    """Passung aus Bohrung und Welle (z. B. Ø20 H7/g6); Spiel in mm, negativ = Übermaß."""
+    angabe: str
+    bohrung: Grenzmass
+    welle: Grenzmass
+
+    @property
+    def spiel_max(self) -> float:
+        return round(self.bohrung.oben - self.welle.unten, 4)
+
+    @property
+    def spiel_min(self) -> float:
+        return round(self.bohrung.unten - self.welle.oben, 4)
+
+    @property
+    def art(self) -> str:
+        if self.spiel_min >= 0:
+            return "Spielpassung"
+        return "Übermaßpassung" if self.spiel_max <= 0 else "Übergangspassung"
+
+    def zeile(self) -> str:
+        b, w = self.bohrung, self.welle
+        return (f"{self.angabe}: Bohrung {_abmass(b.oben)}/{_abmass(b.unten)}, Welle {_abmass(w.oben)}/{_abmass(w.unten)}"
+                f" = {self.art}, {self._bereich()}")
+
+    def _bereich(self) -> str:
+        lo, hi = self.spiel_min, self.spiel_max
+        if lo >= 0:
+            return f"Spiel {_zahl(lo, 3)} bis {_zahl(hi, 3)} mm"
+        if hi <= 0:
+            return f"Übermaß {_zahl(-hi, 3)} bis {_zahl(-lo, 3)} mm"
+        return f"Spiel bis {_zahl(hi, 3)} mm, Übermaß bis {_zahl(-lo, 3)} mm"
+
+    def als_dict(self) -> dict:
+        return {
+            "angabe": self.angabe, "nennmass_mm": self.bohrung.nennmass,
+            "toleranz": f"{self.bohrung.toleranz}/{self.welle.toleranz}", "norm": "ISO 286",
+            **{teil: {k: v for k, v in g.als_dict().items() if k not in ("angabe", "nennmass_mm", "norm")}
+               for teil, g in (("bohrung", self.bohrung), ("welle", self.welle))},
+            "passung": self.art, "spiel_min_mm": self.spiel_min, "spiel_max_mm": self.spiel_max,
+        }
+
+@dataclass(frozen=True)
+class Fehler:
+    angabe: str
+    grund: str
+
+    def zeile(self) -> str:
+        return f"{self.angabe}: {self.grund}"
+
+    def als_dict(self) -> dict:
+        return {"angabe": self.angabe, "fehler": self.grund}
+
+@dataclass(frozen=True)
+class Aufloesung:
+    eintraege: tuple[Grenzmass | Passung | Fehler, ...] = ()  # in Eingabereihenfolge
+    allgemein: str = ""  # ISO 2768-Klasse, z. B. „m“ oder „mK“
+
+    @property
+    def werte(self) -> tuple[Grenzmass | Passung, ...]:
+        return tuple(x for x in self.eintraege if not isinstance(x, Fehler))
+
+    @property
+    def fehler(self) -> tuple[Fehler, ...]:
+        return tuple(x for x in self.eintraege if isinstance(x, Fehler))
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Parser
+# ────────────────────────────────────────────────────────────────────────────────
+# Trennt an „;“, Zeilenumbruch und Kommas, auf die keine Ziffer folgt (Dezimalkomma bleibt)
+_TRENNER = re.compile(r"[;\n]|,(?!\d)")
+_ZAHL = r"\d+(?:[.,]\d+)?"
+_MASS = rf"(?:[Ø⌀∅]|[dD]\s*=?)?\s*({_ZAHL})\s*(?:mm)?"
+_ZUSATZ = r"(?:\s*\(.*\))?$"  # „Ø20 H7 (Lagersitz)“
+_FELD = r"(?![xX]\s*\d)([A-Za-z]{1,2})\s*(\d{1,2})"  # „20 x 5“ ist kein Toleranzfeld
+_KURZ = re.compile(r"[A-Za-z]{1,2}\s*\d{1,2}")
+_PASSMASS = re.compile(rf"^{_MASS}\s*{_FELD}(?:\s*/\s*{_FELD})?{_ZUSATZ}")
+_PLUSMINUS = re.compile(rf"^{_MASS}\s*±\s*({_ZAHL}){_ZUSATZ}")
+_ABMASSE = re.compile(rf"^{_MASS}\s*([+\-−]\s*{_ZAHL}|0)\s*/\s*([+\-−]\s*{_ZAHL}|0){_ZUSATZ}")
+_ALLGEMEIN = re.compile(r"(?:DIN\s*)?(?:ISO|EN)?\s*2768(?:-1)?\s*[-–]?\s*([fmcv])\s*([HKL])?\b", re.IGNORECASE)
+# „H7“ ist ein Toleranzfeld, kein Maß: Buchstaben nur mit Abstand/Doppelpunkt, außer L (kein ISO-Feld)
+_MASSWORT = r"(?:(?:L|B|H|T|Länge|Breite|Höhe|Tiefe|Abstand|Maß)(?:\s*:\s*|\s+)|L(?=\d)|(?:Länge|Breite|Höhe|Tiefe))?"
+_NUR_MASS = re.compile(rf"^{_MASSWORT}{_MASS}{_ZUSATZ}")
+# Beginnt wie ein Maß (Zahl, Ø, d=, L …) – was davon nicht aufgelöst wird, ist ein Fehler
+_MASSARTIG = re.compile(rf"^{_MASSWORT}(?:[Ø⌀∅]|[dD]\s*=?)?\s*\d")
+
+def _float(text: str) -> float:
+    return float(text.replace(" ", "").replace("−", "-").replace(",", "."))
+
+def _passmass(angabe: str, m: re.Match) -> Grenzmass | Passung:
+    d = _float(m.group(1))
+    kurz = f"{m.group(2)}{m.group(3)}"
+    oben, unten = abmasse(d, kurz)
+    erstes = Grenzmass(angabe, d, kurz, "ISO 286", oben, unten)
+    if not m.group(4):
+        return erstes
+    zweites_kurz = f"{m.group(4)}{m.group(5)}"
+    if _kurzzeichen(kurz)[0] not in BOHRUNGEN or _kurzzeichen(zweites_kurz)[0] not in WELLEN:
+        raise ValueError("Passung als Bohrung/Welle angeben, z. B. H7/g6")
+    return Passung(angabe, erstes, Grenzmass(angabe, d, zweites_kurz, "ISO 286", *abmasse(d, zweites_kurz)))
+
+@lru_cache(maxsize=512)
+def aufloesen(text: str) -> Aufloesung:
+    """Alle Angaben aus dem Toleranzfeld; Angaben ohne Maßbezug (Ra, Form/Lage …) werden übergangen."""
+    if not text or not text.strip():
+        return Aufloesung()
+    angaben = [a.strip() for a in _TRENNER.split(text) if a and a.strip()]
+    allgemein = ""
+    for a in angaben:
+        if m := _ALLGEMEIN.search(a):
+            allgemein = m.group(1).lower() + (m.group(2) or "").upper()
+    eintraege = []
+    for a in angaben:
+        try:
+            if m := _PASSMASS.match(a):
+                eintraege.append(_passmass(a, m))
+            elif m := _PLUSMINUS.match(a):
+                t = _float(m.group(2))
+                eintraege.append(Grenzmass(a, _float(m.group(1)), f"±{_zahl(t)}", "Angabe", t, -t))
+            elif m := _ABMASSE.match(a):
+                oben, unten = sorted((_float(m.group(2)), _float(m.group(3))), reverse=True)
+                eintraege.append(Grenzmass(a, _float(m.group(1)), f"{_abmass(oben)}/{_abmass(unten)}", "Angabe", oben, unten))
+            elif _ALLGEMEIN.search(a):
+                continue
+            elif "2768" in a:
+                raise ValueError("Allgemeintoleranz nicht erkannt – ISO 2768-1 kennt die Klassen f, m, c, v (z. B. ISO 2768-mK)")
+            elif (m := _NUR_MASS.match(a)) and allgemein:
+                d = _float(m.group(1))
+                t = allgemeintoleranz(d, allgemein[0])
+                eintraege.append(Grenzmass(a, d, f"ISO 2768-{allgemein[0]}", "ISO 2768-1", t, -t))
+            elif m:
+                raise ValueError("Maß ohne Toleranz – Toleranz angeben (z. B. 35 ±0,1) oder Allgemeintoleranz wie ISO 2768-m ergänzen")
+            elif _KURZ.fullmatch(a):
+                raise ValueError("Toleranzfeld ohne Nennmaß – z. B. Ø20 H7")
+            elif "°" in a and _MASSARTIG.match(a):
+                raise ValueError("Winkelmaße werden nicht aufgelöst (nur Längenmaße in mm)")
+            elif _MASSARTIG.match(a):
+                raise ValueError("Maßangabe nicht erkannt – z. B. Ø20 H7, Ø20 H7/g6, 35 ±0,1 oder 80 +0,2/-0,1 (mm)")
+        except ValueError as exc:
+            eintraege.append(Fehler(a, str(exc)))
+    if allgemein and not eintraege:
+        a = next(a for a in angaben if _ALLGEMEIN.search(a))
+        eintraege.append(Fehler(a, "Allgemeintoleranz ohne Maß – Maße ohne eigene Toleranz dazuschreiben (z. B. 120)"))
+    return Aufloesung(tuple(eintraege), allgemein)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Batch (ganze Zeichnungen, numpy)
+# ────────────────────────────────────────────────────────────────────────────────
+_np_tabelle = None
+
+def _numpy_tabelle():
+    """(oben, unten) als Arrays [Symbol, Grad − 1, Bereich] in µm – aus `tabelle()` gebaut, einmal je Prozess."""
+    global _np_tabelle
+    if _np_tabelle is None:
+        import numpy as np  # kommt mit Streamlit; nur der Batch braucht es
+
+        t = tabelle()
+        form = (len(SYMBOLE), len(GRADE), len(BEREICHE))
+        _np_tabelle = tuple(np.array([t[s][i] for s in SYMBOLE]).reshape(form) for i in (0, 1))
+    return _np_tabelle
+
+def grenzabmasse(nennmasse: Iterable[float], kurzzeichen: Iterable[str]):
+    """
+    Vektorisiert: (oben, unten, fehler) für viele Maße auf einmal.
+    `oben`/`unten` sind numpy-Arrays in mm (NaN bei ungültiger Angabe),
+    `fehler` ein dict Position → Grund.
+    """
+    import numpy as np
+
+    oben_t, unten_t = _numpy_tabelle()
+    d = np.asarray(nennmasse, dtype=np.float64)
+    kurz = np.asarray(kurzzeichen, dtype=object)
+    if d.shape != kurz.shape:
+        raise ValueError("nennmasse und kurzzeichen müssen gleich lang sein")
+    # Kurzzeichen gibt es auf einer Zeichnung nur wenige – je eindeutigem einmal zerlegen
+    eindeutig, rueck = np.unique(kurz.astype(str), return_inverse=True)
+    sym = np.full(len(eindeutig), -1)
+    grad = np.zeros(len(eindeutig), dtype=np.intp)
+    kurz_fehler = {}
+    for i, k in enumerate(eindeutig):
+        try:
+            s, g = _kurzzeichen(k)
+            sym[i], grad[i] = SYMBOLE.index(s), g - 1
+        except ValueError as exc:
+            kurz_fehler[i] = str(exc)
+    s_idx, g_idx = sym[rueck], grad[rueck]
+    b_idx = np.searchsorted(BEREICHE, d, side="left")
+    gueltig = (s_idx >= 0) & (d > 0) & (b_idx < len(BEREICHE)) & ~((g_idx >= 13) & (d <= 1))
+    b_sicher = np.minimum(b_idx, len(BEREICHE) - 1)
+    oben = np.where(gueltig, oben_t[s_idx, g_idx, b_sicher] / 1000, np.nan)
+    unten = np.where(gueltig, unten_t[s_idx, g_idx, b_sicher] / 1000, np.nan)
+
+    fehler = {}
+    for pos in np.flatnonzero(~gueltig):
+        if (k := int(rueck[pos])) in kurz_fehler:
+            fehler[int(pos)] = kurz_fehler[k]
+        else:
+            try:
+                abmasse(float(d[pos]), str(kurz[pos]))
+            except ValueError as exc:
+                fehler[int(pos)] = str(exc)
+    return oben, unten, fehler
+
+def zeichnung(zeilen: Iterable[dict], allgemein: str = "") -> list[dict]:
+    """
+    Maßliste einer Zeichnung (dicts mit `nennmass` und `toleranz`, z. B. aus CSV)
+    um Abmaße und Grenzmaße ergänzen. ISO-Kurzzeichen laufen gesammelt durch
+    `grenzabmasse`, eingetragene Abmaße (±0,1 …) durch den Parser, Maße ohne
+    Toleranz bekommen die Allgemeintoleranz `allgemein` (ISO 2768-Klasse).
+    """
+    zeilen = [dict(z) for z in zeilen]
+    nennmasse, iso = {}, []
+    for i, z in enumerate(zeilen):
+        try:
+            nennmasse[i] = _float(str(z.get("nennmass", "")).strip().lstrip("Ø⌀∅").strip())
+        except ValueError:
+            z["fehler"] = f"Nennmaß „{z.get('nennmass', '')}“ ist keine Zahl"
+            continue
+        tol = str(z.get("toleranz") or "").strip()
+        if _KURZ.fullmatch(tol):
+            iso.append(i)
+            continue
+        try:
+            if not tol:
+                if not allgemein:
+                    raise ValueError("keine Toleranz angegeben (ISO 2768-Klasse wählen)")
+                t = allgemeintoleranz(nennmasse[i], allgemein[0].lower())
+                _grenzen(z, nennmasse[i], t, -t)
+                continue
+            x = aufloesen(f"{_zahl(nennmasse[i])} {tol}").eintraege
+            if not x or isinstance(x[0], Passung):
+                raise ValueError(f"Toleranz „{tol}“ nicht auflösbar")
+            if isinstance(x[0], Fehler):
+                raise ValueError(x[0].grund)
+            _grenzen(z, nennmasse[i], x[0].oben, x[0].unten)
+        except ValueError as exc:
+            z["fehler"] = str(exc)
+    if iso:
+        oben, unten, fehler = grenzabmasse([nennmasse[i] for i in iso], [str(zeilen[i]["toleranz"]).strip() for i in iso])
+        for j, i in enumerate(iso):
+            if j in fehler:
+                zeilen[i]["fehler"] = fehler[j]
+            else:
+                _grenzen(zeilen[i], nennmasse[i], float(oben[j]), float(unten[j]))
+    return zeilen
+
+def _grenzen(z: dict, d: float, oben: float, unten: float):
+    z.update(oberes_abmass_mm=round(oben, 4), unteres_abmass_mm=round(unten, 4),
+             hoechstmass_mm=round(d + oben, 4), mindestmass_mm=round(d + unten, 4))
+
+# ────────────────────────────────────────────────────────────────────────────────
+# CLI
+# ────────────────────────────────────────────────────────────────────────────────
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m ausbildung.toleranzen", description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("text", nargs="?", default="", help="Toleranzangaben wie im Feld, z. B. „Ø20 H7/g6, 35 ±0,1“")
+    p.add_argument("--csv", help="Maßliste mit Spalten nennmass;toleranz (Trennzeichen ; oder ,)")
+    p.add_argument("--allgemein", default="", choices=("f", "m", "c", "v"), help="ISO 2768-Klasse für Maße ohne Toleranz (f, m, c, v)")
+    p.add_argument("-o", "--ausgabe", default="-", help="Ziel-CSV für --csv (Standard: stdout)")
+    args = p.parse_args(argv)
+
+    if args.csv:
+        with open(args.csv, encoding="utf-8", newline="") as fh:
+            probe = fh.read(4096)
+            fh.seek(0)
+            dialekt = csv.Sniffer().sniff(probe, delimiters=";,\t")
+            zeilen = zeichnung(csv.DictReader(fh, dialect=dialekt), args.allgemein)
+        spalten = list(dict.fromkeys(k for z in zeilen for k in z))
+        ziel = sys.stdout if args.ausgabe == "-" else open(args.ausgabe, "w", encoding="utf-8", newline="")
+        try:
+            w = csv.DictWriter(ziel, spalten, delimiter=";")
+            w.writeheader()
+            w.writerows(zeilen)
+        finally:
+            if ziel is not sys.stdout:
+                ziel.close()
+        fehler = sum(1 for z in zeilen if z.get("fehler"))
+        print(f"{len(zeilen)} Maße, {fehler} nicht auflösbar", file=sys.stderr)
+        return 1 if fehler else 0
+
+    # Eine Klasse im Text selbst hat Vorrang, da sie später in der Liste steht
+    a = aufloesen(f"ISO 2768-{args.allgemein}; {args.text}" if args.allgemein else args.text)
+    for x in a.werte:
+        print(x.zeile())
+    for f in a.fehler:
+        print(f"FEHLER {f.zeile()}", file=sys.stderr)
+    return 1 if a.fehler else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Streamlit-Anbindung von `ausbildung.llm`: Prompt direkt an die KI senden.
+
+Ohne `AUSBILDUNG_LLM_URL` zeichnet `ki_antwort` nichts. Die Antwort läuft per
+`st.write_stream` Stück für Stück in die Seite und bleibt stehen, bis sich der
+Prompt ändert. Der Button läuft als Fragment – Senden startet nur diesen
+Bereich neu, nicht die ganze App.
+"""
+import hashlib
+
+import streamlit as st
+
+from ausbildung import llm
+
+@st.fragment
+def ki_antwort(text: str, key: str):
+    """„An KI senden“ für `text`; `key` trennt mehrere Buttons auf einer Seite."""
+    if not llm.konfiguriert():
+        return
+    ss = st.session_state
+    stand = f"_ki_antwort_{key}"
+    h = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    if st.button("🤖 An KI senden", key=f"ki_senden_{key}", help=f"{llm.MODELL} über {llm.URL}"):
+        try:
+            antwort = st.write_stream(llm.client().stream(text))
+        except llm.LlmFehler as exc:
+            st.error(f"KI-Anfrage fehlgeschlagen: {exc}")
+        else:
+            ss[stand] = (h, antwort)
+    elif ss.get(stand, (None,))[0] == h:
+        st.markdown(ss[stand][1])
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Kleine, vorkompilierte Template-Engine für die Prompt- und Berichtstexte.
+
+Die Vorlagen liegen als Textdateien in `ausbildung/vorlagen/` (oder im
+Verzeichnis aus `AUSBILDUNG_VORLAGEN`), damit sich Formulierungen ohne
+Codeänderung anpassen lassen. Jede Vorlage wird einmal geparst und in einen
+Render-Plan (Liste kleiner Funktionen je Abschnitt) übersetzt.
+
+Syntax:
+    {{ name }}                          Wert einsetzen
+    {{ name | bullet }}                 Filter (bullet, join, default:"-")
+    {% if name %}…{% else %}…{% endif %}
+    {% if name == "Deutsch" %}…{% endif %}
+    {% section name %}…{% endsection %}  Abschnitt für Teil-Neuberechnung
+
+Ein Block-Tag allein auf seiner Zeile entfernt die ganze Zeile (inkl. Umbruch).
+
+Teil-Neuberechnung: `render(ctx, zustand)` merkt sich je Abschnitt die Werte
+der darin benutzten Felder; ändert sich nur ein Feld, wird nur dessen
+Abschnitt neu gerendert.
+"""
+from pathlib import Path
+import os
+import re
+
+from ausbildung.text import bullet
+
+VORLAGEN_DIR = Path(os.environ.get("AUSBILDUNG_VORLAGEN") or Path(__file__).with_name("vorlagen"))
+
+FILTER = {
+    "bullet": bullet,
+    "join": lambda v, sep=", ": sep.join(v),
+    "default": lambda v, d: v or d,
+}
+
+class VorlagenFehler(ValueError):
+    """Syntaxfehler in einer Vorlage (mit Dateiname und Zeile)."""
+
+_TOKEN = re.compile(r"(?m)^[ \t]*(\{%.*?%\})[ \t]*\n|(\{%.*?%\})|(\{\{.*?\}\})")
+_AUSDRUCK = re.compile(r"^\s*(\w+)\s*((?:\|\s*\w+(?::\s*\"[^\"]*\")?\s*)*)$")
+_FILTER = re.compile(r"\|\s*(\w+)(?::\s*\"([^\"]*)\")?")
+_BEDINGUNG = re.compile(r"^if\s+(\w+)(?:\s*==\s*\"([^\"]*)\")?$")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Parser
+# ────────────────────────────────────────────────────────────────────────────────
+def _tokens(quelle: str, name: str):
+    """(art, inhalt, zeile) mit art ∈ text/var/tag."""
+    pos = 0
+    for m in _TOKEN.finditer(quelle):
+        if m.start() > pos:
+            yield "text", quelle[pos:m.start()], quelle.count("\n", 0, pos) + 1
+        zeile = quelle.count("\n", 0, m.start()) + 1
+        tag = m.group(1) or m.group(2)
+        if tag:
+            yield "tag", tag[2:-2].strip(), zeile
+        else:
+            yield "var", m.group(3)[2:-2].strip(), zeile
+        pos = m.end()
+    if pos < len(quelle):
+        yield "text", quelle[pos:], quelle.count("\n", 0, pos) + 1
+
+def _parse(quelle: str, name: str) -> list:
+    """Baum aus ("text", s) | ("var", feld, filter) | ("if", feld, wert, dann, sonst) | ("section", name, knoten)."""
+    wurzel = []
+    stapel = [("root", wurzel, None)]
+
+    def fehler(msg, zeile):
+        raise VorlagenFehler(f"{name}:{zeile}: {msg}")
+
+    for art, inhalt, zeile in _tokens(quelle, name):
+        knoten = stapel[-1][1]
+        if art == "text":
+            knoten.append(("text", inhalt))
+        elif art == "var":
+            m = _AUSDRUCK.match(inhalt)
+            if not m:
+                fehler(f"ungültiger Ausdruck {{{{ {inhalt} }}}}", zeile)
+            filter_ = []
+            for fname, arg in _FILTER.findall(m.group(2)):
+                if fname not in FILTER:
+                    fehler(f"unbekannter Filter {fname!r}", zeile)
+                filter_.append((fname, arg if arg or fname == "default" else None))
+            knoten.append(("var", m.group(1), tuple(filter_)))
+        elif inhalt.startswith("if "):
+            m = _BEDINGUNG.match(inhalt)
+            if not m:
+                fehler(f"ungültige Bedingung {{% {inhalt} %}}", zeile)
+            dann, sonst = [], []
+            knoten.append(("if", m.group(1), m.group(2), dann, sonst))
+            stapel.append(("if", dann, sonst))
+        elif inhalt == "else":
+            if stapel[-1][0] != "if":
+                fehler("{% else %} ohne {% if %}", zeile)
+            _, _, sonst = stapel.pop()
+            stapel.append(("else", sonst, None))
+        elif inhalt == "endif":
+            if stapel[-1][0] not in ("if", "else"):
+                fehler("{% endif %} ohne {% if %}", zeile)
+            stapel.pop()
+        elif inhalt.startswith("section "):
+            if len(stapel) > 1:
+                fehler("Abschnitte dürfen nicht verschachtelt werden", zeile)
+            inner = []
+            knoten.append(("section", inhalt.split(None, 1)[1].strip(), inner))
+            stapel.append(("section", inner, None))
+        elif inhalt == "endsection":
+            if stapel[-1][0] != "section":
+                fehler("{% endsection %} ohne {% section %}", zeile)
+            stapel.pop()
+        else:
+            fehler(f"unbekanntes Tag {{% {inhalt} %}}", zeile)
+    if len(stapel) > 1:
+        raise VorlagenFehler(f"{name}: {{% {stapel[-1][0]} %}} nicht geschlossen")
+    return wurzel
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Übersetzung in einen Render-Plan
+# ────────────────────────────────────────────────────────────────────────────────
+def _felder(knoten: list, out: set) -> set:
+    for k in knoten:
+        if k[0] == "var":
+            out.add(k[1])
+        elif k[0] == "if":
+            out.add(k[1])
+            _felder(k[3], out)
+            _felder(k[4], out)
+        elif k[0] == "section":
+            _felder(k[2], out)
+    return out
+
+def _kompiliere(knoten: list) -> list:
+    """Knoten → Plan aus Texten und Funktionen ctx -> str; benachbarte Texte werden zusammengefasst."""
+    plan = []
+    for k in knoten:
+        if k[0] == "text":
+            if plan and isinstance(plan[-1], str):
+                plan[-1] += k[1]
+            else:
+                plan.append(k[1])
+        elif k[0] == "var":
+            plan.append(_var(k[1], k[2]))
+        elif k[0] == "if":
+            plan.append(_wenn(k[1], k[2], _kompiliere(k[3]), _kompiliere(k[4])))
+    return plan
+
+def _ausfuehren(plan: list, ctx: dict) -> list[str]:
+    return [p if p.__class__ is str else p(ctx) for p in plan]
+
+def _var(feld: str, filter_: tuple):
+    if not filter_:
+        return lambda ctx: str(ctx[feld])
+    if len(filter_) == 1 and filter_[0][1] is None:
+        f = FILTER[filter_[0][0]]
+        return lambda ctx: f(ctx[feld])
+    kette = [(FILTER[f], a) for f, a in filter_]
+
+    def render(ctx):
+        v = ctx[feld]
+        for f, a in kette:
+            v = f(v) if a is None else f(v, a)
+        return v if v.__class__ is str else str(v)
+    return render
+
+def _wenn(feld: str, vergleich, dann: list, sonst: list):
+    def render(ctx):
+        v = ctx[feld]
+        zweig = dann if (v == vergleich if vergleich is not None else v) else sonst
+        return "".join(_ausfuehren(zweig, ctx))
+    return render
+
+def _verbinden(teile: list[str], strip: bool) -> str:
+    """Teile zusammenfügen; `strip` kürzt nur die Randteile statt den ganzen Text zu kopieren."""
+    if strip:
+        i, j = 0, len(teile)
+        while i < j and (not teile[i] or teile[i].isspace()):
+            i += 1
+        while j > i and (not teile[j - 1] or teile[j - 1].isspace()):
+            j -= 1
+        teile = teile[i:j]
+        if teile:
+            teile[0] = teile[0].lstrip()
+            teile[-1] = teile[-1].rstrip()
+    return "".join(teile)
+
+class Vorlage:
+    """Kompilierte Vorlage: Abschnitte mit Render-Plan und benutzten Feldern."""
+
+    def __init__(self, quelle: str, name: str = "<vorlage>"):
+        self.name = name
+        self.abschnitte = []  # (name | None, felder, plan)
+        offen = []
+        for k in _parse(quelle, name):
+            if k[0] == "section":
+                if offen:
+                    self.abschnitte.append((None, tuple(sorted(_felder(offen, set()))), _kompiliere(offen)))
+                    offen = []
+                self.abschnitte.append((k[1], tuple(sorted(_felder(k[2], set()))), _kompiliere(k[2])))
+            else:
+                offen.append(k)
+        if offen:
+            self.abschnitte.append((None, tuple(sorted(_felder(offen, set()))), _kompiliere(offen)))
+        self.felder = frozenset(f for _, felder, _ in self.abschnitte for f in felder)
+        self._flach = [p for _, _, plan in self.abschnitte for p in plan]
+
+    def render(self, ctx: dict, zustand: dict | None = None, strip: bool = False) -> str:
+        """
+        Text erzeugen. Mit `zustand` (ein je Vorlage und Nutzer gehaltenes dict)
+        werden Abschnitte, deren Felder unverändert sind, nicht neu gerendert.
+        `strip=True` entspricht `render(...).strip()`.
+        """
+        fehlend = self.felder - ctx.keys()
+        if fehlend:
+            raise KeyError(f"{self.name}: fehlende Felder {', '.join(sorted(fehlend))}")
+        if zustand is None:
+            return _verbinden(_ausfuehren(self._flach, ctx), strip)
+        teile = []
+        for i, (name, felder, plan) in enumerate(self.abschnitte):
+            if not felder:
+                teile.extend(_ausfuehren(plan, ctx))
+                continue
+            werte = tuple(ctx[f] for f in felder)
+            alt = zustand.get(i)
+            if alt is None or alt[0] != werte:
+                alt = zustand[i] = (werte, "".join(_ausfuehren(plan, ctx)))
+            teile.append(alt[1])
+        return _verbinden(teile, strip)
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Laden
+# ────────────────────────────────────────────────────────────────────────────────
+_geladen = {}
+
+def lade(name: str, verzeichnis: Path = VORLAGEN_DIR) -> Vorlage:
+    """Vorlage `<name>.txt` einmal je Prozess lesen und kompilieren."""
+    pfad = Path(verzeichnis) / f"{name}.txt"
+    vorlage = _geladen.get(pfad)
+    if vorlage is None:
+        vorlage = _geladen[pfad] = Vorlage(pfad.read_text(encoding="utf-8"), name=pfad.name)
+    return vorlage
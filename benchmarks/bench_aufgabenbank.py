@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark der Aufgabenbank: Aufbau, Ziehung und Abdeckung bei vielen Aufgaben.
+
+Legt N synthetische Aufgaben (verteilt auf Lernfelder, Tools, Fächer und
+Niveaus) in einem temporären Verzeichnis an, lädt sie wie die App und misst
+`ziehe` mit p50/p99 in Mikrosekunden – für die mitgelieferte Bank und die
+große, damit sichtbar wird, dass die Ziehung nicht mit der Bank wächst. Danach
+Abdeckung über mehrere Wochen: verschiedene Aufgaben und Wiederholungen je Azubi.
+
+    python benchmarks/bench_aufgabenbank.py               # 10.000 Aufgaben, 40 Wochen
+    python benchmarks/bench_aufgabenbank.py -n 100000 --wochen 80
+"""
+from datetime import date
+from pathlib import Path
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ausbildung.aufgabenbank import Aufgabenbank, abdeckung, aufgabenbank, lies_aufgaben, woche_nr  # noqa: E402
+from ausbildung.katalog import katalog  # noqa: E402
+
+def datei(pfad: Path, n: int, seed: int = 1):
+    """n Aufgaben im Dateiformat der Bank; jede dritte ohne Berufsschulbezug, jede zehnte ganz ohne Tags."""
+    rnd = random.Random(seed)
+    lf, tools, schule = (katalog(k).eintraege for k in ("lernfelder_buero", "tools_buero", "berufsschule_buero"))
+    with open(pfad, "w", encoding="utf-8") as fh:
+        for i in range(n):
+            if i % 10 == 0:
+                fh.write(f"{rnd.randint(1, 3)} | - | - | - | Allgemeine Aufgabe {i}\n")
+                continue
+            fach = rnd.choice(schule) if i % 3 else "-"
+            fh.write(f"{rnd.randint(1, 3)} | {rnd.choice(lf)} | {'; '.join(rnd.sample(tools, 2))} | {fach} | "
+                     f"Aufgabe {i}: Vorgang prüfen, dokumentieren und begründen\n")
+
+def lade(pfad: Path) -> Aufgabenbank:
+    return Aufgabenbank((niveau, lf, tools, schule, text) for _, niveau, lf, tools, schule, text in lies_aufgaben(pfad))
+
+def zeiten(fn, runden: int) -> dict:
+    us = []
+    for i in range(runden):
+        t0 = time.perf_counter()
+        fn(i)
+        us.append((time.perf_counter() - t0) * 1e6)
+    us.sort()
+    return {"p50_us": round(statistics.median(us), 2), "p99_us": round(us[min(len(us) - 1, int(0.99 * len(us)))], 2)}
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("-n", type=int, default=10_000, help="Anzahl Aufgaben")
+    p.add_argument("--wochen", type=int, default=40, help="Wochen für die Abdeckung")
+    p.add_argument("--azubis", type=int, default=20)
+    p.add_argument("--runden", type=int, default=2000)
+    p.add_argument("--json", action="store_true")
+    args = p.parse_args(argv)
+
+    auswahl = {"lf": ["LF 3 Kundenaufträge bearbeiten", "LF 7 Kaufmännische Steuerung & Kontrolle"],
+               "tools": ["MS Excel"], "schule": [], "niveaus": (2, 3)}
+    start = woche_nr(date(2026, 9, 7))
+    with tempfile.TemporaryDirectory() as tmp:
+        pfad = Path(tmp) / "synthetisch.txt"
+        datei(pfad, args.n)
+        t0 = time.perf_counter()
+        gross = lade(pfad)
+        aufbau_ms = (time.perf_counter() - t0) * 1000
+
+    ergebnisse = {"_aufbau": {"aufgaben": len(gross), "ms": round(aufbau_ms, 1)}}
+    for name, bank in (("mitgeliefert", aufgabenbank()), ("synthetisch", gross)):
+        ergebnisse[f"ziehe[{name}]"] = {
+            "aufgaben": len(bank),
+            **zeiten(lambda i, bank=bank: bank.ziehe(f"azubi{i % 50}", start + i, **auswahl), args.runden),
+        }
+        abd = [abdeckung(bank, f"azubi{a}", range(start, start + args.wochen), **auswahl) for a in range(args.azubis)]
+        ergebnisse[f"abdeckung[{name}]"] = {
+            "passend": abd[0].passend,
+            "verschieden": round(statistics.mean(a.verschieden for a in abd), 1),
+            "gezogen": round(statistics.mean(a.gezogen for a in abd), 1),
+            "wiederholt": round(statistics.mean(len(a.wiederholt) for a in abd), 1),
+        }
+
+    if args.json:
+        print(json.dumps(ergebnisse, indent=2, ensure_ascii=False))
+        return 0
+    print(f"{len(gross):,} Aufgaben indiziert in {aufbau_ms:,.0f} ms")
+    print(f"{'Bank':<16}{'Aufgaben':>10}{'p50 µs':>10}{'p99 µs':>10}  Abdeckung über {args.wochen} Wochen (Ø je Azubi)")
+    for name in ("mitgeliefert", "synthetisch"):
+        z, a = ergebnisse[f"ziehe[{name}]"], ergebnisse[f"abdeckung[{name}]"]
+        print(f"{name:<16}{z['aufgaben']:>10,}{z['p50_us']:>10.2f}{z['p99_us']:>10.2f}  "
+              f"{a['gezogen']:g} gezogen, {a['verschieden']:g} verschieden von {a['passend']:,} passenden, "
+              f"{a['wiederholt']:g} wiederholt")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
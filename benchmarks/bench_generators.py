@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-Benchmarks für Textgeneratoren und Eingabe-Parser.
+
+Gemessen werden die Freitext-Zerlegung von `auswahl.mit_freitext`
+(`zeilen`, `Eintraege` samt Dedup), `bullet`, `daterange_str`, die drei Büro-Generatoren und der
+Metall-Prompt samt JSON-Payload, Token-Schätzung und Kompaktierung – mit synthetischen Eingaben von einer bis zu
+tausenden Freitextzeilen je Feld.
+
+Je Fall: ops/s, p50/p99-Latenz und Speicher-Peak pro Aufruf (tracemalloc).
+
+    python benchmarks/bench_generators.py                 # Tabelle ausgeben
+    python benchmarks/bench_generators.py --save          # Baseline schreiben
+    python benchmarks/bench_generators.py --check         # gegen Baseline prüfen (Exit 1 bei Regression)
+    python benchmarks/bench_generators.py -k metall       # nur Fälle mit „metall“ im Namen
+"""
+from datetime import date
+from pathlib import Path
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ausbildung.engine import (  # noqa: E402
+    BueroEingabe, GENERATOR_FUNKTIONEN, bullet, daterange_str, zeilen,
+)
+from ausbildung.eintraege import aus_auswahl, aus_freitext  # noqa: E402
+from ausbildung.metall import MetallEingabe, build_payload, build_prompt  # noqa: E402
+from ausbildung.tokens import _zeile, kompaktiere, schaetze  # noqa: E402
+
+BASELINE = Path(__file__).with_name("baseline.json")
+GROESSEN = {"tiny": 1, "small": 10, "medium": 100, "large": 1000, "xlarge": 5000}
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Synthetische Eingaben
+# ────────────────────────────────────────────────────────────────────────────────
+def freitext(n: int, prefix: str = "Eintrag") -> str:
+    """n Zeilen wie aus einem Textfeld – mit Spiegelstrichen, Leerzeilen und Leerraum."""
+    out = []
+    for i in range(n):
+        if i % 7 == 3:
+            out.append("   ")
+        out.append(f"- {prefix} {i}: Vorgang bearbeitet, Ergebnis dokumentiert " if i % 2 else f"  {prefix} {i}")
+    return "\n".join(out)
+
+def buero_eingabe(n: int) -> BueroEingabe:
+    liste = lambda p: tuple(zeilen(freitext(n, p)))  # noqa: E731
+    return BueroEingabe(
+        modus="Ausbildung (Büromanagement)",
+        date_from=date(2024, 9, 2),
+        date_to=date(2024, 9, 6),
+        lf=liste("LF"),
+        taetigkeiten=liste("Tätigkeit"),
+        tools=liste("Tool"),
+        kompetenzen=liste("Kompetenz"),
+        nachweise=liste("Nachweis"),
+        schule=liste("Fach"),
+    )
+
+def metall_eingabe(n: int) -> MetallEingabe:
+    liste = lambda p: tuple(zeilen(freitext(n, p)))  # noqa: E731
+    return MetallEingabe(
+        bildungsgang="Duale Ausbildung",
+        beruf="Zerspanungsmechaniker:in",
+        jahr="2",
+        lernort="Betrieb",
+        aufgabentyp="Werkstück fertigen",
+        output=("Schritt-für-Schritt-Anleitung", "Checkliste Sicherheit"),
+        didaktik=("4-Stufen-Methode",),
+        lernziel="Welle nach Zeichnung drehen",
+        verfahren=liste("Verfahren"),
+        maschinen=liste("Maschine"),
+        werkstoffe=liste("Werkstoff"),
+        normen=liste("Norm"),
+        messmittel=liste("Messmittel"),
+        toleranzen="Ø20 H7, Ra 1,6",
+        sicherheit=liste("Gefahr"),
+        zeit=90,
+        materialien=freitext(n, "Material"),
+        zeichnung="Z-4711",
+        kontext=freitext(n, "Kontext"),
+    )
+
+def metall_prompt_und_json(e: MetallEingabe) -> tuple[str, str]:
+    payload = build_payload(e)
+    return build_prompt(e, payload), json.dumps(payload, ensure_ascii=False, indent=2)
+
+def faelle() -> dict:
+    """Name → argumentlose Funktion. Eingaben werden vorab gebaut, gemessen wird nur der Aufruf."""
+    f = {"daterange_str": lambda: daterange_str(date(2024, 9, 2), date(2024, 9, 6))}
+    for groesse, n in GROESSEN.items():
+        text = freitext(n)
+        liste = zeilen(text)
+        be = buero_eingabe(n)
+        me = metall_eingabe(n)
+        f[f"zeilen[{groesse}]"] = lambda text=text: zeilen(text)
+        f[f"bullet[{groesse}]"] = lambda liste=liste: bullet(liste)
+        # ungecacht zerlegen: gemessen wird der Fall „Freitext hat sich geändert“
+        f[f"eintraege[{groesse}]"] = lambda liste=liste, text=text: aus_auswahl(liste) + aus_freitext.__wrapped__(text)
+        for art, gen in GENERATOR_FUNKTIONEN.items():
+            f[f"{art}[{groesse}]"] = lambda gen=gen, be=be: gen(be)
+        f[f"metall_prompt[{groesse}]"] = lambda me=me: metall_prompt_und_json(me)
+        # Token-Schätzung ohne Zeilen-Cache (erster Aufruf) und Kompaktierung auf 800 Tokens
+        prompt = build_prompt(me, build_payload(me))
+        f[f"tokens[{groesse}]"] = lambda prompt=prompt: (_zeile.cache_clear(), schaetze(prompt))
+        f[f"kompakt[{groesse}]"] = lambda me=me: kompaktiere(me, 800)
+    return f
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Messung
+# ────────────────────────────────────────────────────────────────────────────────
+def messen(fn, min_zeit: float, min_runden: int, max_runden: int) -> dict:
+    for _ in range(3):
+        fn()  # Aufwärmen
+    dauer = []
+    start = time.perf_counter()
+    while len(dauer) < max_runden and (len(dauer) < min_runden or time.perf_counter() - start < min_zeit):
+        t0 = time.perf_counter_ns()
+        fn()
+        dauer.append(time.perf_counter_ns() - t0)
+    dauer.sort()
+    p99 = dauer[min(len(dauer) - 1, int(len(dauer) * 0.99))]
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    vorher = tracemalloc.get_traced_memory()[0]
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] - vorher
+    tracemalloc.stop()
+
+    return {
+        "runden": len(dauer),
+        "ops_s": round(1e9 / statistics.fmean(dauer), 1),
+        "p50_us": round(dauer[len(dauer) // 2] / 1000, 2),
+        "p99_us": round(p99 / 1000, 2),
+        "alloc_peak_b": peak,
+    }
+
+def vergleichen(ergebnisse: dict, baseline: dict, toleranz: float, alloc_toleranz: float) -> list[str]:
+    """Regressionen gegenüber der Baseline (p50 und Speicher-Peak)."""
+    fehler = []
+    for name, neu in ergebnisse.items():
+        alt = baseline.get(name)
+        if alt is None:
+            continue
+        if neu["p50_us"] > alt["p50_us"] * (1 + toleranz) and neu["p50_us"] - alt["p50_us"] > 1:
+            fehler.append(f"{name}: p50 {alt['p50_us']} → {neu['p50_us']} µs")
+        if neu["alloc_peak_b"] > alt["alloc_peak_b"] * (1 + alloc_toleranz) + 256:
+            fehler.append(f"{name}: Speicher-Peak {alt['alloc_peak_b']} → {neu['alloc_peak_b']} B")
+    return fehler
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("-k", dest="filter", default="", help="Nur Fälle, deren Name diesen Text enthält")
+    p.add_argument("--save", action="store_true", help=f"Ergebnisse als Baseline speichern ({BASELINE.name})")
+    p.add_argument("--check", action="store_true", help="Gegen Baseline prüfen, Exit 1 bei Regression")
+    p.add_argument("--baseline", type=Path, default=BASELINE)
+    p.add_argument("--tolerance", type=float, default=0.5, help="Erlaubte p50-Verschlechterung (0.5 = +50 %%)")
+    p.add_argument("--alloc-tolerance", type=float, default=0.1, help="Erlaubter Zuwachs Speicher-Peak")
+    p.add_argument("--min-time", type=float, default=0.2, help="Mindestmessdauer je Fall in s")
+    p.add_argument("--json", action="store_true", help="Ergebnisse als JSON auf stdout")
+    args = p.parse_args(argv)
+
+    ergebnisse = {}
+    for name, fn in faelle().items():
+        if args.filter in name:
+            ergebnisse[name] = messen(fn, args.min_time, min_runden=20, max_runden=200_000)
+
+    if args.json:
+        print(json.dumps(ergebnisse, indent=2))
+    else:
+        print(f"{'Fall':<28}{'ops/s':>14}{'p50 µs':>12}{'p99 µs':>12}{'Peak B':>12}")
+        for name, r in ergebnisse.items():
+            print(f"{name:<28}{r['ops_s']:>14,.0f}{r['p50_us']:>12.2f}{r['p99_us']:>12.2f}{r['alloc_peak_b']:>12,}")
+
+    if args.save:
+        args.baseline.write_text(json.dumps(ergebnisse, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline gespeichert: {args.baseline}", file=sys.stderr)
+    if args.check:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        fehler = vergleichen(ergebnisse, baseline, args.tolerance, args.alloc_tolerance)
+        for f in fehler:
+            print(f"REGRESSION {f}", file=sys.stderr)
+        if fehler:
+            return 1
+        print("Keine Regression gegenüber der Baseline.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark der Prompt-Bibliothek: Import, Suche und Export bei vielen Prompts.
+
+Legt in einer temporären Datenbank N synthetische Metall-Prompts an (über den
+JSONL-Import), misst dann Suchanfragen (Volltext, Filter, kombiniert) mit
+p50/p99 in Millisekunden und den Export.
+
+    python benchmarks/bench_promptlib.py               # 20.000 Prompts
+    python benchmarks/bench_promptlib.py -n 100000
+"""
+from pathlib import Path
+import argparse
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ausbildung.katalog import katalog  # noqa: E402
+from ausbildung.metall import MetallEingabe, build_payload, build_prompt  # noqa: E402
+from ausbildung.promptlib import Promptbibliothek  # noqa: E402
+
+# Wortschatz für abwechslungsreiche Kontexte (Suchbegriffe treffen nur einen Teil der Prompts)
+BAUTEILE = ["Welle", "Flansch", "Buchse", "Zahnrad", "Halter", "Platte", "Bolzen", "Gehäuse", "Hebel", "Achse"]
+MERKMALE = ["Passung", "Gewinde", "Nut", "Fase", "Bohrung", "Absatz", "Einstich", "Rändel", "Senkung", "Radius"]
+FEHLER = ["Rattermarken", "Maßabweichung", "Grat", "Rundlauffehler", "Oberflächenfehler", "Verzug"]
+
+BERUFE = ["Industriemechaniker:in", "Zerspanungsmechaniker:in", "Konstruktionsmechaniker:in", "Metallbauer:in"]
+TYPEN = ["Werkstück fertigen", "Fehlersuche durchführen", "Wartung planen", "CNC-Programm unterstützen"]
+
+def jsonl(n: int, seed: int = 1):
+    """n verschiedene Prompts als JSONL-Zeilen."""
+    rnd = random.Random(seed)
+    verfahren, werkstoffe = katalog("verfahren").eintraege, katalog("werkstoffe").eintraege
+    for i in range(n):
+        e = MetallEingabe(
+            beruf=rnd.choice(BERUFE), aufgabentyp=rnd.choice(TYPEN), zeit=rnd.randrange(30, 240, 5),
+            verfahren=tuple(rnd.sample(verfahren, 3)), werkstoffe=tuple(rnd.sample(werkstoffe, 2)),
+            kontext=f"Auftrag {i}: {rnd.choice(BAUTEILE)} Ø{rnd.randint(10, 80)} mit {rnd.choice(MERKMALE)}, "
+                    f"Ra {rnd.choice(['0,8', '1,6', '3,2'])}, typischer Fehler: {rnd.choice(FEHLER)}",
+        )
+        payload = build_payload(e)
+        yield json.dumps({"prompt": build_prompt(e, payload), "payload": payload, "beruf": e.beruf}, ensure_ascii=False)
+
+def zeiten(fn, runden: int) -> dict:
+    ms = []
+    for _ in range(runden):
+        t0 = time.perf_counter()
+        fn()
+        ms.append((time.perf_counter() - t0) * 1000)
+    ms.sort()
+    return {"p50_ms": round(statistics.median(ms), 3), "p99_ms": round(ms[min(len(ms) - 1, int(0.99 * len(ms)))], 3)}
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("-n", type=int, default=20_000, help="Anzahl Prompts")
+    p.add_argument("--runden", type=int, default=200)
+    p.add_argument("--json", action="store_true")
+    args = p.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bib = Promptbibliothek(os.path.join(tmp, "bench.sqlite3"))
+        zeilen = list(jsonl(args.n))
+        t0 = time.perf_counter()
+        stand = bib.importiere(zeilen)
+        import_s = time.perf_counter() - t0
+        verfahren = bib.facetten()["verfahren"][0][0]
+        faelle = {
+            "neueste": lambda: bib.suche(),
+            "volltext": lambda: bib.suche("welle passung"),
+            "volltext:selten": lambda: bib.suche("zahnrad einstich verzug"),
+            "volltext:häufig": lambda: bib.suche("ausbilder"),  # trifft jeden Prompt – Worst Case für das Ranking
+            "präfix": lambda: bib.suche("rändel"),
+            "filter:beruf": lambda: bib.suche(beruf=BERUFE[1]),
+            "filter:verfahren": lambda: bib.suche(verfahren=verfahren),
+            "kombiniert": lambda: bib.suche("passung", beruf=BERUFE[0], aufgabentyp=TYPEN[0]),
+            "facetten": bib.facetten,
+        }
+        ergebnisse = {name: zeiten(fn, args.runden) for name, fn in faelle.items()}
+        t0 = time.perf_counter()
+        exportiert = bib.exportiere(io.StringIO())
+        ergebnisse["_import"] = {"prompts": stand["neu"], "pro_s": round(stand["neu"] / import_s)}
+        ergebnisse["_export"] = {"prompts": exportiert, "pro_s": round(exportiert / (time.perf_counter() - t0))}
+        bib.schliessen()
+
+    if args.json:
+        print(json.dumps(ergebnisse, indent=2, ensure_ascii=False))
+        return 0
+    print(f"{args.n:,} Prompts · Import {ergebnisse['_import']['pro_s']:,}/s · Export {ergebnisse['_export']['pro_s']:,}/s")
+    print(f"{'Anfrage':<20}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, r in ergebnisse.items():
+        if not name.startswith("_"):
+            print(f"{name:<20}{r['p50_ms']:>10.3f}{r['p99_ms']:>10.3f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark der Toleranzauflösung: Feldtext und Maßlisten ganzer Zeichnungen.
+
+Misst `aufloesen` für einen typischen Feldinhalt (kalt, d. h. ohne lru_cache,
+und warm) sowie `grenzabmasse` für N zufällige ISO-Kurzzeichen gegen eine
+Python-Schleife über `abmasse` – mit Abgleich, dass beide dieselben Werte liefern.
+
+    python benchmarks/bench_toleranzen.py               # 500 und 10.000 Maße
+    python benchmarks/bench_toleranzen.py -n 100000
+"""
+from pathlib import Path
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ausbildung.toleranzen import BOHRUNGEN, WELLEN, abmasse, aufloesen, grenzabmasse, tabelle  # noqa: E402
+
+FELD = "Ø20 H7/g6, Ø35 k6, 35 ±0,1, L 120, 80 +0,2/-0,1, ISO 2768-mK, Ra 1,6"
+
+def masse(n: int, seed: int = 1) -> tuple[list[float], list[str]]:
+    """n Nennmaße mit Kurzzeichen; jedes fünfzigste ungültig (außerhalb der Tabelle oder unbekanntes Feld)."""
+    rnd = random.Random(seed)
+    felder = [*BOHRUNGEN, *WELLEN]
+    nenn, kurz = [], []
+    for i in range(n):
+        if i % 50 == 49:
+            nenn.append(rnd.choice((600.0, 20.0)))
+            kurz.append(rnd.choice(("H7", "Q7", "J7")))
+            continue
+        nenn.append(round(rnd.uniform(1.5, 500), 1))
+        kurz.append(f"{rnd.choice(felder)}{rnd.randint(5, 11)}")
+    return nenn, kurz
+
+def schleife(nenn: list[float], kurz: list[str]) -> tuple[list[float], list[float]]:
+    oben, unten = [], []
+    for d, k in zip(nenn, kurz):
+        try:
+            o, u = abmasse(d, k)
+        except ValueError:
+            o = u = math.nan
+        oben.append(o)
+        unten.append(u)
+    return oben, unten
+
+def zeiten(fn, runden: int) -> dict:
+    us = []
+    for _ in range(runden):
+        t0 = time.perf_counter()
+        fn()
+        us.append((time.perf_counter() - t0) * 1e6)
+    us.sort()
+    return {"p50_us": round(statistics.median(us), 2), "p99_us": round(us[min(len(us) - 1, int(0.99 * len(us)))], 2)}
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("-n", type=int, action="append", help="Anzahl Maße (mehrfach möglich)")
+    p.add_argument("--runden", type=int, default=2000)
+    p.add_argument("--json", action="store_true")
+    args = p.parse_args(argv)
+
+    t0 = time.perf_counter()
+    tabelle()
+    ergebnisse = {"_tabelle": {"ms": round((time.perf_counter() - t0) * 1000, 2)}}
+
+    def kalt():
+        aufloesen.cache_clear()
+        aufloesen(FELD)
+    ergebnisse["aufloesen[kalt]"] = zeiten(kalt, args.runden)
+    ergebnisse["aufloesen[warm]"] = zeiten(lambda: aufloesen(FELD), args.runden)
+
+    for n in args.n or [500, 10_000]:
+        nenn, kurz = masse(n)
+        runden = max(3, min(args.runden, 2_000_000 // n))
+        grenzabmasse(nenn[:10], kurz[:10])  # numpy-Tabelle einmal aufbauen
+        oben, unten, fehler = grenzabmasse(nenn, kurz)
+        o_py, u_py = schleife(nenn, kurz)
+        gleich = all((math.isnan(a) and math.isnan(b)) or abs(a - b) < 1e-9
+                     for a, b in zip([*oben, *unten], [*o_py, *u_py]))
+        if not gleich:
+            print(f"grenzabmasse[{n}] weicht von abmasse ab", file=sys.stderr)
+            return 1
+        ergebnisse[f"grenzabmasse[{n}]"] = {"fehler": len(fehler), **zeiten(lambda: grenzabmasse(nenn, kurz), runden)}
+        ergebnisse[f"schleife[{n}]"] = zeiten(lambda: schleife(nenn, kurz), runden)
+
+    if args.json:
+        print(json.dumps(ergebnisse, indent=2, ensure_ascii=False))
+        return 0
+    print(f"Tabelle aufgebaut in {ergebnisse['_tabelle']['ms']:.2f} ms")
+    print(f"{'Fall':<26}{'p50 µs':>12}{'p99 µs':>12}")
+    for name, w in ergebnisse.items():
+        if not name.startswith("_"):
+            print(f"{name:<26}{w['p50_us']:>12,.2f}{w['p99_us']:>12,.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Lokaler Stand-in für einen OpenAI-kompatiblen Endpunkt – zum Testen von `ausbildung/llm.py`.
+
+Beantwortet `POST /v1/chat/completions` (mit und ohne `"stream": true`) über
+HTTP/1.1 mit Keep-alive. Die Antwort wiederholt die ersten Wörter des Prompts,
+Wort für Wort als Server-Sent Events mit einstellbarer Verzögerung. Mit
+`--fehlerquote` antwortet ein Teil der Anfragen mit 429/503 (Retry-After: 0),
+`GET /stats` zählt Verbindungen und Anfragen.
+
+    python benchmarks/llm_stub.py --port 8099 --token-ms 20         # dann AUSBILDUNG_LLM_URL=http://127.0.0.1:8099/v1
+    python benchmarks/llm_stub.py --selbsttest -n 200 --fehlerquote 0.1
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import argparse
+import json
+import random
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+class Stub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, adresse: tuple[str, int], token_ms: float = 0.0, fehlerquote: float = 0.0,
+                 woerter: int = 40, seed: int = 1):
+        super().__init__(adresse, Handler)
+        self.token_ms, self.fehlerquote, self.woerter = token_ms, fehlerquote, woerter
+        self.zufall = random.Random(seed)
+        self.zaehler = {"verbindungen": 0, "anfragen": 0, "fehler": 0, "streams": 0}
+        self.lock = threading.Lock()
+
+    def zaehle(self, name: str):
+        with self.lock:
+            self.zaehler[name] += 1
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: Stub
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Events sofort senden
+        self.server.zaehle("verbindungen")
+
+    def log_message(self, *args):
+        pass
+
+    def _json(self, status: int, daten: dict, kopf: dict | None = None):
+        body = json.dumps(daten, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        for k, v in {"Content-Type": "application/json", "Content-Length": str(len(body)), **(kopf or {})}.items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _chunk(self, daten: bytes):
+        self.wfile.write(f"{len(daten):x}\r\n".encode() + daten + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/stats"):
+            with self.server.lock:
+                return self._json(200, dict(self.server.zaehler))
+        self._json(404, {"error": {"message": "Nicht gefunden"}})
+
+    def do_POST(self):
+        laenge = int(self.headers.get("Content-Length", 0))
+        try:
+            anfrage = json.loads(self.rfile.read(laenge))
+            prompt = anfrage["messages"][-1]["content"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            return self._json(400, {"error": {"message": "Ungültige Anfrage"}})
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self._json(404, {"error": {"message": "Nicht gefunden"}})
+        self.server.zaehle("anfragen")
+        with self.server.lock:
+            stoerung = self.server.zufall.random() < self.server.fehlerquote
+        if stoerung:
+            self.server.zaehle("fehler")
+            status = self.server.zufall.choice([429, 503])
+            return self._json(status, {"error": {"message": "Stub: simulierte Überlast"}}, {"Retry-After": "0"})
+
+        woerter = ["Stub-Antwort:", *prompt.split()[: self.server.woerter]]
+        modell = anfrage.get("model", "stub")
+        if not anfrage.get("stream"):
+            time.sleep(self.server.token_ms * len(woerter) / 1000)
+            return self._json(200, {
+                "id": "stub", "object": "chat.completion", "model": modell,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": " ".join(woerter)},
+                             "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": len(woerter)},
+            })
+
+        self.server.zaehle("streams")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i, wort in enumerate(woerter):
+            time.sleep(self.server.token_ms / 1000)
+            delta = {"content": (" " if i else "") + wort}
+            event = {"id": "stub", "object": "chat.completion.chunk", "model": modell,
+                     "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+            self._chunk(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+        self._chunk(b"data: [DONE]\n\n")
+        self._chunk(b"")
+
+def starte(port: int = 0, **optionen) -> Stub:
+    """Stub im Hintergrund-Thread starten (Port 0 = frei wählen)."""
+    server = Stub(("127.0.0.1", port), **optionen)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def selbsttest(n: int, parallel: int, fehlerquote: float, token_ms: float) -> int:
+    """Client gegen den Stub: Einzelanfrage, Stream, Batch mit Fehlerquote – Exit 1 bei Abweichungen."""
+    from ausbildung.llm import Client, LlmFehler
+
+    server = starte(token_ms=token_ms, fehlerquote=0.0)
+    c = Client(server.url, "stub", pool=parallel)
+    probleme = []
+    try:
+        a = c.chat("Welle drehen mit Passung H7")
+        if a.text != "Stub-Antwort: Welle drehen mit Passung H7":
+            probleme.append(f"chat: {a.text!r}")
+        t0, erste = time.perf_counter(), None
+        stuecke = []
+        for s in c.stream("Gewinde M8 schneiden, Kernloch 6,8 mm"):
+            erste = erste or time.perf_counter() - t0
+            stuecke.append(s)
+        if "".join(stuecke) != "Stub-Antwort: Gewinde M8 schneiden, Kernloch 6,8 mm" or len(stuecke) < 2:
+            probleme.append(f"stream: {stuecke!r}")
+
+        server.fehlerquote = fehlerquote
+        t0 = time.perf_counter()
+        ergebnisse = list(c.batch((f"Prompt {i} Bohren Senken Reiben" for i in range(n)), parallel, versuche=8))
+        dauer = time.perf_counter() - t0
+        fehler = [e for e in ergebnisse if isinstance(e, LlmFehler)]
+        falsch = [i for i, e in enumerate(ergebnisse) if not isinstance(e, LlmFehler) and f"Prompt {i} " not in e.text]
+        if fehler or falsch:
+            probleme.append(f"batch: {len(fehler)} Fehler, {len(falsch)} vertauscht")
+        stats = dict(server.zaehler)
+        print(f"chat {a.dauer_s * 1000:.1f} ms · stream erstes Stück nach {erste * 1000:.1f} ms, {len(stuecke)} Stücke")
+        print(f"batch {n} Prompts in {dauer:.2f} s ({n / dauer:,.0f}/s) · "
+              f"{sum(e.versuche - 1 for e in ergebnisse if not isinstance(e, LlmFehler))} Wiederholungen")
+        print(f"Server: {stats['anfragen']} Anfragen, {stats['fehler']} simulierte Fehler, "
+              f"{stats['verbindungen']} Verbindungen (Client: {c.verbindungen})")
+        if stats["verbindungen"] > parallel + 2:
+            probleme.append(f"Keep-alive greift nicht: {stats['verbindungen']} Verbindungen")
+    finally:
+        c.schliessen()
+        server.shutdown()
+    for p in probleme:
+        print(f"FEHLER {p}", file=sys.stderr)
+    return 1 if probleme else 0
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("--port", type=int, default=8099)
+    p.add_argument("--token-ms", type=float, default=0.0, help="Verzögerung je Wort in ms")
+    p.add_argument("--fehlerquote", type=float, default=0.0, help="Anteil Anfragen mit 429/503")
+    p.add_argument("--selbsttest", action="store_true", help="Client gegen einen frischen Stub prüfen")
+    p.add_argument("-n", type=int, default=200, help="Prompts im Selbsttest-Batch")
+    p.add_argument("--parallel", type=int, default=8)
+    args = p.parse_args(argv)
+
+    if args.selbsttest:
+        return selbsttest(args.n, args.parallel, args.fehlerquote, args.token_ms)
+    server = Stub(("127.0.0.1", args.port), token_ms=args.token_ms, fehlerquote=args.fehlerquote)
+    print(f"LLM-Stub auf {server.url} (Strg+C beendet)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
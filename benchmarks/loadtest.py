@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Lasttest für die HTTP-API (`ausbildung/api.py`).
+
+Öffnet N Keep-Alive-Verbindungen (rohes HTTP/1.1 über asyncio, ohne Zusatzpakete)
+und schickt für eine feste Dauer so schnell wie möglich Requests. Ausgabe: Requests,
+Fehler (nicht 2xx), Requests/s und Latenz p50/p95/p99/max.
+
+    python benchmarks/loadtest.py --start                          # Server lokal starten und testen
+    python benchmarks/loadtest.py --url http://127.0.0.1:8000 -c 64 -d 20
+    python benchmarks/loadtest.py --start --pfad /v1/metall --eindeutig
+    python benchmarks/loadtest.py --start --pfad /v1/batch --batch 200
+
+`--eindeutig` variiert jeden Request (Cache-Fehltreffer, misst den Worker-Pool),
+sonst trifft ab dem zweiten Request der Text-Cache.
+"""
+from pathlib import Path
+from urllib.parse import urlsplit
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+
+def datensatz(pfad: str, nr: int | None) -> dict:
+    """Beispiel-Datensatz passend zum Pfad; mit `nr` eindeutig."""
+    zusatz = [] if nr is None else [f"Vorgang {nr}"]
+    if "metall" in pfad:
+        return {
+            "beruf": "Industriemechaniker/in", "jahr": "2. Ausbildungsjahr", "lernziel": "Flansch drehen",
+            "verfahren": ["Drehen", "Bohren", *zusatz], "werkstoffe": ["S235JR"], "messmittel": ["Messschieber"],
+            "zeit": 90,
+        }
+    return {
+        "modus": "Ausbildung (Büromanagement)", "date_from": "2024-09-02", "date_to": "2024-09-06",
+        "lf": ["LF 1"], "taetigkeiten": ["Post bearbeitet", "Termine koordiniert", *zusatz],
+        "tools": ["Outlook", "Excel"], "kompetenzen": ["Kommunikation"], "nachweise": [], "schule": ["Deutsch"],
+    }
+
+def body(pfad: str, nr: int | None, batch: int) -> bytes:
+    if pfad == "/v1/batch":
+        daten = {"buero": [datensatz("buero", None if nr is None else nr * batch + i) for i in range(batch)]}
+    else:
+        daten = datensatz(pfad, nr)
+    return json.dumps(daten, ensure_ascii=False).encode("utf-8")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# HTTP/1.1-Client
+# ────────────────────────────────────────────────────────────────────────────────
+async def anfrage(reader, writer, host: str, pfad: str, daten: bytes) -> int:
+    writer.write(
+        f"POST {pfad} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(daten)}\r\n\r\n".encode("ascii") + daten
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split(b" ", 2)[1])
+    laenge = 0
+    while (zeile := await reader.readline()) not in (b"\r\n", b""):
+        name, _, wert = zeile.partition(b":")
+        if name.strip().lower() == b"content-length":
+            laenge = int(wert)
+    await reader.readexactly(laenge)
+    return status
+
+async def verbindung(host: str, port: int, pfad: str, ende: float, zaehler, args, latenzen: list, fehler: list):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < ende:
+            daten = body(pfad, next(zaehler) if args.eindeutig else None, args.batch)
+            t0 = time.perf_counter()
+            status = await anfrage(reader, writer, f"{host}:{port}", pfad, daten)
+            latenzen.append(time.perf_counter() - t0)
+            if not 200 <= status < 300:
+                fehler.append(status)
+    finally:
+        writer.close()
+
+async def lauf(url: str, args) -> dict:
+    teile = urlsplit(url)
+    host, port = teile.hostname, teile.port or 80
+    latenzen, fehler = [], []
+    zaehler = itertools.count()
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        verbindung(host, port, args.pfad, start + args.dauer, zaehler, args, latenzen, fehler)
+        for _ in range(args.verbindungen)
+    ))
+    sekunden = time.perf_counter() - start
+    ms = sorted(x * 1000 for x in latenzen)
+    perzentil = lambda p: round(ms[min(len(ms) - 1, int(p * len(ms)))], 2) if ms else None  # noqa: E731
+    return {
+        "pfad": args.pfad,
+        "verbindungen": args.verbindungen,
+        "requests": len(ms),
+        "fehler": len(fehler),
+        "status_fehler": sorted(set(fehler)),
+        "requests_pro_s": round(len(ms) / sekunden, 1),
+        "p50_ms": perzentil(0.50),
+        "p95_ms": perzentil(0.95),
+        "p99_ms": perzentil(0.99),
+        "max_ms": round(ms[-1], 2) if ms else None,
+        "mittel_ms": round(statistics.fmean(ms), 2) if ms else None,
+    }
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Lokaler Server
+# ────────────────────────────────────────────────────────────────────────────────
+def freier_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def starte_server(workers: int | None) -> tuple[subprocess.Popen, str]:
+    port = freier_port()
+    cmd = [sys.executable, "-m", "ausbildung.api", "--port", str(port)]
+    if workers is not None:
+        cmd += ["--workers", str(workers)]
+    proc = subprocess.Popen(cmd, cwd=ROOT, env={**os.environ, "PYTHONPATH": str(ROOT)})
+    frist = time.monotonic() + 15
+    while time.monotonic() < frist:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return proc, f"http://127.0.0.1:{port}"
+        except OSError:
+            if proc.poll() is not None:
+                raise SystemExit("API-Server beendet sich sofort – uvicorn installiert?")
+            time.sleep(0.1)
+    proc.terminate()
+    raise SystemExit("API-Server nicht erreichbar")
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("--url", default="http://127.0.0.1:8000")
+    p.add_argument("--start", action="store_true", help="API lokal auf einem freien Port starten")
+    p.add_argument("--workers", type=int, default=None, help="Worker-Prozesse des gestarteten Servers")
+    p.add_argument("--pfad", default="/v1/buero/berichtsheft")
+    p.add_argument("-c", "--verbindungen", type=int, default=16)
+    p.add_argument("-d", "--dauer", type=float, default=10.0, help="Sekunden")
+    p.add_argument("--batch", type=int, default=100, help="Datensätze je Request bei /v1/batch")
+    p.add_argument("--eindeutig", action="store_true", help="jeden Request variieren (keine Cache-Treffer)")
+    p.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = p.parse_args(argv)
+
+    proc = None
+    url = args.url
+    if args.start:
+        proc, url = starte_server(args.workers)
+    try:
+        ergebnis = asyncio.run(lauf(url, args))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    if args.json:
+        print(json.dumps(ergebnis, ensure_ascii=False))
+    else:
+        print(
+            f"{ergebnis['pfad']}: {ergebnis['requests']} Requests, {ergebnis['fehler']} Fehler, "
+            f"{ergebnis['requests_pro_s']:,.1f}/s – p50 {ergebnis['p50_ms']} ms, p95 {ergebnis['p95_ms']} ms, "
+            f"p99 {ergebnis['p99_ms']} ms, max {ergebnis['max_ms']} ms"
+        )
+    return 1 if ergebnis["fehler"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+Last- und Speichertest mit vielen gleichzeitigen Sessions (Streamlit-AppTest).
+
+Simuliert N Azubis, die gleichzeitig mit `Ausbildung.py` arbeiten: Jede Session
+bekommt ein Kürzel und spielt eine typische Eingabefolge ab – Büro (Tätigkeiten
+wählen und ergänzen, Ansicht wechseln, Bundesland ändern) oder Metall (Seite
+wechseln, Beruf und Verfahren wählen, Kontext tippen, Kompakt an, Prompt
+erzeugen, Bibliothek durchsuchen). Alle Sessions bleiben bis zum Schluss offen,
+ihre Schritte laufen zufällig verschränkt (Seed), wie auf einem Server, der die
+Reruns aller Sessions in einem Prozess abarbeitet.
+
+Gemessen werden:
+
+    Rerun-Latenz      p50/p95/p99/max je App und je Schritt
+    Peak RSS          je Prozess
+    Speicher/Session  RSS-Zuwachs nach Aufwärmen ÷ Sessions (inkl. AppTest-Overhead)
+    Session State     Größe von `st.session_state` je Session (rekursiv, p50/max)
+
+AppTest ist nicht threadsicher (eine Test-Runtime je Prozess); für echte
+Gleichzeitigkeit verteilt `--prozesse` die Sessions auf mehrere Prozesse.
+
+    python benchmarks/sessions.py -n 20                       # Tabelle ausgeben
+    python benchmarks/sessions.py -n 40 --prozesse 4 --json   # Bericht als JSON
+    python benchmarks/sessions.py --save                      # Bericht als Baseline speichern
+    python benchmarks/sessions.py --check                     # Exit 1 bei Regression gegenüber der Baseline
+"""
+from collections.abc import Iterator
+from pathlib import Path
+import argparse
+import dataclasses
+import gc
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE = Path(__file__).with_name("sessions_baseline.json")
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Speicher
+# ────────────────────────────────────────────────────────────────────────────────
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+def _peak_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KiB
+
+def groesse(obj, gesehen: set | None = None) -> int:
+    """Rekursive Größe in Bytes (Container, Dataclasses, Objekte mit __dict__); geteilte Objekte einmal."""
+    gesehen = set() if gesehen is None else gesehen
+    if id(obj) in gesehen or isinstance(obj, type):
+        return 0
+    gesehen.add(id(obj))
+    n = sys.getsizeof(obj, 0)
+    if isinstance(obj, dict):
+        n += sum(groesse(k, gesehen) + groesse(v, gesehen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        n += sum(groesse(x, gesehen) for x in obj)
+    elif dataclasses.is_dataclass(obj):
+        n += sum(groesse(getattr(obj, f.name), gesehen) for f in dataclasses.fields(obj))
+    elif hasattr(obj, "__dict__"):
+        n += groesse(vars(obj), gesehen)
+    return n
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Eingabefolgen
+# ────────────────────────────────────────────────────────────────────────────────
+TAETIGKEITEN = ["Eingangspost sortiert", "Rechnungen geprüft", "Termine koordiniert", "Angebot verglichen",
+                "Protokoll geschrieben", "Reisekosten abgerechnet", "Kundenanfrage beantwortet"]
+KONTEXTE = ["Welle Ø40 h6 auf der Drehmaschine fertigen, Rattermarken am Absatz",
+            "Flansch mit Bohrbild 4 × M8, Gewinde schneiden, Maßabweichung am Lochkreis",
+            "Halter aus S235 schweißen, Verzug nach dem Heften, Nahtvorbereitung prüfen"]
+
+def _mehrfach(at, key: str, rnd: random.Random, k: int):
+    ms = at.multiselect(key=key)
+    for wert in rnd.sample(ms.options, min(k, len(ms.options))):
+        ms.select(wert)
+
+def _button(at, text: str):
+    return next(b for b in at.button if text in b.label)
+
+def buero(at, i: int, rnd: random.Random) -> Iterator[tuple[str, object]]:
+    """Büro-Session; liefert (Schritt, vorbereitete AppTest-Aktion) – gemessen wird der Rerun."""
+    yield "start", at
+    yield "kuerzel", at.text_input(key="_entwurf_nutzer").set_value(f"azubi{i:03d}")
+    _mehrfach(at, "task_multi", rnd, 2)
+    yield "auswahl", at
+    yield "freitext", at.text_area(key="task_text").set_value("\n".join(rnd.sample(TAETIGKEITEN, 3)))
+    _mehrfach(at, "skills_multi", rnd, 2)
+    yield "auswahl", at
+    for art in ("arbeitsauftrag", "pruefung"):
+        yield "ansicht", at.radio(key="ansicht").set_value(art)
+    yield "land", at.selectbox(key="land").set_value(rnd.choice(["BY", "BE", "HH", "SN"]))
+
+def metall(at, i: int, rnd: random.Random) -> Iterator[tuple[str, object]]:
+    """Metall-Session: Start auf der Büro-Seite, dann Wechsel und Prompt erzeugen."""
+    yield "start", at
+    yield "kuerzel", at.text_input(key="_entwurf_nutzer").set_value(f"azubi{i:03d}")
+    at.switch_page("Ausbildung_Metall.py")
+    yield "seitenwechsel", at
+    yield "auswahl", at.selectbox(key="beruf").set_value(rnd.choice(at.selectbox(key="beruf").options))
+    _mehrfach(at, "verfahren_ms", rnd, 2)
+    yield "auswahl", at
+    yield "freitext", at.text_area(key="kontext").set_value(rnd.choice(KONTEXTE))
+    yield "kompakt", at.toggle(key="kompakt").set_value(True)
+    yield "erzeugen", _button(at, "Prompt erzeugen").click()
+    yield "bibliothek", at.text_input(key="bib_suche").set_value(rnd.choice(["welle", "gewinde", "verzug"]))
+
+ABLAEUFE = {"buero": buero, "metall": metall}
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Messung (im Kindprozess)
+# ────────────────────────────────────────────────────────────────────────────────
+def _session(app: str, i: int, seed: int):
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(str(ROOT / "Ausbildung.py"), default_timeout=60)
+    return at, ABLAEUFE[app](at, i, random.Random(seed * 1000 + i))
+
+def probe(sessions: list[tuple[str, int]], seed: int) -> dict:
+    """Sessions verschränkt abspielen; Rohdaten für den Bericht."""
+    sys.path.insert(0, str(ROOT))
+    for app in ABLAEUFE:  # Aufwärmen: Importe, Kataloge, Vorlagen, Caches
+        at, schritte = _session(app, 999, seed)
+        for _, aktion in schritte:
+            aktion.run()
+    del at, schritte
+    gc.collect()
+    basis = _rss_mb()
+
+    rnd = random.Random(seed)
+    offen = {i: (app, *_session(app, i, seed)) for app, i in sessions}
+    aktiv = list(offen)
+    laeufe, fehler = [], []
+    while aktiv:
+        i = rnd.choice(aktiv)
+        app, at, schritte = offen[i]
+        try:
+            schritt, aktion = next(schritte)
+        except StopIteration:
+            aktiv.remove(i)
+            continue
+        except Exception as exc:  # Widget fehlt o. ä. – Session abbrechen, im Bericht ausweisen
+            fehler.append(f"{app}#{i}: {type(exc).__name__}: {exc}")
+            aktiv.remove(i)
+            continue
+        t0 = time.perf_counter()
+        aktion.run()
+        laeufe.append((app, schritt, (time.perf_counter() - t0) * 1000))
+        if at.exception:
+            fehler.append(f"{app}#{i} {schritt}: {at.exception[0].message}")
+            aktiv.remove(i)
+
+    gc.collect()
+    state = {app: [] for app in ABLAEUFE}
+    for app, at, _ in offen.values():
+        state[app].append(groesse({k: at.session_state[k] for k in at.session_state.keys()}))
+    return {
+        "laeufe": laeufe, "fehler": fehler, "state_b": state,
+        "rss_zuwachs_mb": _rss_mb() - basis, "peak_mb": _peak_mb(), "sessions": len(offen),
+    }
+
+# ────────────────────────────────────────────────────────────────────────────────
+# Auswertung
+# ────────────────────────────────────────────────────────────────────────────────
+def _verteilung(ms: list[float]) -> dict:
+    ms = sorted(ms)
+    q = lambda p: round(ms[min(len(ms) - 1, int(p * len(ms)))], 1)  # noqa: E731
+    return {"reruns": len(ms), "p50_ms": round(statistics.median(ms), 1), "p95_ms": q(0.95), "p99_ms": q(0.99),
+            "max_ms": round(ms[-1], 1)}
+
+def bericht(teile: list[dict], args) -> dict:
+    laeufe = [x for t in teile for x in t["laeufe"]]
+    apps = {}
+    for app in ABLAEUFE:
+        eigene = [x for x in laeufe if x[0] == app]
+        if not eigene:
+            continue
+        state = [b for t in teile for b in t["state_b"][app]]
+        apps[app] = {
+            **_verteilung([ms for _, _, ms in eigene]),
+            "state_kib_p50": round(statistics.median(state) / 1024, 1),
+            "state_kib_max": round(max(state) / 1024, 1),
+            "schritte": {s: _verteilung([ms for _, x, ms in eigene if x == s]) for s in dict.fromkeys(x for _, x, _ in eigene)},
+        }
+    return {
+        "sessions": args.n, "prozesse": args.prozesse, "seed": args.seed,
+        "gesamt": _verteilung([ms for _, _, ms in laeufe]),
+        "apps": apps,
+        "peak_rss_mb": round(max(t["peak_mb"] for t in teile), 1),
+        "mb_je_session": round(sum(t["rss_zuwachs_mb"] for t in teile) / max(1, sum(t["sessions"] for t in teile)), 2),
+        "fehler": [f for t in teile for f in t["fehler"]],
+    }
+
+def vergleichen(neu: dict, alt: dict, toleranz: float, speicher_toleranz: float) -> list[str]:
+    """Regressionen gegenüber der Baseline: p95 je App, Speicher je Session und Session State."""
+    fehler = [f"Fehler in der Session: {f}" for f in neu["fehler"]]
+    for app, r in neu["apps"].items():
+        a = alt.get("apps", {}).get(app)
+        if a is None:
+            continue
+        if r["p95_ms"] > a["p95_ms"] * (1 + toleranz) and r["p95_ms"] - a["p95_ms"] > 5:
+            fehler.append(f"{app}: p95 {a['p95_ms']} → {r['p95_ms']} ms")
+        if r["state_kib_max"] > a["state_kib_max"] * (1 + speicher_toleranz) + 4:
+            fehler.append(f"{app}: Session State {a['state_kib_max']} → {r['state_kib_max']} KiB")
+    if "mb_je_session" in alt and neu["mb_je_session"] > alt["mb_je_session"] * (1 + speicher_toleranz) + 0.25:
+        fehler.append(f"Speicher je Session {alt['mb_je_session']} → {neu['mb_je_session']} MiB")
+    return fehler
+
+def messen(args) -> dict:
+    apps = list(ABLAEUFE) if args.app == "beide" else [args.app]
+    sessions = [(apps[i % len(apps)], i) for i in range(args.n)]
+    teile = []
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, "AUSBILDUNG_DB": str(Path(tmp) / "sessions.sqlite3"), "AUSBILDUNG_DEBUG": ""}
+        prozesse = [
+            subprocess.Popen(
+                [sys.executable, __file__, "--probe", json.dumps(sessions[k::args.prozesse]), "--seed", str(args.seed)],
+                cwd=tmp, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+            )
+            for k in range(args.prozesse)
+        ]
+        for p in prozesse:
+            out, _ = p.communicate()
+            if p.returncode:
+                raise SystemExit(f"Messprozess mit Exit {p.returncode} beendet")
+            teile.append(json.loads(out.strip().splitlines()[-1]))
+    return bericht(teile, args)
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("-n", type=int, default=20, help="Anzahl gleichzeitiger Sessions")
+    p.add_argument("--app", choices=["beide", *ABLAEUFE], default="beide", help="Eingabefolge der Sessions")
+    p.add_argument("--prozesse", type=int, default=1, help="Sessions auf so viele Prozesse verteilen")
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--save", action="store_true", help=f"Bericht als Baseline speichern ({BASELINE.name})")
+    p.add_argument("--check", action="store_true", help="Gegen Baseline prüfen, Exit 1 bei Regression")
+    p.add_argument("--baseline", type=Path, default=BASELINE)
+    p.add_argument("--tolerance", type=float, default=0.5, help="Erlaubte p95-Verschlechterung (0.5 = +50 %%)")
+    p.add_argument("--mem-tolerance", type=float, default=0.2, help="Erlaubter Zuwachs Speicher je Session")
+    p.add_argument("--json", action="store_true", help="Bericht als JSON auf stdout")
+    p.add_argument("--probe", help=argparse.SUPPRESS)
+    args = p.parse_args(argv)
+
+    if args.probe:
+        print(json.dumps(probe([tuple(s) for s in json.loads(args.probe)], args.seed)))
+        return 0
+
+    r = messen(args)
+    if args.json:
+        print(json.dumps(r, indent=2, ensure_ascii=False))
+    else:
+        print(f"{r['sessions']} Sessions · {r['prozesse']} Prozess(e) · Peak RSS {r['peak_rss_mb']} MiB · "
+              f"≈ {r['mb_je_session']} MiB je Session")
+        print(f"{'App/Schritt':<24}{'Reruns':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'State KiB':>11}")
+        for app, a in r["apps"].items():
+            print(f"{app:<24}{a['reruns']:>8}{a['p50_ms']:>9}{a['p95_ms']:>9}{a['p99_ms']:>9}{a['max_ms']:>9}"
+                  f"{a['state_kib_p50']:>11}")
+            for schritt, s in a["schritte"].items():
+                print(f"  {schritt:<22}{s['reruns']:>8}{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}{s['max_ms']:>9}")
+        for f in r["fehler"]:
+            print(f"FEHLER {f}", file=sys.stderr)
+
+    if args.save:
+        args.baseline.write_text(json.dumps(r, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Baseline gespeichert: {args.baseline}", file=sys.stderr)
+    if args.check:
+        fehler = vergleichen(r, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance, args.mem_tolerance)
+        for f in fehler:
+            print(f"REGRESSION {f}", file=sys.stderr)
+        if fehler:
+            return 1
+        print("Keine Regression gegenüber der Baseline.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Kaltstart-Budget: Importzeit, erster Lauf und Speicher der Multipage-App.
+
+Jeder Fall läuft in einem frischen Python-Prozess (mehrfach, gewertet wird der
+Median) und misst Wandzeit und Resident Set Size (Peak) nach dem Schritt:
+
+    import:kern        Streamlit-freie Module (Engine, Metall, Kataloge, Export)
+    import:streamlit   Streamlit selbst – Untergrenze für jeden Start
+    kaltstart          erster Lauf von `Ausbildung.py` (Startseite Büro) im AppTest
+    seite:metall       erster Wechsel auf die Metall-Seite in derselben Session
+
+Zusätzlich wird geprüft, dass die Startseite die Metall-Module nicht lädt und die
+Kernmodule ohne Streamlit auskommen. Grenzen stehen in `startup_budget.json`.
+
+    python benchmarks/startup.py              # Tabelle ausgeben
+    python benchmarks/startup.py --check      # Exit 1, wenn ein Budget gerissen wird
+"""
+from pathlib import Path
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+BUDGET = Path(__file__).with_name("startup_budget.json")
+FAELLE = ["import:kern", "import:streamlit", "kaltstart", "seite:metall"]
+
+def _rss_mb() -> float:
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)  # Linux: KiB
+
+def probe(fall: str) -> dict:
+    """Läuft im Kindprozess: einen Fall messen, Ergebnis als dict."""
+    sys.path.insert(0, str(ROOT))
+    verstoesse = []
+    if fall == "import:kern":
+        t0 = time.perf_counter()
+        import ausbildung.engine, ausbildung.metall, ausbildung.katalog, ausbildung.export  # noqa: E401, F401
+        ms = (time.perf_counter() - t0) * 1000
+        if "streamlit" in sys.modules:
+            verstoesse.append("Kernmodule importieren Streamlit")
+    elif fall == "import:streamlit":
+        t0 = time.perf_counter()
+        import streamlit  # noqa: F401
+        ms = (time.perf_counter() - t0) * 1000
+    else:
+        from streamlit.testing.v1 import AppTest
+        at = AppTest.from_file(str(ROOT / "Ausbildung.py"), default_timeout=60)
+        t0 = time.perf_counter()
+        at.run()
+        ms = (time.perf_counter() - t0) * 1000
+        if "ausbildung.metall" in sys.modules:
+            verstoesse.append("Startseite lädt ausbildung.metall")
+        if fall == "seite:metall":
+            t0 = time.perf_counter()
+            at.switch_page("Ausbildung_Metall.py").run()
+            ms = (time.perf_counter() - t0) * 1000
+        if at.exception:
+            verstoesse.append(f"Exception: {at.exception[0].message}")
+    return {"ms": round(ms, 1), "rss_mb": _rss_mb(), "verstoesse": verstoesse}
+
+def messen(fall: str, runden: int) -> dict:
+    laeufe = []
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, "AUSBILDUNG_DB": str(Path(tmp) / "startup.sqlite3")}
+        for _ in range(runden):
+            out = subprocess.run(
+                [sys.executable, __file__, "--probe", fall], cwd=tmp, env=env,
+                capture_output=True, text=True, check=True,
+            ).stdout
+            laeufe.append(json.loads(out.strip().splitlines()[-1]))
+    return {
+        "ms": round(statistics.median(r["ms"] for r in laeufe), 1),
+        "rss_mb": round(statistics.median(r["rss_mb"] for r in laeufe), 1),
+        "verstoesse": sorted({v for r in laeufe for v in r["verstoesse"]}),
+    }
+
+def pruefen(ergebnisse: dict, budget: dict) -> list[str]:
+    fehler = []
+    for name, r in ergebnisse.items():
+        fehler += [f"{name}: {v}" for v in r["verstoesse"]]
+        grenze = budget.get(name, {})
+        if "ms" in grenze and r["ms"] > grenze["ms"]:
+            fehler.append(f"{name}: {r['ms']} ms > Budget {grenze['ms']} ms")
+        if "rss_mb" in grenze and r["rss_mb"] > grenze["rss_mb"]:
+            fehler.append(f"{name}: {r['rss_mb']} MiB > Budget {grenze['rss_mb']} MiB")
+    return fehler
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    p.add_argument("--check", action="store_true", help=f"Gegen {BUDGET.name} prüfen, Exit 1 bei Überschreitung")
+    p.add_argument("--budget", type=Path, default=BUDGET)
+    p.add_argument("--runden", type=int, default=3, help="Prozesse je Fall (Median)")
+    p.add_argument("--json", action="store_true", help="Ergebnisse als JSON auf stdout")
+    p.add_argument("--probe", choices=FAELLE, help=argparse.SUPPRESS)
+    args = p.parse_args(argv)
+
+    if args.probe:
+        print(json.dumps(probe(args.probe)))
+        return 0
+
+    ergebnisse = {fall: messen(fall, args.runden) for fall in FAELLE}
+    if args.json:
+        print(json.dumps(ergebnisse, indent=2, ensure_ascii=False))
+    else:
+        budget = json.loads(args.budget.read_text(encoding="utf-8")) if args.budget.exists() else {}
+        print(f"{'Fall':<20}{'ms':>10}{'Budget':>10}{'RSS MiB':>10}{'Budget':>10}")
+        for name, r in ergebnisse.items():
+            b = budget.get(name, {})
+            print(f"{name:<20}{r['ms']:>10.1f}{b.get('ms', '–'):>10}{r['rss_mb']:>10.1f}{b.get('rss_mb', '–'):>10}")
+
+    if args.check:
+        fehler = pruefen(ergebnisse, json.loads(args.budget.read_text(encoding="utf-8")))
+        for f in fehler:
+            print(f"BUDGET {f}", file=sys.stderr)
+        if fehler:
+            return 1
+        print("Kaltstart innerhalb des Budgets.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""Gemeinsame Einstellungen der Tests: Paket ohne Installation importierbar, Ablage in einer Wegwerf-Datenbank."""
+from pathlib import Path
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+# vor dem ersten Import von ausbildung.entwuerfe, sonst landet die Ablage neben dem Code
+os.environ.setdefault("AUSBILDUNG_DB", str(Path(tempfile.mkdtemp(prefix="ausbildung-tests-")) / "test.sqlite3"))
+os.environ.setdefault("AUSBILDUNG_AUTOSAVE_S", "0")
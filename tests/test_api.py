@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""HTTP-API direkt über ASGI aufgerufen – ohne Server."""
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from ausbildung import api
+from ausbildung.api import Api
+
+def _datensatz(i: int) -> dict:
+    return {"id": f"r{i}", "date_from": "2024-09-02", "date_to": "06.09.2024", "lf": [f"LF {i % 13 + 1}"],
+            "taetigkeiten": f"Ablage {i}\n- Post", "tools": ["MS Word"]}
+
+async def _aufruf(app: Api, methode: str, pfad: str, daten=None) -> tuple[int, dict]:
+    body = json.dumps(daten).encode() if daten is not None else b""
+    gesendet = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(msg):
+        gesendet.append(msg)
+
+    await app({"type": "http", "method": methode, "path": pfad, "headers": [(b"accept", b"application/json")]},
+              receive, send)
+    return gesendet[0]["status"], json.loads(gesendet[1]["body"])
+
+def _langsames_paket(paket, arten):
+    time.sleep(0.1)
+    return [{a: e.lf.texte[0] for a in arten} for e in paket]
+
+def test_batch_zaehlt_als_ein_auftrag(monkeypatch):
+    # Ein Platz, ein Worker: Die Pakete eines großen Batchs dürfen sich nicht gegenseitig aussperren
+    monkeypatch.setattr(api, "WARTEZEIT_S", 0.05)
+    monkeypatch.setattr(api, "_buero_paket", _langsames_paket)
+    app = Api(workers=1, queue=1)
+    n = api.PAKET * 4 + 3
+    try:
+        status, antwort = asyncio.run(_aufruf(app, "POST", "/v1/batch",
+                                              {"buero": [_datensatz(i) for i in range(n)], "arten": ["berichtsheft"]}))
+    finally:
+        app.beenden()
+    assert status == 200, antwort
+    assert [e["berichtsheft"] for e in antwort["ergebnisse"]] == [f"LF {i % 13 + 1}" for i in range(n)]
+
+def test_batch_meldet_ungueltige_datensaetze_einzeln():
+    app = Api(workers=0, queue=2)
+    status, antwort = asyncio.run(_aufruf(app, "POST", "/v1/batch",
+                                          {"buero": [_datensatz(1), {"date_from": "morgen"}, [1]], "arten": ["pruefung"]}))
+    assert status == 200
+    ok, falsch, kein_objekt = antwort["ergebnisse"]
+    assert "pruefung" in ok and "fehler" in falsch and kein_objekt["fehler"] == "Datensatz muss ein JSON-Objekt sein"
+
+def test_ohne_worker_bleibt_die_event_loop_frei(monkeypatch):
+    # workers=0 rendert in einem Thread: Ein laufender Auftrag darf /health nicht blockieren
+    gestartet = threading.Event()
+
+    def langsam(e, arten):
+        gestartet.set()
+        time.sleep(0.5)
+        return {a: "" for a in arten}
+
+    monkeypatch.setattr(api, "generate", langsam)
+    app = Api(workers=0, queue=2)
+
+    async def ablauf():
+        auftrag = asyncio.create_task(_aufruf(app, "POST", "/v1/buero", {**_datensatz(99), "arten": ["berichtsheft"]}))
+        while not gestartet.is_set():
+            await asyncio.sleep(0.01)
+        t0 = time.perf_counter()
+        status, _ = await _aufruf(app, "GET", "/health")
+        dauer = time.perf_counter() - t0
+        await auftrag
+        return status, dauer
+
+    status, dauer = asyncio.run(ablauf())
+    assert status == 200 and dauer < 0.25
+
+def test_volle_warteschlange_antwortet_503(monkeypatch):
+    monkeypatch.setattr(api, "WARTEZEIT_S", 0.05)
+    monkeypatch.setattr(api, "generate", lambda e, arten: time.sleep(0.3) or {a: "" for a in arten})
+    app = Api(workers=0, queue=1)
+
+    async def ablauf():
+        return await asyncio.gather(*(_aufruf(app, "POST", "/v1/buero", {**_datensatz(i), "arten": ["pruefung"]})
+                                      for i in range(200, 202)))
+
+    assert sorted(s for s, _ in asyncio.run(ablauf())) == [200, 503]
+
+@pytest.mark.parametrize("pfad, methode, status", [("/health", "POST", 405), ("/v2/x", "POST", 404),
+                                                   ("/v1/buero/unbekannt", "POST", 404)])
+def test_fehlerstatus(pfad, methode, status):
+    assert asyncio.run(_aufruf(Api(workers=0), methode, pfad, {}))[0] == status
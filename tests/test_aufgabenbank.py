@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import random
+
+import pytest
+
+from ausbildung.aufgabenbank import Aufgabenbank, abdeckung, aufgabenbank
+from ausbildung.katalog import katalog
+
+LF, TOOLS, SCHULE = (katalog(k).eintraege for k in ("lernfelder_buero", "tools_buero", "berufsschule_buero"))
+
+def _auswahlen(n: int, seed: int = 1):
+    rnd = random.Random(seed)
+    for _ in range(n):
+        yield dict(lf=rnd.sample(LF, rnd.randint(0, 4)), tools=rnd.sample(TOOLS, rnd.randint(0, 3)),
+                   schule=rnd.sample(SCHULE, rnd.randint(0, 2)), niveaus=rnd.choice([(1,), (2, 3), (1, 2, 3)])), \
+            f"azubi{rnd.randint(0, 99)}", rnd.randint(0, 200_000)
+
+def _synthetisch(n: int = 300) -> Aufgabenbank:
+    rnd = random.Random(7)
+    return Aufgabenbank(
+        (rnd.randint(1, 3), tuple(rnd.sample(LF, 2)), tuple(rnd.sample(TOOLS, 2)), (rnd.choice(SCHULE),), f"Aufgabe {i}")
+        for i in range(n)
+    )
+
+@pytest.mark.parametrize("bank", [aufgabenbank(), _synthetisch()], ids=["mitgeliefert", "synthetisch"])
+def test_jede_folge_eines_durchlaufs_bringt_jede_aufgabe_genau_einmal(bank):
+    for auswahl, azubi, start in _auswahlen(300):
+        passend = len(bank.passend(**auswahl)[1])
+        wochen = max(1, -(-passend // 3))
+        gezogen = [a.id for w in range(start, start + wochen) for a in bank.ziehe(azubi, w, **auswahl)]
+        assert len(gezogen) == len(set(gezogen)) == passend, (auswahl, azubi, start)
+
+def test_aufeinanderfolgende_wochen_ueberschneiden_sich_nicht():
+    bank = aufgabenbank()
+    for auswahl, azubi, woche in _auswahlen(1000, seed=2):
+        if len(bank.passend(**auswahl)[1]) <= 3:  # passt alles in eine Woche, wiederholt sie sich zwangsläufig
+            continue
+        diese, naechste = ({a.nr for a in bank.ziehe(azubi, w, **auswahl)} for w in (woche, woche + 1))
+        assert 2 <= len(diese) <= 3
+        assert not diese & naechste, (auswahl, azubi, woche)
+
+def test_ziehung_ist_reproduzierbar_und_je_azubi_verschieden():
+    bank = aufgabenbank()
+    auswahl = dict(lf=LF, tools=TOOLS, schule=SCHULE, niveaus=(2, 3))
+    assert bank.ziehe("a", 100_000, **auswahl) == bank.ziehe("a", 100_000, **auswahl)
+    assert any(bank.ziehe("a", w, **auswahl) != bank.ziehe("b", w, **auswahl) for w in range(100_000, 100_005))
+
+def test_abdeckung_volle_kataloge():
+    bank = aufgabenbank()
+    auswahl = dict(lf=LF, tools=TOOLS, schule=SCHULE, niveaus=(2, 3))
+    passend = len(bank.passend(**auswahl)[1])
+    abd = abdeckung(bank, "x", range(100_000, 100_000 + -(-passend // 3)), **auswahl)
+    assert abd.verschieden == abd.passend == passend and not abd.wiederholt
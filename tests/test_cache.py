@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+from ausbildung.cache import TextCache, canonical_key
+
+def test_verdraengt_nach_anzahl_den_am_laengsten_ungenutzten():
+    cache = TextCache(max_entries=3)
+    for k in "abc":
+        cache.put(k, k.upper())
+    assert cache.get("a") == "A"  # a ist jetzt zuletzt benutzt
+    cache.put("d", "D")
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in "acd"] == ["A", "C", "D"]
+    assert cache.stats()["evictions"] == 1 and cache.stats()["entries"] == 3
+
+def test_verdraengt_nach_bytes():
+    cache = TextCache(max_entries=100, max_bytes=10)
+    cache.put("a", "äääää")  # 10 Bytes UTF-8
+    cache.put("b", "x")
+    assert cache.get("a") is None and cache.get("b") == "x"
+    assert cache.stats()["bytes"] == 1
+
+def test_zu_grosse_werte_werden_nicht_gecacht():
+    cache = TextCache(max_bytes=4)
+    cache.put("a", "abc")
+    cache.put("a", "abcde")  # ersetzt und verwirft den alten Eintrag
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 0 and cache.stats()["evictions"] == 0
+
+def test_ueberschreiben_zaehlt_bytes_neu():
+    cache = TextCache()
+    cache.put("a", "abc")
+    cache.put("a", ("ab", "c", "de"))
+    assert cache.stats()["bytes"] == 5 and cache.stats()["entries"] == 1
+
+def test_get_or_create_erzeugt_einmal():
+    cache, aufrufe = TextCache(), []
+    for _ in range(3):
+        wert = cache.get_or_create("art", {"b": 2, "a": 1}, lambda: aufrufe.append(1) or "Text")
+    assert wert == "Text" and len(aufrufe) == 1
+    assert cache.stats()["hit_rate"] == round(2 / 3, 3)
+    assert canonical_key("art", {"a": 1, "b": 2}) == canonical_key("art", {"b": 2, "a": 1})
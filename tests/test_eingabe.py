@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""`from_record` für Datensätze aus CLI und API."""
+import pytest
+
+from ausbildung.engine import BueroEingabe
+from ausbildung.metall import MetallEingabe
+
+BUERO = {"date_from": "2024-09-02", "date_to": "2024-09-06"}
+
+def test_listenfelder_als_liste_oder_text():
+    a = BueroEingabe.from_record({**BUERO, "lf": ["LF 1", 2, None], "tools": "MS Word|MS Excel\n- DATEV", "schule": None})
+    assert a.lf.texte == ("LF 1", "2")
+    assert a.tools.texte == ("MS Word", "MS Excel", "DATEV")
+    assert a.schule == ()
+
+@pytest.mark.parametrize("wert, meldung", [
+    ({"LF 1": True}, "muss eine Liste oder Text sein"),
+    (42, "muss eine Liste oder Text sein"),
+    (["LF 1", {"text": "LF 2"}], "Einträge müssen Text sein, nicht dict"),
+    ([["LF 1"]], "Einträge müssen Text sein, nicht list"),
+    ([True], "Einträge müssen Text sein, nicht bool"),
+])
+def test_ungueltige_listenfelder_werden_abgelehnt(wert, meldung):
+    with pytest.raises(ValueError, match=meldung):
+        BueroEingabe.from_record({**BUERO, "lf": wert})
+    with pytest.raises(ValueError, match=meldung):
+        MetallEingabe.from_record({"verfahren": wert})
+
+def test_metall_output_und_didaktik():
+    e = MetallEingabe.from_record({"output": ["Arbeitsplan", None, " "], "didaktik": "Leittext|Projekt"})
+    assert e.output == ("Arbeitsplan",) and e.didaktik == ("Leittext", "Projekt")
+    with pytest.raises(ValueError, match="'output': Einträge müssen Text sein"):
+        MetallEingabe.from_record({"output": [{"a": 1}]})
+    with pytest.raises(ValueError, match="'didaktik' muss eine Liste oder Text sein"):
+        MetallEingabe.from_record({"didaktik": {"Leittext": 1}})
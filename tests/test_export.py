@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import io
+import re
+import zipfile
+
+import pytest
+
+from ausbildung.export import Dokument, als_pdf, zip_datei
+
+def _pdf_zeilen(pdf: bytes) -> list[str]:
+    """Gesetzte Textzeilen aus den (unkomprimierten) Inhaltsströmen."""
+    return [t.replace(rb"\(", b"(").replace(rb"\)", b")").decode("cp1252")
+            for t in re.findall(rb"\((.*?)(?<!\\)\) Tj", pdf)]
+
+@pytest.mark.parametrize("zeichen, ersatz", [("→", "->"), ("≈", "~"), ("⌀", "Ø"), ("≤", "<="), ("−", "-")])
+def test_pdf_ersetzt_zeichen_ohne_winansi_glyphe(zeichen, ersatz):
+    pdf = als_pdf(f"Maße {zeichen}", f"# Welle\n\n- Ø20 H7 {zeichen} 20,000 (Passung)")
+    zeilen = _pdf_zeilen(pdf)
+    assert f"Ø20 H7 {ersatz} 20,000 (Passung)" in zeilen
+    assert "?" not in "".join(zeilen)
+    assert f"/Title (Maße {ersatz})".encode("cp1252") in pdf
+
+def test_pdf_ist_gueltig_aufgebaut():
+    pdf = als_pdf("Titel", "\n".join(f"- Zeile {i}" for i in range(200)))
+    assert pdf.startswith(b"%PDF-1.4") and pdf.endswith(b"%%EOF\n")
+    assert b"/Count 4" in pdf  # 200 Aufzählungspunkte auf vier Seiten
+    xref = int(pdf.rsplit(b"startxref\n", 1)[1].split(b"\n")[0])
+    assert pdf[xref:].startswith(b"xref\n")
+
+def test_zip_datei_liefert_bytes_mit_allen_dateien():
+    daten = zip_datei((Dokument(f"woche_{i}/bericht", "Bericht", "## Tätigkeiten\n- **Post**") for i in range(3)),
+                      ["md", "pdf", "docx"])
+    assert isinstance(daten, bytes)
+    with zipfile.ZipFile(io.BytesIO(daten)) as zf:
+        assert len(zf.namelist()) == 9 and "woche_2/bericht.docx" in zf.namelist()
+        assert zf.testzip() is None
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Wortlaut der Generatoren gegen `daten/generatoren.json`.
+
+Die erwarteten Texte stammen aus der ursprünglichen f-String-Implementierung
+(vor Vorlagen-Engine, Eintraege und Cache) – Umbauten dürfen sie nicht ändern.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from ausbildung.cache import TextCache
+from ausbildung.cli import process_batch
+from ausbildung.engine import BueroEingabe, generate
+from ausbildung.metall import MetallEingabe, build_payload, build_prompt, erzeuge_prompt
+
+DATEN = json.loads((Path(__file__).parent / "daten" / "generatoren.json").read_text(encoding="utf-8"))
+ARTEN = ["berichtsheft", "arbeitsauftrag"]
+
+@pytest.mark.parametrize("fall", DATEN["buero"], ids=lambda f: f["eingabe"]["id"])
+def test_buero_wie_ausgangsstand(fall):
+    e = BueroEingabe.from_record(fall["eingabe"])
+    erwartet = {art: fall[art] for art in ARTEN}
+    assert generate(e, ARTEN) == erwartet
+    assert generate(e, ARTEN) == erwartet  # aus dem Cache
+    assert process_batch([("x", fall["eingabe"])], ARTEN) == [("x", erwartet)]
+
+@pytest.mark.parametrize("fall", DATEN["metall"], ids=lambda f: f["eingabe"]["id"])
+def test_metall_prompt_wie_ausgangsstand(fall):
+    e = MetallEingabe.from_record(fall["eingabe"])
+    assert build_prompt(e, build_payload(e)) == fall["prompt"]
+    cache = TextCache()
+    for _ in range(2):
+        assert erzeuge_prompt(e, cache)[0] == fall["prompt"]
+    assert cache.stats()["hits"] == 1
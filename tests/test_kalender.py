@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+from datetime import date
+
+import pytest
+
+from ausbildung.kalender import (BETRIEB, FEIERTAG, SCHULE, URLAUB, WOCHENENDE, Kalender, feiertage, ostersonntag,
+                                 parse_wochentage, parse_zeitraeume, wochenbeschreibung)
+
+@pytest.mark.parametrize("jahr, ostern", [(1818, date(1818, 3, 22)), (2000, date(2000, 4, 23)),
+                                          (2024, date(2024, 3, 31)), (2025, date(2025, 4, 20)),
+                                          (2038, date(2038, 4, 25))])
+def test_ostersonntag(jahr, ostern):
+    assert ostersonntag(jahr) == ostern
+
+def test_feiertage_nw_und_by_2024():
+    nw, by = feiertage(2024, "NW"), feiertage(2024, "BY")
+    assert len(nw) == 11 and len(by) == 12
+    assert nw[date(2024, 3, 29)] == "Karfreitag" and nw[date(2024, 5, 30)] == "Fronleichnam"
+    assert by[date(2024, 1, 6)] == "Heilige Drei Könige" and date(2024, 1, 6) not in nw
+
+@pytest.mark.parametrize("jahr, land, tag, name", [
+    (2023, "SN", date(2023, 11, 22), "Buß- und Bettag"),
+    (2024, "SN", date(2024, 11, 20), "Buß- und Bettag"),
+    (2017, "NW", date(2017, 10, 31), "Reformationstag (500. Jahrestag)"),
+    (2018, "NI", date(2018, 10, 31), "Reformationstag"),
+    (2019, "BE", date(2019, 3, 8), "Internationaler Frauentag"),
+    (2025, "BE", date(2025, 5, 8), "Tag der Befreiung"),
+    (2024, "TH", date(2024, 9, 20), "Weltkindertag"),
+])
+def test_regionale_feiertage(jahr, land, tag, name):
+    assert feiertage(jahr, land)[tag] == name
+
+@pytest.mark.parametrize("jahr, land, tag", [(2016, "NI", date(2016, 10, 31)), (2018, "BE", date(2018, 3, 8)),
+                                             (2024, "BE", date(2024, 5, 8)), (2024, "BY", date(2024, 8, 15))])
+def test_keine_feiertage(jahr, land, tag):
+    assert tag not in feiertage(jahr, land)
+
+def test_unbekanntes_land():
+    with pytest.raises(ValueError, match="Unbekanntes Bundesland"):
+        feiertage(2024, "XX")
+
+def test_woche_mit_feiertag_und_schultag():
+    kal = Kalender(date(2024, 9, 30), date(2024, 10, 6), land="NW", schultage=(0,))
+    (woche,) = kal.wochen()
+    assert (woche.schluessel, woche.von, woche.bis) == ("2024-W40", date(2024, 9, 30), date(2024, 10, 4))
+    assert [a for _, a in woche.tage] == [SCHULE, BETRIEB, BETRIEB, FEIERTAG, BETRIEB, WOCHENENDE, WOCHENENDE]
+    assert wochenbeschreibung(woche, kal) == "3× Betrieb, 1× Berufsschule, Feiertag: Tag der Deutschen Einheit"
+
+def test_ferien_urlaub_und_feiertag_am_wochenende():
+    kal = Kalender(date(2022, 12, 19), date(2023, 1, 8), land="NW", schultage=parse_wochentage("Mo|Do"),
+                   ferien=parse_zeitraeume("2022-12-21:2023-01-06"), urlaub=parse_zeitraeume("2022-12-27:2022-12-30"))
+    assert kal.art(date(2022, 12, 19)) == SCHULE
+    assert kal.art(date(2022, 12, 22)) == BETRIEB  # Donnerstag in den Ferien
+    assert kal.art(date(2022, 12, 25)) == WOCHENENDE  # 1. Weihnachtstag am Sonntag
+    assert kal.art(date(2022, 12, 26)) == FEIERTAG and kal.art(date(2022, 12, 28)) == URLAUB
+    assert kal.zusammenfassung() == {"Betrieb": 9, "Berufsschule": 1, "Feiertag": 1, "Urlaub": 4, "Wochenende": 6}
+    with pytest.raises(KeyError):
+        kal.art(date(2023, 1, 9))
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""LlmFehler für kaputte oder unerwartete Antworten – gegen einen lokalen Stub-Server."""
+import http.server
+import re
+import threading
+
+import pytest
+
+from ausbildung.llm import Antwort, Client, LlmFehler
+
+class _Stub(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    antworten: list[tuple[int, str, bytes]] = []  # je Anfrage (Status, Content-Type, Body), zyklisch
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        status, typ, body = self.antworten[self.server.zaehler % len(self.antworten)]
+        self.server.zaehler += 1
+        self.send_response(status)
+        self.send_header("Content-Type", typ)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def stub():
+    """stub(antworten) → Client gegen einen Server, der die Antworten der Reihe nach liefert."""
+    server = []
+
+    def starten(*antworten) -> Client:
+        handler = type("Handler", (_Stub,), {"antworten": list(antworten)})
+        srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        srv.zaehler = 0
+        threading.Thread(target=srv.serve_forever, args=(0.01,), daemon=True).start()
+        server.append(srv)
+        return Client(url=f"http://127.0.0.1:{srv.server_address[1]}/v1", timeout=5)
+
+    yield starten
+    for srv in server:
+        srv.shutdown()
+        srv.server_close()
+
+def _json(status: int, body: str) -> tuple[int, str, bytes]:
+    return status, "application/json", body.encode("utf-8")
+
+def _sse(*zeilen: str) -> tuple[int, str, bytes]:
+    return 200, "text/event-stream", "".join(f"{z}\n\n" for z in zeilen).encode("utf-8")
+
+OK = _json(200, '{"choices": [{"message": {"content": "Hallo"}}], "usage": {"prompt_tokens": 3}}')
+
+@pytest.mark.parametrize("body, meldung", [
+    ('{"error": {"message": "model not found"}}', "HTTP 404: model not found"),
+    ('{"error": "model not found"}', "HTTP 404: model not found"),
+    ('{"object": "error", "message": "bad"}', "HTTP 404: bad"),
+    ('{"error": ["liste"]}', 'HTTP 404: {"error": ["liste"]}'),
+    ("<html>Not Found</html>", "HTTP 404: <html>Not Found</html>"),
+])
+def test_fehlerantworten_werden_llmfehler(stub, body, meldung):
+    with pytest.raises(LlmFehler, match=f"^{re.escape(meldung)}$") as info:
+        stub(_json(404, body)).chat("x")
+    assert info.value.status == 404 and not info.value.wiederholbar
+
+@pytest.mark.parametrize("body", ["{}", '{"choices": []}', "[1, 2]", '{"choices": [{"message": null}]}', "42"])
+def test_unerwartete_200_antwort(stub, body):
+    with pytest.raises(LlmFehler, match="^Unerwartete Antwort"):
+        stub(_json(200, body)).chat("x")
+
+def test_keine_json_antwort(stub):
+    with pytest.raises(LlmFehler, match="^Keine JSON-Antwort"):
+        stub((200, "application/json", b"{kaputt")).chat("x")
+
+def test_chat_ok(stub):
+    antwort = stub(OK).chat("x")
+    assert (antwort.text, antwort.tokens_ein, antwort.tokens_aus, antwort.versuche) == ("Hallo", 3, None, 1)
+
+def test_ueberlast_wird_wiederholt(stub, monkeypatch):
+    monkeypatch.setattr("ausbildung.llm.time.sleep", lambda s: None)
+    client = stub(_json(503, '{"error": "busy"}'), OK)  # erst 503, dann Antwort
+    assert client.chat("x", versuche=2).versuche == 2
+    with pytest.raises(LlmFehler, match="^HTTP 503: busy$") as info:
+        client.chat("x", versuche=1)
+    assert info.value.wiederholbar
+
+@pytest.mark.parametrize("kaputt", ['data: {"choices": [', "data: 42"])
+def test_stream_kaputtes_stueck(stub, kaputt):
+    client = stub(_sse('data: {"choices": [{"delta": {"content": "Hallo "}}]}', kaputt, "data: [DONE]"))
+    teile = []
+    with pytest.raises(LlmFehler, match="^Keine JSON-Antwort im Stream"):
+        for t in client.stream("x"):
+            teile.append(t)
+    assert teile == ["Hallo "]
+
+def test_stream_ok(stub):
+    client = stub(_sse(": kommentar", 'data: {"choices": [{"delta": {"content": "Hallo "}}]}',
+                       'data: {"choices": [{"delta": {"content": "Welt"}}]}', "data: [DONE]"))
+    assert "".join(client.stream("x")) == "Hallo Welt"
+
+def test_batch_liefert_fehler_je_prompt(stub):
+    client = stub(OK, _json(400, '{"object": "error", "message": "bad"}'), _json(200, "{}"))
+    ergebnisse = list(client.batch(["a", "b", "c"], parallel=1))
+    assert isinstance(ergebnisse[0], Antwort)
+    assert [str(e) for e in ergebnisse[1:]] == ["HTTP 400: bad", "Unerwartete Antwort: {}"]
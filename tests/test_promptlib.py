@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+
+import pytest
+
+from ausbildung import promptlib
+from ausbildung.promptlib import Promptbibliothek
+
+@pytest.fixture
+def bib(tmp_path):
+    b = Promptbibliothek(str(tmp_path / "prompts.sqlite3"))
+    yield b
+    b.schliessen()
+
+ZEILEN = [
+    json.dumps({"prompt": "Welle drehen", "beruf": "Zerspanungsmechaniker:in", "payload": {"verfahren": ["Drehen"]}}),
+    "",
+    "{kaputt",
+    "[1]",
+    json.dumps({"prompt": 3}),
+    json.dumps({"prompt": "x", "payload": []}),
+    json.dumps({"prompt": "x", "anzahl": "viele"}),
+    json.dumps({"prompt": "x", "anzahl": 0}),
+    json.dumps({"prompt": "Welle drehen"}),
+]
+
+def test_import_meldet_uebersprungene_zeilen_statt_zu_drucken(bib, capsys):
+    stand = bib.importiere(ZEILEN)
+    assert (stand["neu"], stand["vorhanden"], stand["fehler"]) == (1, 1, 6)
+    assert [nr for nr, _ in stand["uebersprungen"]] == [3, 4, 5, 6, 7, 8]
+    assert stand["uebersprungen"][0][1].startswith("kein gültiges JSON")
+    assert stand["uebersprungen"][1][1] == "kein JSON-Objekt (list)"
+    assert capsys.readouterr() == ("", "")
+
+def test_import_begrenzt_die_meldungen(bib, monkeypatch):
+    monkeypatch.setattr(promptlib, "MAX_MELDUNGEN", 2)
+    stand = bib.importiere(["{kaputt"] * 5)
+    assert stand["fehler"] == 5 and len(stand["uebersprungen"]) == 2
+
+def test_cli_zeigt_die_gruende(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(ZEILEN)))
+    assert promptlib.main(["--db", str(tmp_path / "cli.sqlite3"), "import", "-"]) == 1
+    fehler = capsys.readouterr().err
+    assert "Zeile 4: übersprungen – kein JSON-Objekt (list)" in fehler
+    assert fehler.rstrip().endswith("1 neu, 1 bereits vorhanden, 6 Fehler")
+
+def test_export_import_rundreise(bib, tmp_path):
+    bib.importiere(ZEILEN)
+    puffer = io.StringIO()
+    assert bib.exportiere(puffer) == 1
+    ziel = Promptbibliothek(str(tmp_path / "ziel.sqlite3"))
+    try:
+        stand = ziel.importiere(io.StringIO(puffer.getvalue()))
+        assert (stand["neu"], stand["fehler"], stand["uebersprungen"]) == (1, 0, [])
+        assert [t.beruf for t in ziel.suche("welle")] == ["Zerspanungsmechaniker:in"]
+    finally:
+        ziel.schliessen()
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from ausbildung.metall import MetallEingabe, build_payload
+from ausbildung.tokens import kompaktiere, schaetze
+
+TOLERANZEN = "; ".join(f"Ø{d} H7" for d in range(10, 90, 5)) + "; ISO 2768-mK; L 120"
+
+def test_kompaktierung_kuerzt_toleranzen_nicht():
+    e = MetallEingabe(beruf="Industriemechaniker/in", toleranzen=TOLERANZEN, kontext="Lange Beschreibung " * 200,
+                      lernziel="Passungen prüfen " * 100)
+    k = kompaktiere(e, budget=300)
+    assert "Freitexte auf 80 Zeichen gekürzt" in k.schritte
+    assert "Ungültige Toleranzangaben" not in k.prompt
+    for wert in build_payload(e)["toleranzen_aufgeloest"]:
+        assert wert["angabe"] in k.prompt
+
+def test_kompaktierung_hoert_auf_sobald_es_passt():
+    e = MetallEingabe(beruf="Zerspanungsmechaniker/in", toleranzen="Ø20 H7")
+    k = kompaktiere(e, budget=10_000)
+    assert k.schritte == () and k.passt and k.tokens_nachher == schaetze(k.prompt)